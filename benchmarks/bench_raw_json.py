@@ -0,0 +1,99 @@
+"""Compare the model-based and raw-JSON paths used by list_pods.
+
+Builds a synthetic PodList of N items and times, for each path, the work done
+after the HTTP body has arrived: deserializing into V1Pod models and
+summarizing them, versus parsing the JSON and summarizing the dicts directly.
+
+Usage:
+    python benchmarks/bench_raw_json.py [N ...]
+"""
+
+import json
+import sys
+import time
+
+from kubernetes import client
+
+from kubernetes_readonly_mcp.server import _loads, _pod_summary, _pod_summary_raw
+
+
+def _pod(i: int) -> dict:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"web-{i}",
+            "namespace": f"ns-{i % 50}",
+            "uid": f"00000000-0000-0000-0000-{i:012d}",
+            "resourceVersion": str(1000 + i),
+            "creationTimestamp": "2024-05-01T12:00:00Z",
+            "labels": {"app": "web", "pod-template-hash": "5d8f9c7b6"},
+            "ownerReferences": [
+                {
+                    "apiVersion": "apps/v1",
+                    "kind": "ReplicaSet",
+                    "name": "web-5d8f9c7b6",
+                    "uid": "11111111-1111-1111-1111-111111111111",
+                    "controller": True,
+                }
+            ],
+        },
+        "spec": {
+            "nodeName": f"node-{i % 20}",
+            "containers": [
+                {
+                    "name": "app",
+                    "image": "registry.example/web:1.2.3",
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                    "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+                    "env": [{"name": "MODE", "value": "prod"}],
+                },
+                {"name": "sidecar", "image": "registry.example/proxy:0.9"},
+            ],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.0.{i // 250 % 256}.{i % 250}",
+            "conditions": [{"type": "Ready", "status": "True"}],
+            "containerStatuses": [
+                {
+                    "name": "app",
+                    "ready": True,
+                    "restartCount": 0,
+                    "image": "registry.example/web:1.2.3",
+                    "imageID": "sha256:abc",
+                    "state": {"running": {"startedAt": "2024-05-01T12:00:05Z"}},
+                }
+            ],
+        },
+    }
+
+
+def _time(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(count: int) -> None:
+    body = json.dumps({"items": [_pod(i) for i in range(count)], "metadata": {}}).encode()
+    api_client = client.ApiClient()
+
+    def model_path():
+        pods = api_client.deserialize(body.decode(), "V1PodList", "application/json")
+        return [_pod_summary(p) for p in pods.items]
+
+    def raw_path():
+        return [_pod_summary_raw(p) for p in _loads(body)["items"]]
+
+    model_s = _time(model_path)
+    raw_s = _time(raw_path)
+    print(
+        f"{count:>7} pods  {len(body) / 1e6:7.1f} MB  model {model_s:7.2f}s  "
+        f"raw {raw_s:6.2f}s  speedup {model_s / raw_s:5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:] or ["10000", "100000"]:
+        run(int(arg))
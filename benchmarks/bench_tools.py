@@ -0,0 +1,288 @@
+"""Benchmark every tool in server.py against the local fake API server.
+
+For each scale, starts benchmarks/fake_apiserver.py in-process and runs each
+tool case in a fresh Python process pointed at it, so start-up work (client
+creation, discovery) and peak RSS are measured per case. Each case records:
+
+- first_call_s: latency of the first call, including client set-up
+- p50_s / p95_s / min_s: latency of the following calls
+- peak_rss_mb: peak resident memory of the process running the tool
+- response_bytes: size of the tool's result serialized as JSON
+- api_requests / api_bytes: requests and bytes served by the fake API server
+
+Results are written as JSON so runs can be compared between releases.
+
+Usage:
+    python benchmarks/bench_tools.py [--scale 1000 10000 100000] [--repeat 5]
+                                     [--only list_pods ...] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import fake_apiserver
+
+# (case name, tool, kwargs[, options]). Names and namespaces match fake_apiserver's
+# data. Options: "env", extra environment variables for the case's process, and
+# "setup", [tool, kwargs] calls made in it before the measured calls.
+CASES = [
+    ("list_pods", "list_pods", {}),
+    ("list_pods_namespace", "list_pods", {"namespace": "ns-0"}),
+    ("list_pods_paged", "list_pods", {"limit": 500}),
+    ("list_pods_metadata_only", "list_pods", {"metadata_only": True}),
+    ("list_deployments", "list_deployments", {}),
+    ("list_services", "list_services", {}),
+    ("list_namespaces", "list_namespaces", {}),
+    ("list_nodes", "list_nodes", {}),
+    ("get_events", "get_events", {}),
+    ("get_events_paged", "get_events", {"limit": 500}),
+    # The first call lists the events; the others return only the changes since.
+    ("watch_events_since", "watch_events_since", {"cursor": None}),
+    ("get_pod_logs", "get_pod_logs", {"namespace": "ns-0", "pod_name": "pod-0"}),
+    (
+        "get_pod_logs_tail",
+        "get_pod_logs",
+        {"namespace": "ns-0", "pod_name": "pod-0", "tail_lines": 1000},
+    ),
+    (
+        "get_logs_deployment",
+        "get_logs",
+        {"resource_type": "deployment", "namespace": "ns-0", "name": "deploy-0", "tail": 100},
+    ),
+    (
+        "get_logs_grep",
+        "get_logs",
+        {
+            "resource_type": "deployment",
+            "namespace": "ns-0",
+            "name": "deploy-0",
+            "pattern": "ERROR",
+        },
+    ),
+    ("list_resource", "list_resource", {"kind": "Pod"}),
+    (
+        "list_resource_fields",
+        "list_resource",
+        {"kind": "Pod", "fields": ["metadata.name", "status.phase"]},
+    ),
+    (
+        "summarize_resource",
+        "summarize_resource",
+        {"kind": "Pod", "group_by": ["metadata.namespace", "status.phase"]},
+    ),
+    (
+        "get_owned_resources",
+        "get_owned_resources",
+        {"kind": "Deployment", "name": "deploy-0", "namespace": "ns-0"},
+    ),
+    ("get_resource", "get_resource", {"kind": "Pod", "name": "pod-0", "namespace": "ns-0"}),
+    ("list_api_resources", "list_api_resources", {}),
+    ("list_contexts", "list_contexts", {}),
+    ("top_pods", "top_pods", {}),
+    ("top_nodes", "top_nodes", {}),
+    # With the sampler, calls after the first are answered from its last scrape.
+    (
+        "top_pods_sampled",
+        "top_pods",
+        {},
+        {"env": {"KUBERNETES_READONLY_MCP_USAGE_SAMPLER": "1"}},
+    ),
+    ("follow_logs", "follow_logs", {"namespace": "ns-0", "pod_name": "pod-0"}),
+    # Once followed, get_pod_logs is answered from the buffer without API requests.
+    (
+        "get_pod_logs_followed",
+        "get_pod_logs",
+        {"namespace": "ns-0", "pod_name": "pod-0", "tail_lines": 1000},
+        {"setup": [["follow_logs", {"namespace": "ns-0", "pod_name": "pod-0"}]]},
+    ),
+    (
+        "batch_read",
+        "batch_read",
+        {
+            "requests": [
+                {
+                    "tool": "get_resource",
+                    "arguments": {"kind": "Pod", "name": "pod-0", "namespace": "ns-0"},
+                },
+                {"tool": "get_events", "arguments": {"namespace": "ns-0"}},
+                {"tool": "list_services", "arguments": {"namespace": "ns-0"}},
+                {"tool": "get_pod_logs", "arguments": {"namespace": "ns-0", "pod_name": "pod-0"}},
+            ]
+        },
+    ),
+    # The same list with metrics recorded, for the instrumentation overhead, and
+    # server_stats reporting on it.
+    (
+        "list_pods_metrics",
+        "list_pods",
+        {"namespace": "ns-0"},
+        {"env": {"KUBERNETES_READONLY_MCP_METRICS": "1"}},
+    ),
+    (
+        "server_stats",
+        "server_stats",
+        {},
+        {
+            "env": {"KUBERNETES_READONLY_MCP_METRICS": "1"},
+            "setup": [["list_pods", {"namespace": "ns-0"}], ["get_events", {}]],
+        },
+    ),
+]
+
+
+def _peak_rss_mb() -> float:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _shutdown(server):
+    """Close the pooled managers and wait for their background threads to end.
+
+    Reflectors, usage samplers and followed logs run on daemon threads; one
+    still inside a streaming read at interpreter exit can abort the process.
+    """
+    with server._managers_lock:
+        managers = [manager for manager, _ in server._managers.values()]
+        server._managers.clear()
+    for manager in managers:
+        manager.close()
+    for tail in list(server._log_tails.values()):
+        tail.stop()
+    for thread in threading.enumerate():
+        if thread.name in ("k8s-reflector", "k8s-usage", "k8s-log-tail"):
+            thread.join(timeout=10)
+
+
+def run_case(tool_name: str, kwargs: dict, repeat: int, setup=()) -> dict:
+    """Run one case in this process (the child side) and return its measurements."""
+    from kubernetes_readonly_mcp import server
+
+    for setup_tool, setup_kwargs in setup:
+        getattr(server, setup_tool)(**setup_kwargs)
+    # Measure followed logs once their buffers hold the backlog.
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline and not all(
+        tail.describe()["ready"] or tail.stopped for tail in server._log_tails.values()
+    ):
+        time.sleep(0.05)
+    tool = getattr(server, tool_name)
+    start = time.perf_counter()
+    result = tool(**kwargs)
+    first = time.perf_counter() - start
+
+    timings = []
+    for _ in range(repeat):
+        if "cursor" in kwargs and isinstance(result, dict):
+            # Incremental tools resume from the previous call's cursor.
+            kwargs = dict(kwargs, cursor=result.get("cursor"))
+        start = time.perf_counter()
+        result = tool(**kwargs)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    _shutdown(server)
+
+    error = result.get("error") if isinstance(result, dict) else None
+    return {
+        "first_call_s": round(first, 4),
+        "p50_s": round(timings[len(timings) // 2], 4) if timings else None,
+        "p95_s": (
+            round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 4) if timings else None
+        ),
+        "min_s": round(timings[0], 4) if timings else None,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "response_bytes": len(json.dumps(result, default=str).encode()),
+        "error": error,
+    }
+
+
+def _run_child(case, repeat, env) -> dict:
+    name, tool, kwargs, *options = case
+    options = options[0] if options else {}
+    proc = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--child",
+            tool,
+            json.dumps(kwargs),
+            "--setup",
+            json.dumps(options.get("setup", [])),
+            "--repeat",
+            str(repeat),
+        ],
+        env=dict(env, **options.get("env", {})),
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        last = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else None
+        return {"error": last or f"failed ({proc.returncode})"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the server's tools.")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", help="case names to run (default: all)")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--child", nargs=2, metavar=("TOOL", "KWARGS"), help=argparse.SUPPRESS)
+    parser.add_argument("--setup", default="[]", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        tool, kwargs = args.child
+        print(json.dumps(run_case(tool, json.loads(kwargs), args.repeat, json.loads(args.setup))))
+        return
+
+    cases = [c for c in CASES if not args.only or c[0] in args.only]
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scale:
+            fake = fake_apiserver.start(scale)
+            kubeconfig = os.path.join(tmp, f"kubeconfig-{scale}")
+            fake_apiserver.write_kubeconfig(kubeconfig, fake)
+            env = dict(
+                os.environ,
+                KUBECONFIG=kubeconfig,
+                KUBERNETES_READONLY_MCP_DISCOVERY_CACHE_DIR=os.path.join(tmp, f"cache-{scale}"),
+            )
+            for case in cases:
+                fake.reset_stats()
+                result = {"case": case[0], "scale": scale, **_run_child(case, args.repeat, env)}
+                result.update(fake.stats())
+                report["results"].append(result)
+                print(
+                    f"{scale:>7} {case[0]:<26} first {result.get('first_call_s', 0):8.3f}s  "
+                    f"p50 {result.get('p50_s') or 0:8.3f}s  "
+                    f"rss {result.get('peak_rss_mb', 0):7.1f}MB  "
+                    f"out {result.get('response_bytes', 0):>11,}B  "
+                    f"api {result['api_bytes']:>12,}B"
+                    + (f"  ERROR {result['error']}" if result.get("error") else ""),
+                    flush=True,
+                )
+            fake.shutdown()
+            fake.server_close()
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,531 @@
+"""A local stand-in for the Kubernetes API server, for benchmarks.
+
+Serves synthetic Pods, Deployments, ReplicaSets, Services, Events, Nodes and Namespaces,
+their metrics.k8s.io PodMetrics and NodeMetrics, pod logs and the discovery
+documents the dynamic client needs, at a chosen scale. Collection responses
+are serialized once up front so the server is not the bottleneck being
+measured. Supports the subset of the API the tools use:
+namespaced and cluster-wide LISTs, GET by name, equality label selectors,
+limit/continue paging, PartialObjectMetadataList, the pod log endpoint and
+WATCHes. A watch stays open until its timeoutSeconds; on events it streams a
+steady trickle of MODIFIED Events (EVENTS_PER_SECOND), on other kinds nothing.
+A followed log (follow=true) stays open too, adding LOG_LINES_PER_SECOND lines.
+
+It is not a conformant API server: field selectors and anything else not
+listed above are ignored or answered with 404.
+
+Usage:
+    python benchmarks/fake_apiserver.py --scale 10000 --port 8001
+"""
+
+import argparse
+import itertools
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+NAMESPACES = 10
+LOG_LINES = 20000
+# Streamed responses (watches) write every STREAM_INTERVAL seconds.
+STREAM_INTERVAL = 0.1
+EVENTS_PER_SECOND = 100
+LOG_LINES_PER_SECOND = 10
+# Followed logs have no timeoutSeconds; they end after this or when the client leaves.
+FOLLOW_SECONDS = 600
+
+# (group path, kind, plural, namespaced) for everything the server knows.
+KINDS = [
+    ("api/v1", "Pod", "pods", True),
+    ("api/v1", "Service", "services", True),
+    ("api/v1", "Event", "events", True),
+    ("api/v1", "Node", "nodes", False),
+    ("api/v1", "Namespace", "namespaces", False),
+    ("apis/apps/v1", "Deployment", "deployments", True),
+    ("apis/apps/v1", "ReplicaSet", "replicasets", True),
+    ("apis/metrics.k8s.io/v1beta1", "PodMetrics", "pods", True),
+    ("apis/metrics.k8s.io/v1beta1", "NodeMetrics", "nodes", False),
+]
+_API_VERSIONS = {
+    "api/v1": "v1",
+    "apis/apps/v1": "apps/v1",
+    "apis/metrics.k8s.io/v1beta1": "metrics.k8s.io/v1beta1",
+}
+
+
+def _store_key(group_path: str, plural: str) -> str:
+    """Objects are stored per kind: metrics.k8s.io reuses the core plurals."""
+    return f"{plural}.metrics" if group_path.startswith("apis/metrics") else plural
+
+
+_KIND_OF = {
+    _store_key(path, plural): (kind, _API_VERSIONS[path]) for path, kind, plural, _ in KINDS
+}
+_TIMESTAMP = "2024-05-01T12:00:00Z"
+
+
+def _meta(
+    name, namespace=None, resource_version=1, labels=None, owner=None, owner_kind="ReplicaSet"
+):
+    meta = {
+        "name": name,
+        "uid": f"uid-{name}",
+        "resourceVersion": str(resource_version),
+        "creationTimestamp": _TIMESTAMP,
+        "labels": labels or {},
+        "managedFields": [
+            {"manager": "kube-controller-manager", "operation": "Update", "apiVersion": "v1"}
+        ],
+    }
+    if namespace is not None:
+        meta["namespace"] = namespace
+    if owner:
+        meta["ownerReferences"] = [
+            {
+                "apiVersion": "apps/v1",
+                "kind": owner_kind,
+                "name": owner,
+                "uid": f"uid-{owner}",
+                "controller": True,
+            }
+        ]
+    return meta
+
+
+def make_objects(scale: int) -> dict:
+    """Build the synthetic cluster: ``scale`` pods and events, a tenth as many
+    deployments and services, one node per 100 pods."""
+    deployments = max(scale // 10, 1)
+    nodes = max(scale // 100, 1)
+    objects = {_store_key(path, plural): [] for path, _, plural, _ in KINDS}
+
+    for i in range(NAMESPACES):
+        objects["namespaces"].append(
+            {"metadata": _meta(f"ns-{i}"), "spec": {}, "status": {"phase": "Active"}}
+        )
+    for i in range(nodes):
+        objects["nodes"].append(
+            {
+                "metadata": _meta(f"node-{i}", labels={"node-role.kubernetes.io/worker": ""}),
+                "spec": {},
+                "status": {
+                    "conditions": [{"type": "Ready", "status": "True"}],
+                    "addresses": [{"type": "InternalIP", "address": f"10.1.{i // 250}.{i % 250}"}],
+                    "capacity": {"cpu": "16", "memory": "64Gi", "pods": "110"},
+                    "allocatable": {"cpu": "15800m", "memory": "62Gi", "pods": "110"},
+                    "nodeInfo": {
+                        "kubeletVersion": "v1.30.0",
+                        "osImage": "Linux",
+                        "containerRuntimeVersion": "containerd://1.7.0",
+                        "architecture": "amd64",
+                        "bootID": "",
+                        "kernelVersion": "6.1.0",
+                        "kubeProxyVersion": "v1.30.0",
+                        "machineID": "",
+                        "operatingSystem": "linux",
+                        "systemUUID": "",
+                    },
+                },
+            }
+        )
+        objects["nodes.metrics"].append(
+            {
+                "metadata": _meta(f"node-{i}"),
+                "timestamp": _TIMESTAMP,
+                "window": "20s",
+                "usage": {"cpu": f"{i * 7919 % 15000 + 200}m", "memory": f"{i * 53 % 60 + 2}Gi"},
+            }
+        )
+    for i in range(deployments):
+        namespace = f"ns-{i % NAMESPACES}"
+        labels = {"app": f"app-{i}"}
+        objects["deployments"].append(
+            {
+                "metadata": _meta(f"deploy-{i}", namespace, labels=labels),
+                "spec": {
+                    "replicas": 10,
+                    "selector": {"matchLabels": labels},
+                    "template": {
+                        "metadata": {"labels": labels},
+                        "spec": {"containers": [{"name": "app", "image": "web:1.0"}]},
+                    },
+                },
+                "status": {"replicas": 10, "availableReplicas": 10},
+            }
+        )
+        objects["replicasets"].append(
+            {
+                "metadata": _meta(
+                    f"deploy-{i}-5d8f9c7b6",
+                    namespace,
+                    labels=dict(labels, **{"pod-template-hash": "5d8f9c7b6"}),
+                    owner=f"deploy-{i}",
+                    owner_kind="Deployment",
+                ),
+                "spec": {"replicas": 10, "selector": {"matchLabels": labels}},
+                "status": {"replicas": 10, "readyReplicas": 10},
+            }
+        )
+        objects["services"].append(
+            {
+                "metadata": _meta(f"svc-{i}", namespace, labels=labels),
+                "spec": {
+                    "type": "ClusterIP",
+                    "clusterIP": f"10.96.{i // 250 % 256}.{i % 250}",
+                    "selector": labels,
+                    "ports": [{"name": "http", "port": 80, "targetPort": 8080, "protocol": "TCP"}],
+                },
+            }
+        )
+    for i in range(scale):
+        # Pods are spread over deployments the same way the deployments are
+        # spread over namespaces, so each deployment's pods share its namespace.
+        owner = i % deployments
+        namespace = f"ns-{owner % NAMESPACES}"
+        objects["pods"].append(
+            {
+                "metadata": _meta(
+                    f"pod-{i}",
+                    namespace,
+                    resource_version=1000 + i,
+                    labels={"app": f"app-{owner}", "pod-template-hash": "5d8f9c7b6"},
+                    owner=f"deploy-{owner}-5d8f9c7b6",
+                ),
+                "spec": {
+                    "nodeName": f"node-{i % nodes}",
+                    "containers": [
+                        {
+                            "name": "app",
+                            "image": "registry.example/web:1.2.3",
+                            "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                            "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+                            "env": [{"name": "MODE", "value": "prod"}],
+                        },
+                        {"name": "sidecar", "image": "registry.example/proxy:0.9"},
+                    ],
+                },
+                "status": {
+                    "phase": "Running",
+                    "podIP": f"10.0.{i // 250 % 256}.{i % 250}",
+                    "conditions": [{"type": "Ready", "status": "True"}],
+                },
+            }
+        )
+        objects["pods.metrics"].append(
+            {
+                "metadata": _meta(f"pod-{i}", namespace),
+                "timestamp": _TIMESTAMP,
+                "window": "20s",
+                "containers": [
+                    {
+                        "name": "app",
+                        "usage": {"cpu": f"{i * 7919 % 900 + 10}m", "memory": f"{i % 512 + 64}Mi"},
+                    },
+                    {"name": "sidecar", "usage": {"cpu": "5m", "memory": "16Mi"}},
+                ],
+            }
+        )
+        objects["events"].append(
+            {
+                "metadata": _meta(f"pod-{i}.17a", namespace),
+                "involvedObject": {"kind": "Pod", "name": f"pod-{i}", "namespace": namespace},
+                "reason": "Pulled",
+                "message": "Container image already present on machine",
+                "type": "Normal",
+                "count": 1,
+                "firstTimestamp": _TIMESTAMP,
+                "lastTimestamp": _TIMESTAMP,
+                "source": {"component": "kubelet", "host": f"node-{i % nodes}"},
+            }
+        )
+    return objects
+
+
+def _discovery(group_path: str) -> dict:
+    resources = []
+    for path, kind, plural, namespaced in KINDS:
+        if path != group_path:
+            continue
+        resources.append(
+            {
+                "name": plural,
+                "singularName": kind.lower(),
+                "kind": kind,
+                "namespaced": namespaced,
+                # metrics-server serves no watches.
+                "verbs": ["get", "list"] if "metrics" in path else ["get", "list", "watch"],
+            }
+        )
+        if path == "api/v1" and plural == "pods":
+            resources.append(
+                {"name": "pods/log", "kind": "Pod", "namespaced": True, "verbs": ["get"]}
+            )
+    return {
+        "kind": "APIResourceList",
+        "groupVersion": _API_VERSIONS[group_path],
+        "resources": resources,
+    }
+
+
+_DOCUMENTS = {
+    "/version": {"major": "1", "minor": "30", "gitVersion": "v1.30.0-fake", "platform": "fake"},
+    "/api": {"kind": "APIVersions", "versions": ["v1"]},
+    "/apis": {
+        "kind": "APIGroupList",
+        "groups": [
+            {
+                "name": "apps",
+                "versions": [{"groupVersion": "apps/v1", "version": "v1"}],
+                "preferredVersion": {"groupVersion": "apps/v1", "version": "v1"},
+            },
+            {
+                "name": "metrics.k8s.io",
+                "versions": [{"groupVersion": "metrics.k8s.io/v1beta1", "version": "v1beta1"}],
+                "preferredVersion": {
+                    "groupVersion": "metrics.k8s.io/v1beta1",
+                    "version": "v1beta1",
+                },
+            },
+        ],
+    },
+    "/api/v1": _discovery("api/v1"),
+    "/apis/apps/v1": _discovery("apis/apps/v1"),
+    "/apis/metrics.k8s.io/v1beta1": _discovery("apis/metrics.k8s.io/v1beta1"),
+}
+
+_ROUTE = re.compile(
+    r"^/(?P<group>api/v1|apis/apps/v1|apis/metrics\.k8s\.io/v1beta1)"
+    r"(?:/namespaces/(?P<namespace>[^/]+))?"
+    r"/(?P<plural>[a-z]+)"
+    r"(?:/(?P<name>[^/]+))?"
+    r"(?P<log>/log)?$"
+)
+
+
+class FakeApiServer(ThreadingHTTPServer):
+    """The HTTP server plus its object store and byte counters."""
+
+    daemon_threads = True
+
+    def __init__(self, address, scale: int):
+        super().__init__(address, _Handler)
+        self.objects = make_objects(scale)
+        self.by_name = {
+            key: {(o["metadata"].get("namespace"), o["metadata"]["name"]): o for o in items}
+            for key, items in self.objects.items()
+        }
+        # Pre-serialized unfiltered LIST bodies: (store key, namespace) -> bytes.
+        self.bodies = {}
+        for key, items in self.objects.items():
+            kind = _KIND_OF[key][0]
+            groups = {None: items}
+            for item in items:
+                namespace = item["metadata"].get("namespace")
+                if namespace:
+                    groups.setdefault(namespace, []).append(item)
+            for namespace, group in groups.items():
+                self.bodies[(key, namespace)] = _list_body(kind, group)
+        self.log = "".join(
+            (
+                f"2024-05-01T12:00:{i % 60:02d}Z INFO request {i} served in {i % 97}ms\n"
+                if i % 1000
+                else f"2024-05-01T12:00:{i % 60:02d}Z ERROR request {i} failed: timeout\n"
+            )
+            for i in range(LOG_LINES)
+        ).encode()
+        self.lock = threading.Lock()
+        # resourceVersions after the LISTs' "100000", handed out to watch events.
+        self.versions = itertools.count(100001)
+        self.reset_stats()
+
+    def next_event(self) -> bytes:
+        """One MODIFIED watch event line for an Event, with a new resourceVersion."""
+        version = next(self.versions)
+        events = self.objects["events"]
+        obj = events[version % len(events)]
+        metadata = dict(obj["metadata"], resourceVersion=str(version))
+        event = {"type": "MODIFIED", "object": dict(obj, kind="Event", metadata=metadata)}
+        return json.dumps(event).encode() + b"\n"
+
+    def reset_stats(self):
+        with self.lock:
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {"api_requests": self.requests, "api_bytes": self.bytes_sent}
+
+
+def _list_body(kind: str, items: list, continue_token: str = "", remaining=None) -> bytes:
+    metadata = {"resourceVersion": "100000", "continue": continue_token}
+    if remaining:
+        metadata["remainingItemCount"] = remaining
+    return json.dumps(
+        {"kind": f"{kind}List", "apiVersion": "v1", "metadata": metadata, "items": items}
+    ).encode()
+
+
+def _matches(item: dict, selector: str) -> bool:
+    labels = item["metadata"].get("labels") or {}
+    for term in filter(None, selector.split(",")):
+        key, _, value = term.partition("=")
+        if labels.get(key.strip()) != value.lstrip("=").strip():
+            return False
+    return True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this Nagle's algorithm
+    # adds a delayed-ACK round trip (~40 ms) to every keep-alive request.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        path = url.path.rstrip("/")
+
+        if path in _DOCUMENTS:
+            return self._send(json.dumps(_DOCUMENTS[path]).encode())
+
+        match = _ROUTE.match(path)
+        key = _store_key(match["group"], match["plural"]) if match else None
+        if key not in self.server.objects:
+            return self._send(b'{"kind":"Status","code":404}', status=404)
+        namespace, name = match["namespace"], match["name"]
+
+        if name:
+            obj = self.server.by_name[key].get((namespace, name))
+            if obj is None or (match["log"] and key != "pods"):
+                return self._send(b'{"kind":"Status","code":404}', status=404)
+            if match["log"]:
+                return self._send_log(query)
+            kind, api_version = _KIND_OF[key]
+            return self._send(json.dumps({"kind": kind, "apiVersion": api_version, **obj}).encode())
+
+        if query.get("watch") in ("true", "1"):
+            per_tick = max(int(EVENTS_PER_SECOND * STREAM_INTERVAL), 1)
+
+            def next_chunk():
+                if key != "events":
+                    return b""
+                return b"".join(self.server.next_event() for _ in range(per_tick))
+
+            return self._stream(b"", next_chunk, float(query.get("timeoutSeconds") or 60))
+
+        kind = _KIND_OF[key][0]
+        selector = query.get("labelSelector")
+        limit = int(query.get("limit") or 0)
+        metadata_only = "as=PartialObjectMetadataList" in (self.headers.get("Accept") or "")
+        if not (selector or limit or metadata_only):
+            return self._send(self.server.bodies.get((key, namespace), _list_body(kind, [])))
+
+        items = self.server.objects[key]
+        if namespace:
+            items = [o for o in items if o["metadata"].get("namespace") == namespace]
+        if selector:
+            items = [o for o in items if _matches(o, selector)]
+        start = int(query.get("continue") or 0)
+        end = start + limit if limit else len(items)
+        page = items[start:end]
+        next_token = str(end) if end < len(items) else ""
+        if metadata_only:
+            kind = "PartialObjectMetadata"
+            page = [{"metadata": o["metadata"]} for o in page]
+        return self._send(_list_body(kind, page, next_token, len(items) - end))
+
+    def _send_log(self, query):
+        body = self.server.log
+        tail = query.get("tailLines")
+        if tail:
+            body = b"".join(body.splitlines(keepends=True)[-int(tail) :])
+        if query.get("follow") in ("true", "1"):
+            per_tick = max(int(LOG_LINES_PER_SECOND * STREAM_INTERVAL), 1)
+            lines = itertools.count(LOG_LINES)
+
+            def next_chunk():
+                return b"".join(
+                    f"2024-05-01T12:01:00Z INFO request {next(lines)} served in 1ms\n".encode()
+                    for _ in range(per_tick)
+                )
+
+            return self._stream(body, next_chunk, FOLLOW_SECONDS, content_type="text/plain")
+        limit = query.get("limitBytes")
+        if limit:
+            body = body[: int(limit)]
+        self._send(body, content_type="text/plain")
+
+    def _stream(self, first: bytes, next_chunk, timeout: float, content_type="application/json"):
+        """Send ``first``, then ``next_chunk()`` every STREAM_INTERVAL, chunked, until
+        ``timeout`` seconds have passed or the client hangs up."""
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        with self.server.lock:
+            self.server.requests += 1
+        deadline = time.monotonic() + timeout
+        chunk = first
+        try:
+            while True:
+                if chunk:
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    self.wfile.flush()
+                    with self.server.lock:
+                        self.server.bytes_sent += len(chunk)
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(STREAM_INTERVAL)
+                chunk = next_chunk()
+            self.wfile.write(b"0\r\n\r\n")
+        except OSError:
+            pass  # The client went away.
+        self.close_connection = True
+
+    def _send(self, body: bytes, status: int = 200, content_type: str = "application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.bytes_sent += len(body)
+
+
+def start(scale: int, port: int = 0) -> FakeApiServer:
+    """Build the cluster and serve it from a background thread."""
+    server = FakeApiServer(("127.0.0.1", port), scale)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def write_kubeconfig(path: str, server: FakeApiServer) -> None:
+    """Write a kubeconfig whose current context points at ``server``."""
+    host, port = server.server_address[:2]
+    kubeconfig = {
+        "apiVersion": "v1",
+        "kind": "Config",
+        "clusters": [{"name": "fake", "cluster": {"server": f"http://{host}:{port}"}}],
+        "users": [{"name": "fake", "user": {"token": "fake"}}],
+        "contexts": [{"name": "fake", "context": {"cluster": "fake", "user": "fake"}}],
+        "current-context": "fake",
+    }
+    with open(path, "w") as f:
+        json.dump(kubeconfig, f)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1000)
+    parser.add_argument("--port", type=int, default=8001)
+    args = parser.parse_args()
+    fake = FakeApiServer(("127.0.0.1", args.port), args.scale)
+    print(f"Serving {args.scale} pods on http://127.0.0.1:{args.port}")
+    fake.serve_forever()
@@ -0,0 +1,723 @@
+"""Asyncio variant of the read-only Kubernetes MCP server.
+
+Implements the core read tools of ``server.py`` as coroutines on the
+asyncio-native ``kubernetes_asyncio`` client, so one process can keep hundreds
+of reads in flight on a single event loop instead of parking a worker thread
+per blocking call. Select it at startup with ``kubernetes-readonly-mcp --async``
+(requires the ``async`` extra). It covers those tools with the baseline
+response shapes plus paging and bounded log reads; options the synchronous
+server added since (``context``, ``fields``, ``metadata_only``, response budget
+summaries, log ``pattern``) are not implemented here.
+"""
+
+import asyncio
+import re
+from typing import Optional
+
+from fastmcp import FastMCP
+
+from kubernetes_readonly_mcp.server import (
+    _LOG_CHUNK_BYTES,
+    _OWNED_KINDS,
+    _OWNER_KINDS,
+    LOG_CONCURRENCY,
+    LOG_DEADLINE_SECONDS,
+    LOG_MAX_BYTES,
+    LOG_POD_TIMEOUT_SECONDS,
+    POOL_MAXSIZE,
+    RESPONSE_MAX_BYTES,
+    _deployment_summary,
+    _event_summary,
+    _listable_api_resources,
+    _LogBudget,
+    _namespace_summary,
+    _node_summary,
+    _owner_kind,
+    _page,
+    _pod_summary,
+    _ro,
+    _sanitize,
+    _service_summary,
+)
+
+try:
+    from kubernetes_asyncio import client, config, dynamic
+    from kubernetes_asyncio.client.rest import RESTResponse
+    from kubernetes_asyncio.dynamic.resource import ResourceList
+except ImportError:  # Optional dependency: only needed when --async is selected.
+    client = config = dynamic = RESTResponse = ResourceList = None
+
+# MCP server exposing the async implementations under the same tool names.
+mcp = FastMCP("kubernetes-readonly-mcp")
+
+
+class AsyncKubernetesManager:
+    """Manages the asyncio Kubernetes API clients (read-only use).
+
+    All typed APIs and the dynamic client share one ApiClient, i.e. one aiohttp
+    session and connection pool. Build instances with ``await create()``.
+    """
+
+    def __init__(self, api_client, dynamic_api):
+        """Wrap an already configured ApiClient and awaited DynamicClient."""
+        self.api_client = api_client
+        self.core_api = client.CoreV1Api(api_client)
+        self.apps_api = client.AppsV1Api(api_client)
+        self.batch_api = client.BatchV1Api(api_client)
+        self.networking_api = client.NetworkingV1Api(api_client)
+        self.dynamic_api = dynamic_api
+
+    @classmethod
+    async def create(cls) -> "AsyncKubernetesManager":
+        """Load kubeconfig (or in-cluster config) and build the clients."""
+        if client is None:
+            raise ImportError(
+                "The async server requires kubernetes_asyncio: "
+                "pip install 'kubernetes-readonly-mcp[async]'"
+            )
+        configuration = client.Configuration()
+        configuration.connection_pool_maxsize = POOL_MAXSIZE
+        try:
+            # Try to load from kubeconfig.
+            await config.load_kube_config(client_configuration=configuration)
+        except Exception:
+            # Fall back to in-cluster config if running in a pod.
+            config.load_incluster_config(client_configuration=configuration)
+        api_client = client.ApiClient(configuration)
+        return cls(api_client, await dynamic.DynamicClient(api_client))
+
+    def get_core_api(self):
+        """Get the CoreV1Api client."""
+        return self.core_api
+
+    def get_apps_api(self):
+        """Get the AppsV1Api client."""
+        return self.apps_api
+
+    def get_batch_api(self):
+        """Get the BatchV1Api client."""
+        return self.batch_api
+
+    def get_networking_api(self):
+        """Get the NetworkingV1Api client."""
+        return self.networking_api
+
+    def get_dynamic_api(self):
+        """Get the dynamic client."""
+        return self.dynamic_api
+
+
+# Lazy module-level singleton, created on first tool use inside the event loop.
+_manager = None
+_manager_lock = asyncio.Lock()
+
+
+async def _get_manager() -> AsyncKubernetesManager:
+    """Return the shared AsyncKubernetesManager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        async with _manager_lock:
+            if _manager is None:
+                _manager = await AsyncKubernetesManager.create()
+    return _manager
+
+
+def _is_not_found(error: Exception) -> bool:
+    """True for an API error with HTTP status 404."""
+    return getattr(error, "status", None) == 404
+
+
+async def _read_pod_log(core, limit_bytes=None, **kwargs) -> tuple:
+    """
+    Stream one container's log, stopping once the byte budget is reached.
+
+    The async counterpart of ``server._read_pod_log``: the body is read in
+    chunks rather than loaded whole, and one byte past the budget is requested
+    so a log that was cut short can be told apart from one that fit exactly.
+
+    Returns:
+        A (text, bytes_read, truncated) tuple.
+    """
+    budget = min(limit_bytes, LOG_MAX_BYTES) if limit_bytes else LOG_MAX_BYTES
+    resp = await core.read_namespaced_pod_log(
+        limit_bytes=budget + 1, _preload_content=False, **kwargs
+    )
+    chunks = []
+    size = 0
+    truncated = False
+    try:
+        if not 200 <= resp.status <= 299:
+            # Unlike a preloaded read, a streamed one is not checked by the client.
+            raise client.exceptions.ApiException(http_resp=RESTResponse(resp, await resp.read()))
+        async for chunk in resp.content.iter_chunked(_LOG_CHUNK_BYTES):
+            if size + len(chunk) > budget:
+                chunks.append(chunk[: budget - size])
+                size = budget
+                truncated = True
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+    finally:
+        if truncated:
+            # Drop the connection rather than return one with unread data to the pool.
+            resp.close()
+        else:
+            resp.release()
+    return b"".join(chunks).decode("utf-8", errors="replace"), size, truncated
+
+
+@mcp.tool(
+    description="List all pods in a namespace or across all namespaces",
+    annotations=_ro("List Pods"),
+)
+async def list_pods(
+    namespace: Optional[str] = None,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+):
+    """
+    List all pods in a specified namespace or across all namespaces if none is specified.
+
+    Args:
+        namespace (str, optional): The Kubernetes namespace to list pods from.
+                                  If not provided, pods from all namespaces will be listed.
+        limit (int, optional): Maximum number of pods to return in one page.
+        continue_token (str, optional): Cursor returned by a previous paged call.
+
+    Returns:
+        A list of pod dicts, or a page dict when limit or continue_token is given.
+    """
+    try:
+        core = (await _get_manager()).get_core_api()
+        if namespace:
+            ret = await core.list_namespaced_pod(
+                namespace=namespace, limit=limit, _continue=continue_token
+            )
+        else:
+            ret = await core.list_pod_for_all_namespaces(limit=limit, _continue=continue_token)
+        pods = [_pod_summary(i) for i in ret.items]
+        if limit is not None or continue_token is not None:
+            return _page(pods, ret.metadata._continue, ret.metadata.remaining_item_count)
+        return pods
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(
+    description="List all deployments in a specified namespace",
+    annotations=_ro("List Deployments"),
+)
+async def list_deployments(namespace: Optional[str] = None):
+    """
+    List all deployments in a specified namespace or across all namespaces if none is specified.
+
+    Args:
+        namespace (str, optional): The Kubernetes namespace to list deployments from.
+                                  If not provided, deployments from all namespaces will be listed.
+
+    Returns:
+        A list of deployment dicts including name, namespace, replicas, available_replicas,
+        labels, and selector.
+    """
+    try:
+        apps = (await _get_manager()).get_apps_api()
+        if namespace:
+            ret = await apps.list_namespaced_deployment(namespace=namespace)
+        else:
+            ret = await apps.list_deployment_for_all_namespaces()
+        return [_deployment_summary(item) for item in ret.items]
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(
+    description="Get logs from a pod in a specified namespace",
+    annotations=_ro("Get Pod Logs"),
+)
+async def get_pod_logs(
+    namespace: str,
+    pod_name: str,
+    container: Optional[str] = None,
+    tail_lines: Optional[int] = None,
+    previous: bool = False,
+    limit_bytes: Optional[int] = None,
+):
+    """
+    Get logs from a pod in a specified namespace.
+
+    Args:
+        namespace (str): The Kubernetes namespace where the pod is located.
+        pod_name (str): The name of the pod to get logs from.
+        container (str, optional): The container name; defaults to the first container.
+        tail_lines (int, optional): Number of lines to show from the end of the logs.
+        previous (bool, optional): If true, return logs from a previous instantiation of the
+                                  container. Default is False.
+        limit_bytes (int, optional): Maximum number of log bytes to return. Capped by the
+                                    server-wide limit (1 MiB by default).
+
+    Returns:
+        A dict containing the pod logs and metadata. "truncated" is true when the
+        log was cut at the byte limit, and "bytes_read" is the number of bytes kept.
+    """
+    try:
+        core = (await _get_manager()).get_core_api()
+        pod_info = await core.read_namespaced_pod(name=pod_name, namespace=namespace)
+        container_names = [c.name for c in pod_info.spec.containers]
+        if not container and container_names:
+            container = container_names[0]
+
+        logs, bytes_read, truncated = await _read_pod_log(
+            core,
+            limit_bytes,
+            name=pod_name,
+            namespace=namespace,
+            container=container,
+            tail_lines=tail_lines,
+            previous=previous,
+        )
+        return {
+            "pod_name": pod_name,
+            "namespace": namespace,
+            "container": container,
+            "logs": logs.split("\n"),
+            "container_names": container_names,
+            "status": pod_info.status.phase,
+            "truncated": truncated,
+            "bytes_read": bytes_read,
+        }
+    except Exception as e:
+        if _is_not_found(e):
+            return {"error": f"Pod {pod_name} not found in namespace {namespace}"}
+        return {"error": f"Error retrieving logs: {str(e)}"}
+
+
+@mcp.tool(
+    description="List all services in a namespace or across all namespaces",
+    annotations=_ro("List Services"),
+)
+async def list_services(namespace: Optional[str] = None):
+    """
+    List all services in a specified namespace or across all namespaces if none is specified.
+
+    Args:
+        namespace (str, optional): The Kubernetes namespace to list services from.
+                                  If not provided, services from all namespaces will be listed.
+
+    Returns:
+        A list of service dicts including name, namespace, type, cluster_ip, external_ips,
+        ports, and selector.
+    """
+    try:
+        core = (await _get_manager()).get_core_api()
+        if namespace:
+            ret = await core.list_namespaced_service(namespace=namespace)
+        else:
+            ret = await core.list_service_for_all_namespaces()
+        return [_service_summary(item) for item in ret.items]
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(
+    description="List all namespaces in the cluster",
+    annotations=_ro("List Namespaces"),
+)
+async def list_namespaces():
+    """
+    List all namespaces in the Kubernetes cluster.
+
+    Returns:
+        A list of namespace dicts including name, status, and creation_timestamp.
+    """
+    try:
+        ret = await (await _get_manager()).get_core_api().list_namespace()
+        return [_namespace_summary(item) for item in ret.items]
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(
+    description="Get Kubernetes events from the cluster for a specific namespace or all namespaces",
+    annotations=_ro("Get Events"),
+)
+async def get_events(
+    namespace: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+):
+    """
+    Get Kubernetes events from the cluster for a specific namespace or all namespaces.
+
+    Args:
+        namespace (str, optional): The Kubernetes namespace to get events from.
+        field_selector (str, optional): Selector to restrict the returned events by field.
+        limit (int, optional): Maximum number of events to return in one page.
+        continue_token (str, optional): Cursor returned by a previous paged call.
+
+    Returns:
+        A dict containing the requested namespace, field_selector, a list of events, and
+        "continue_token" / "remaining_item_count" for fetching the next page.
+    """
+    try:
+        core = (await _get_manager()).get_core_api()
+        if namespace:
+            events = await core.list_namespaced_event(
+                namespace=namespace,
+                field_selector=field_selector,
+                limit=limit,
+                _continue=continue_token,
+            )
+        else:
+            events = await core.list_event_for_all_namespaces(
+                field_selector=field_selector, limit=limit, _continue=continue_token
+            )
+        return {
+            "namespace": namespace,
+            "field_selector": field_selector,
+            "events": [_event_summary(event) for event in events.items],
+            "continue_token": events.metadata._continue or None,
+            "remaining_item_count": events.metadata.remaining_item_count,
+        }
+    except Exception as e:
+        return {"error": f"Error retrieving events: {str(e)}"}
+
+
+async def _owned_pods(manager, namespace, kind, name) -> list:
+    """Resolve a workload's pods through ownerReferences, as the sync get_logs does.
+
+    Each level (e.g. Deployment -> ReplicaSet -> Pod) is one namespaced LIST,
+    keeping the objects that reference an owner found on the level above, so
+    matchExpressions and pods of other workloads sharing labels never matter.
+    """
+    owners = {(kind, name)}
+    owned_kind = _OWNER_KINDS[kind][1][0]
+    while True:
+        _, accessor, method = _OWNED_KINDS[owned_kind]
+        listed = await getattr(getattr(manager, accessor)(), method)(namespace=namespace)
+        owned = [
+            obj
+            for obj in listed.items
+            if any((ref.kind, ref.name) in owners for ref in obj.metadata.owner_references or [])
+        ]
+        if owned_kind == "Pod" or owned_kind not in _OWNER_KINDS:
+            return owned
+        owners = {(owned_kind, obj.metadata.name) for obj in owned}
+        owned_kind = _OWNER_KINDS[owned_kind][1][0]
+
+
+async def _resolve_pods(manager, resource_type, namespace, name, label_selector):
+    """Resolve get_logs arguments to (pods, label_selector) or an error dict."""
+    core = manager.get_core_api()
+    owner_kind = _owner_kind(resource_type)
+    if resource_type.lower() == "pod" and name:
+        try:
+            return [await core.read_namespaced_pod(name=name, namespace=namespace)], label_selector
+        except Exception as e:
+            if _is_not_found(e):
+                return {"error": f"Pod {name} not found in namespace {namespace}"}, None
+            raise
+    if owner_kind and name:
+        # Read the workload first so a missing one is told apart from one without pods.
+        if _OWNER_KINDS[owner_kind][0] == "apps/v1":
+            api = manager.get_apps_api()
+        else:
+            api = manager.get_batch_api()
+        snake_kind = re.sub(r"(?<!^)(?=[A-Z])", "_", owner_kind).lower()
+        try:
+            await getattr(api, f"read_namespaced_{snake_kind}")(name=name, namespace=namespace)
+        except Exception as e:
+            if _is_not_found(e):
+                return {"error": f"{owner_kind} {name} not found in namespace {namespace}"}, None
+            raise
+        return await _owned_pods(manager, namespace, owner_kind, name), label_selector
+    if label_selector:
+        if namespace:
+            pods = await core.list_namespaced_pod(
+                namespace=namespace, label_selector=label_selector
+            )
+        else:
+            pods = await core.list_pod_for_all_namespaces(label_selector=label_selector)
+        return pods.items, label_selector
+    return {
+        "error": f"Unsupported resource type: {resource_type} or missing required parameters"
+    }, None
+
+
+@mcp.tool(
+    description="Get logs from pods, deployments, jobs, or resources matching a label selector",
+    annotations=_ro("Get Logs"),
+)
+async def get_logs(
+    resource_type: str,
+    namespace: Optional[str] = None,
+    name: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    container: Optional[str] = None,
+    tail: Optional[int] = None,
+    since_seconds: Optional[int] = None,
+    timestamps: bool = False,
+    max_concurrency: Optional[int] = None,
+    pod_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    limit_bytes: Optional[int] = None,
+    max_response_bytes: Optional[int] = None,
+):
+    """
+    Get logs from pods, deployments, jobs, or resources matching a label selector.
+
+    Pod logs are read concurrently on the event loop, at most max_concurrency at
+    a time. Pods not read within the deadline get an "error" entry while the
+    rest are still returned, in the order the pods were resolved. The log lines
+    of all pods together are capped by the response budget.
+
+    Args:
+        resource_type (str): Type of resource to get logs from ('pod', 'deployment', 'job', etc.)
+        namespace (str, optional): The Kubernetes namespace ('default' when name is given).
+        name (str, optional): The name of the specific resource to get logs from.
+        label_selector (str, optional): Label selector; required if name is not provided.
+        container (str, optional): The container name; defaults to each pod's first container.
+        tail (int, optional): Number of lines to show from the end of the logs.
+        since_seconds (int, optional): Return logs newer than a relative duration in seconds.
+        timestamps (bool, optional): Include timestamps at the beginning of each line.
+        max_concurrency (int, optional): Maximum number of pods read in parallel.
+        pod_timeout (float, optional): Timeout in seconds for each pod's log request.
+        deadline (float, optional): Overall time budget in seconds for all pods.
+        limit_bytes (int, optional): Maximum number of log bytes returned per pod. Capped
+                                    by the server-wide limit (1 MiB by default).
+        max_response_bytes (int, optional): Budget, in bytes of log lines, for all pods
+                                           together. Defaults to the server-wide
+                                           response budget (1 MiB); 0 disables it.
+
+    Returns:
+        A dict containing the logs and metadata. Each entry reports "truncated"
+        and "bytes_read"; when the response budget cut any logs, the dict also
+        has "truncated": True and a "message".
+    """
+    try:
+        if not name and not label_selector:
+            return {"error": "Either name or label_selector must be provided"}
+        if name and not namespace:
+            namespace = "default"
+
+        manager = await _get_manager()
+        pods, label_selector = await _resolve_pods(
+            manager, resource_type, namespace, name, label_selector
+        )
+        if isinstance(pods, dict):
+            return pods
+        if not pods:
+            return {"error": "No pods found matching the specified criteria"}
+
+        core = manager.get_core_api()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or LOG_CONCURRENCY))
+        request_timeout = pod_timeout or LOG_POD_TIMEOUT_SECONDS
+        total_deadline = deadline or LOG_DEADLINE_SECONDS
+        max_bytes = RESPONSE_MAX_BYTES if max_response_bytes is None else max_response_bytes
+        budget = _LogBudget(max_bytes) if max_bytes > 0 else None
+        cap = min(limit_bytes, LOG_MAX_BYTES) if limit_bytes else LOG_MAX_BYTES
+
+        async def read_logs(pod):
+            container_names = [c.name for c in pod.spec.containers]
+            container_to_use = container or (container_names[0] if container_names else None)
+            try:
+                async with semaphore:
+                    # Read no more than the response budget has left.
+                    read_limit = cap if budget is None else max(min(cap, budget.remaining), 1)
+                    logs, bytes_read, truncated = await asyncio.wait_for(
+                        _read_pod_log(
+                            core,
+                            read_limit,
+                            name=pod.metadata.name,
+                            namespace=pod.metadata.namespace,
+                            container=container_to_use,
+                            tail_lines=tail,
+                            timestamps=timestamps,
+                            since_seconds=since_seconds,
+                        ),
+                        request_timeout,
+                    )
+                lines = logs.split("\n")
+                if budget is not None:
+                    if truncated and read_limit < cap:
+                        budget.exhausted = True
+                    kept = budget.take(lines)
+                    truncated = truncated or len(kept) < len(lines)
+                    lines = kept
+                return {
+                    "pod_name": pod.metadata.name,
+                    "namespace": pod.metadata.namespace,
+                    "container": container_to_use,
+                    "logs": lines,
+                    "container_names": container_names,
+                    "status": pod.status.phase,
+                    "truncated": truncated,
+                    "bytes_read": bytes_read,
+                }
+            except Exception as e:
+                return {
+                    "pod_name": pod.metadata.name,
+                    "namespace": pod.metadata.namespace,
+                    "error": str(e) or type(e).__name__,
+                }
+
+        tasks = [asyncio.ensure_future(read_logs(pod)) for pod in pods]
+        await asyncio.wait(tasks, timeout=total_deadline)
+        results = []
+        for task, pod in zip(tasks, pods):
+            if task.done():
+                results.append(task.result())
+            else:
+                task.cancel()
+                results.append(
+                    {
+                        "pod_name": pod.metadata.name,
+                        "namespace": pod.metadata.namespace,
+                        "error": f"Timed out: logs not retrieved within {total_deadline}s deadline",
+                    }
+                )
+
+        response = {
+            "resource_type": resource_type,
+            "name": name,
+            "namespace": namespace,
+            "label_selector": label_selector,
+            "results": results,
+        }
+        if budget is not None and budget.exhausted:
+            response["truncated"] = True
+            response["message"] = (
+                f"Logs were cut to fit the {max_bytes}-byte response budget. Narrow the "
+                "query (tail, since_seconds, container) or read fewer pods at a time."
+            )
+        return response
+    except Exception as e:
+        return {"error": f"Error retrieving logs: {str(e)}"}
+
+
+@mcp.tool(
+    description="List all nodes in the cluster",
+    annotations=_ro("List Nodes"),
+)
+async def list_nodes():
+    """
+    Lists all nodes in the Kubernetes cluster, providing detailed information for each.
+
+    Returns:
+        A list of node dicts, or a dict with an "error" key on failure.
+    """
+    try:
+        ret = await (await _get_manager()).get_core_api().list_node()
+        return [_node_summary(item) for item in ret.items]
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(
+    description=(
+        "List resources of any kind (including CRDs) via the dynamic client. "
+        "GET/LIST only; never mutates."
+    ),
+    annotations=_ro("List Resource"),
+)
+async def list_resource(
+    kind: str,
+    api_version: str = "v1",
+    namespace: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+):
+    """
+    List resources of an arbitrary kind using the dynamic client.
+
+    Secret values are always redacted (see server._sanitize).
+
+    Args:
+        kind (str): Resource kind, e.g. 'Pod', 'Ingress', 'MyCustomResource'.
+        api_version (str, optional): Group/version, e.g. 'v1' (default) or 'apps/v1'.
+        namespace (str, optional): Namespace to scope to; all namespaces if omitted.
+        label_selector (str, optional): Label selector, e.g. 'app=nginx'.
+        field_selector (str, optional): Field selector, e.g. 'metadata.name=foo'.
+        limit (int, optional): Maximum number of objects to return in one page.
+        continue_token (str, optional): Cursor returned by a previous paged call.
+
+    Returns:
+        A list of sanitized resource dicts, a page dict when paging, or a dict
+        with an "error" key.
+    """
+    try:
+        dyn = (await _get_manager()).get_dynamic_api()
+        api = await dyn.resources.get(api_version=api_version, kind=kind)
+        res = await dyn.get(
+            api,
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            limit=limit,
+            _continue=continue_token,
+        )
+        items = [_sanitize(item.to_dict(), kind) for item in res.items]
+        if limit is not None or continue_token is not None:
+            metadata = res.metadata
+            return _page(items, metadata["continue"], metadata["remainingItemCount"])
+        return items
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(
+    description=(
+        "Get a single resource of any kind (including CRDs) by name via the "
+        "dynamic client. GET only; never mutates."
+    ),
+    annotations=_ro("Get Resource"),
+)
+async def get_resource(
+    kind: str,
+    name: str,
+    api_version: str = "v1",
+    namespace: Optional[str] = None,
+):
+    """
+    Get a single resource of an arbitrary kind by name using the dynamic client.
+
+    Args:
+        kind (str): Resource kind, e.g. 'Pod', 'ConfigMap', 'MyCustomResource'.
+        name (str): The resource name.
+        api_version (str, optional): Group/version, e.g. 'v1' (default) or 'apps/v1'.
+        namespace (str, optional): Namespace for namespaced resources.
+
+    Returns:
+        A sanitized resource dict, or a dict with an "error" key.
+    """
+    try:
+        dyn = (await _get_manager()).get_dynamic_api()
+        api = await dyn.resources.get(api_version=api_version, kind=kind)
+        res = await dyn.get(api, name=name, namespace=namespace)
+        return _sanitize(res.to_dict(), kind)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(
+    description=(
+        "Discover which resource kinds (including CRDs) the cluster exposes "
+        "and can be listed. Read-only discovery."
+    ),
+    annotations=_ro("List API Resources"),
+)
+async def list_api_resources():
+    """
+    Discover the listable resource kinds available on the cluster.
+
+    Returns:
+        A list of dicts with group_version, kind, namespaced, and verbs, or a
+        dict with an "error" key.
+    """
+    try:
+        dyn = (await _get_manager()).get_dynamic_api()
+        return _listable_api_resources(await dyn.resources.search(), ResourceList)
+    except Exception as e:
+        return {"error": str(e)}
@@ -0,0 +1,254 @@
+"""Optional per-tool metrics and tracing for the read-only Kubernetes MCP server.
+
+Enabled with ``KUBERNETES_READONLY_MCP_METRICS=1``. When disabled, ``instrumented``
+returns each tool function unchanged and API clients are left alone, so there is
+no per-call overhead at all.
+
+When enabled, every tool call records its latency (as a histogram), the number
+of Kubernetes API requests it made, the bytes received from the API server, the
+size of its JSON result and its errors by type. If ``opentelemetry-api`` is
+installed, each tool call is also a span, with one child span per API request.
+The numbers are available from the ``server_stats`` tool and, when serving
+over HTTP, as Prometheus text on ``/metrics``.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+
+try:
+    from opentelemetry import trace as _trace
+except ImportError:  # Optional dependency: spans are skipped without it.
+    _trace = None
+
+ENABLED = os.environ.get("KUBERNETES_READONLY_MCP_METRICS", "").strip().lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+
+# Upper bounds (seconds) of the latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+_PREFIX = "kubernetes_readonly_mcp"
+_tracer = _trace.get_tracer(__name__) if _trace is not None else None
+
+# The tool call in progress on this thread (or context), if any.
+_current_call = contextvars.ContextVar("kubernetes_readonly_mcp_tool_call", default=None)
+
+
+class _ToolCall:
+    """API activity of one tool call, possibly spread over worker threads."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.api_requests = 0
+        self.responses = []
+        self.errors = Counter()
+
+    def api_bytes(self) -> int:
+        # urllib3 counts the bytes pulled off the wire, streamed or preloaded.
+        return sum(getattr(resp, "tell", lambda: 0)() for resp in self.responses)
+
+
+class _ToolStats:
+    """Aggregated metrics of one tool."""
+
+    def __init__(self):
+        self.calls = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.errors = Counter()
+        self.api_requests = 0
+        self.api_bytes = 0
+        self.response_bytes = 0
+
+    def as_dict(self) -> dict:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), self.buckets):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            "calls": self.calls,
+            "errors": dict(self.errors),
+            "latency_seconds": {
+                "avg": self.latency_sum / self.calls if self.calls else None,
+                "max": self.latency_max,
+                "sum": self.latency_sum,
+                "buckets": buckets,
+            },
+            "api_requests": self.api_requests,
+            "api_bytes": self.api_bytes,
+            "response_bytes": self.response_bytes,
+        }
+
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _record(name: str, elapsed: float, call: _ToolCall, result, error_type=None):
+    if error_type is None and isinstance(result, dict) and "error" in result:
+        error_type = "error_result"
+    try:
+        response_bytes = len(json.dumps(result, default=str)) if result is not None else 0
+    except (TypeError, ValueError):
+        response_bytes = 0
+    with call.lock:
+        api_requests, api_bytes, errors = call.api_requests, call.api_bytes(), call.errors
+    with _stats_lock:
+        stats = _stats.setdefault(name, _ToolStats())
+        stats.calls += 1
+        stats.buckets[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        stats.latency_sum += elapsed
+        stats.latency_max = max(stats.latency_max, elapsed)
+        stats.errors.update(errors)
+        if error_type:
+            stats.errors[error_type] += 1
+        stats.api_requests += api_requests
+        stats.api_bytes += api_bytes
+        stats.response_bytes += response_bytes
+
+
+def wrap(func):
+    """Wrap a tool function so each call is measured (and traced, with OpenTelemetry)."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        call = _ToolCall()
+        token = _current_call.set(call)
+        span = _tracer.start_as_current_span(f"tool {name}") if _tracer else None
+        start = time.perf_counter()
+        result = None
+        try:
+            if span is None:
+                result = func(*args, **kwargs)
+            else:
+                with span:
+                    result = func(*args, **kwargs)
+        except Exception as e:
+            _record(name, time.perf_counter() - start, call, None, type(e).__name__)
+            raise
+        finally:
+            _current_call.reset(token)
+        _record(name, time.perf_counter() - start, call, result)
+        return result
+
+    return wrapper
+
+
+def instrumented(func):
+    """Tool decorator: ``wrap`` when metrics are enabled, otherwise the function itself."""
+    return wrap(func) if ENABLED else func
+
+
+def instrument_api_client(api_client):
+    """Count (and trace) every request an ApiClient makes on behalf of a tool call."""
+    rest_client = api_client.rest_client
+    request = rest_client.request
+
+    @functools.wraps(request)
+    def traced_request(method, url, *args, **kwargs):
+        call = _current_call.get()
+        if call is None:
+            # Not inside a tool call, e.g. a watch-cache reflector thread.
+            return request(method, url, *args, **kwargs)
+        span = _tracer.start_as_current_span(f"k8s {method}") if _tracer else None
+        try:
+            if span is None:
+                resp = request(method, url, *args, **kwargs)
+            else:
+                with span as current:
+                    current.set_attribute("http.request.method", method)
+                    current.set_attribute("url.full", url.split("?", 1)[0])
+                    resp = request(method, url, *args, **kwargs)
+                    current.set_attribute("http.response.status_code", resp.status)
+        except Exception as e:
+            status = getattr(e, "status", None)
+            with call.lock:
+                call.api_requests += 1
+                call.errors[f"{type(e).__name__}:{status}" if status else type(e).__name__] += 1
+            raise
+        with call.lock:
+            call.api_requests += 1
+            call.responses.append(getattr(resp, "response", resp))
+            if resp.status >= 400:
+                # The generated client raises for these only after this returns.
+                call.errors[f"ApiException:{resp.status}"] += 1
+        return resp
+
+    rest_client.request = traced_request
+    return api_client
+
+
+def context_runner():
+    """Return a callable that runs a function in a copy of the caller's context.
+
+    Worker threads do not inherit contextvars; submitting through this keeps
+    their API requests attributed to (and traced under) the calling tool.
+    """
+    return contextvars.copy_context().run
+
+
+def snapshot() -> dict:
+    """Return the collected metrics per tool."""
+    with _stats_lock:
+        return {name: stats.as_dict() for name, stats in sorted(_stats.items())}
+
+
+def reset():
+    """Forget everything collected so far."""
+    with _stats_lock:
+        _stats.clear()
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def render_prometheus() -> str:
+    """Render the collected metrics in the Prometheus text exposition format."""
+    tools = snapshot()
+    lines = [
+        f"# HELP {_PREFIX}_tool_duration_seconds Tool call latency.",
+        f"# TYPE {_PREFIX}_tool_duration_seconds histogram",
+    ]
+    for name, stats in tools.items():
+        latency = stats["latency_seconds"]
+        for bound, count in latency["buckets"].items():
+            lines.append(
+                f"{_PREFIX}_tool_duration_seconds_bucket{_labels(tool=name, le=bound)} {count}"
+            )
+        lines.append(f"{_PREFIX}_tool_duration_seconds_sum{_labels(tool=name)} {latency['sum']}")
+        lines.append(f"{_PREFIX}_tool_duration_seconds_count{_labels(tool=name)} {stats['calls']}")
+
+    counters = [
+        ("tool_errors_total", "Tool errors by type.", None),
+        ("api_requests_total", "Kubernetes API requests made by tools.", "api_requests"),
+        ("api_received_bytes_total", "Bytes received from the API server.", "api_bytes"),
+        ("tool_response_bytes_total", "Size of tool results as JSON.", "response_bytes"),
+    ]
+    for metric, help_text, key in counters:
+        lines.append(f"# HELP {_PREFIX}_{metric} {help_text}")
+        lines.append(f"# TYPE {_PREFIX}_{metric} counter")
+        for name, stats in tools.items():
+            if key is None:
+                for error_type, count in sorted(stats["errors"].items()):
+                    labels = _labels(tool=name, type=error_type)
+                    lines.append(f"{_PREFIX}_{metric}{labels} {count}")
+            else:
+                lines.append(f"{_PREFIX}_{metric}{_labels(tool=name)} {stats[key]}")
+    return "\n".join(lines) + "\n"
@@ -5,17 +5,126 @@ clusters with no risk of mutation. Every tool is annotated read-only and
 returns native Python objects (FastMCP emits structured content + schemas).
 """
 
+import argparse
+import contextvars
+import functools
+import hashlib
+import importlib
+import inspect
+import itertools
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from array import array
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
 from typing import Optional
 
 from fastmcp import FastMCP
-from kubernetes import client, config, dynamic
-from kubernetes.dynamic.resource import ResourceList
 from mcp.types import ToolAnnotations
 
+from kubernetes_readonly_mcp import metrics, snapshot
+
+try:
+    # Optional: orjson parses large LIST bodies several times faster.
+    from orjson import dumps as _dumps
+    from orjson import loads as _loads
+except ImportError:
+    from json import dumps as _dumps
+    from json import loads as _loads
+
+logger = logging.getLogger(__name__)
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Importing the kubernetes package loads the whole generated client, none of
+    which is needed to start the server and advertise its tools; the first
+    tool call (which creates a KubernetesManager) pays for it instead.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self._name), attr)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
+
+
+client = _LazyModule("kubernetes.client")
+config = _LazyModule("kubernetes.config")
+dynamic = _LazyModule("kubernetes.dynamic")
+watch = _LazyModule("kubernetes.watch")
+_resource = _LazyModule("kubernetes.dynamic.resource")
+_dynamic_exceptions = _LazyModule("kubernetes.dynamic.exceptions")
+_utils = _LazyModule("kubernetes.utils")
+
 # Create an MCP server for read-only operations against a Kubernetes cluster.
 mcp = FastMCP("kubernetes-readonly-mcp")
 
 
+def _read_json(resp):
+    """Parse a raw (``_preload_content=False``) API response and release its connection."""
+    try:
+        return _loads(resp.data)
+    finally:
+        resp.release_conn()
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    """Read a boolean setting from the environment ('1', 'true', 'yes', 'on')."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back on bad input."""
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def _env_kind_ints(name: str, defaults: dict) -> dict:
+    """Read "Kind=number,..." overrides of ``defaults`` from the environment."""
+    values = dict(defaults)
+    for override in os.environ.get(name, "").split(","):
+        kind, _, number = override.partition("=")
+        if kind.strip() and number.strip().isdigit():
+            values[kind.strip()] = int(number)
+    return values
+
+
+# Serve the typed list tools from an in-memory LIST+WATCH mirror. Off by default
+# so a short-lived stdio session does not hold open watch connections.
+WATCH_CACHE_ENABLED = _env_flag("KUBERNETES_READONLY_MCP_WATCH_CACHE")
+# Server-side timeout for each WATCH request; the reflector re-watches from the
+# last seen resourceVersion when it expires.
+WATCH_TIMEOUT_SECONDS = _env_int("KUBERNETES_READONLY_MCP_WATCH_TIMEOUT", 300)
+
+
+# HTTP connection pool of each cluster's ApiClient. Size it for the log fan-out
+# plus the long-lived watch connections, or urllib3 discards the extra sockets
+# ("Connection pool is full") and every request pays a new TLS handshake.
+POOL_MAXSIZE = _env_int("KUBERNETES_READONLY_MCP_POOL_MAXSIZE", 32)
+# TCP keepalive on API server connections so idle watches and pooled sockets
+# are not silently dropped by proxies and load balancers.
+TCP_KEEPALIVE = _env_flag("KUBERNETES_READONLY_MCP_TCP_KEEPALIVE", True)
+TCP_KEEPALIVE_IDLE = _env_int("KUBERNETES_READONLY_MCP_TCP_KEEPALIVE_IDLE", 30)
+TCP_KEEPALIVE_INTERVAL = _env_int("KUBERNETES_READONLY_MCP_TCP_KEEPALIVE_INTERVAL", 15)
+TCP_KEEPALIVE_COUNT = _env_int("KUBERNETES_READONLY_MCP_TCP_KEEPALIVE_COUNT", 9)
+
+
 def _ro(title: str) -> ToolAnnotations:
     """Build the read-only annotation set shared by every tool."""
     return ToolAnnotations(
@@ -27,25 +136,842 @@ def _ro(title: str) -> ToolAnnotations:
     )
 
 
-class KubernetesManager:
-    """Manages Kubernetes API client connections (read-only use)."""
+# Share one execution between identical tool calls that overlap in time (see
+# _coalesced). On by default; it only ever merges calls already in flight.
+COALESCE_ENABLED = _env_flag("KUBERNETES_READONLY_MCP_COALESCE", True)
+
+_in_flight = {}  # (tool, normalized arguments) -> Future of the running call
+_in_flight_lock = threading.Lock()
+_coalesced_calls = Counter()  # tool -> calls answered by another call's result
+
+
+def _coalesce_key(func, signature, args, kwargs):
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return func.__name__, json.dumps(bound.arguments, sort_keys=True, default=str)
+
+
+def _coalesced(func):
+    """
+    Tool decorator: identical concurrent calls share one execution (singleflight).
+
+    The first call with a given tool name and arguments (defaults filled in, so
+    list_pods() and list_pods(namespace=None) match) runs; calls with the same
+    key that arrive while it is running wait for it and get the same result or
+    exception, so a stampede of identical questions costs the API server one
+    request. Nothing is cached: the next call after it finishes runs again.
+    """
+    if not COALESCE_ENABLED:
+        return func
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = _coalesce_key(func, signature, args, kwargs)
+        except TypeError:
+            # Let the call itself report bad arguments.
+            return func(*args, **kwargs)
+        with _in_flight_lock:
+            future = _in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = _in_flight[key] = Future()
+            else:
+                _coalesced_calls[func.__name__] += 1
+        if not leader:
+            return future.result()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _in_flight_lock:
+                del _in_flight[key]
+
+    return wrapper
+
+
+# Defaults for the get_logs fan-out: pods read in parallel, per-pod request
+# timeout and overall deadline (seconds). Each can be overridden per call.
+LOG_CONCURRENCY = _env_int("KUBERNETES_READONLY_MCP_LOG_CONCURRENCY", 10)
+LOG_POD_TIMEOUT_SECONDS = _env_int("KUBERNETES_READONLY_MCP_LOG_POD_TIMEOUT", 30)
+LOG_DEADLINE_SECONDS = _env_int("KUBERNETES_READONLY_MCP_LOG_DEADLINE", 120)
+# Budget, in bytes of JSON, for the result of an unpaged list tool. Larger
+# results are cut to a first page plus counts (see _apply_budget). 0 disables it.
+RESPONSE_MAX_BYTES = _env_int("KUBERNETES_READONLY_MCP_RESPONSE_MAX_BYTES", 1024 * 1024)
+# Number of groups kept per summary field; the rest are folded into "<other>".
+_SUMMARY_TOP_GROUPS = 50
+# Upper bound on the log bytes read per container; a per-call limit_bytes can
+# only lower it.
+LOG_MAX_BYTES = _env_int("KUBERNETES_READONLY_MCP_LOG_MAX_BYTES", 1024 * 1024)
+# Size of each read from a streamed log body.
+_LOG_CHUNK_BYTES = 64 * 1024
+# follow_logs: bytes buffered per container, lines read back when a stream
+# (re)starts, seconds a buffer may go unread before it is dropped, and the most
+# logs followed at once per server (each holds a pooled API connection).
+FOLLOW_MAX_BYTES = _env_int("KUBERNETES_READONLY_MCP_FOLLOW_MAX_BYTES", 1024 * 1024)
+FOLLOW_INITIAL_LINES = _env_int("KUBERNETES_READONLY_MCP_FOLLOW_INITIAL_LINES", 5000)
+FOLLOW_IDLE_SECONDS = _env_int("KUBERNETES_READONLY_MCP_FOLLOW_IDLE_TIMEOUT", 600)
+FOLLOW_MAX_STREAMS = _env_int("KUBERNETES_READONLY_MCP_FOLLOW_MAX_STREAMS", 8)
+# A followed log is served once its initial read has gone quiet this long (or
+# filled up), so a backlog that is still arriving is never taken for the log.
+_FOLLOW_SETTLE_SECONDS = 0.5
+# batch_read: default calls run at once, default deadline for the whole batch
+# (seconds), and the most calls one batch may hold.
+BATCH_CONCURRENCY = _env_int("KUBERNETES_READONLY_MCP_BATCH_CONCURRENCY", 10)
+BATCH_DEADLINE_SECONDS = _env_int("KUBERNETES_READONLY_MCP_BATCH_DEADLINE", 60)
+BATCH_MAX_REQUESTS = 50
+# Event changes watch_events_since keeps per cluster; an older cursor relists.
+EVENT_BUFFER_SIZE = _env_int("KUBERNETES_READONLY_MCP_EVENT_BUFFER", 10000)
+# Background sampling of metrics.k8s.io for top_pods/top_nodes. Off by default
+# (it scrapes every interval for as long as the cluster's client is open); when
+# on, USAGE_SAMPLES samples are kept per pod and node, e.g. 240 x 15s = 1 hour.
+USAGE_SAMPLER_ENABLED = _env_flag("KUBERNETES_READONLY_MCP_USAGE_SAMPLER")
+USAGE_SAMPLE_INTERVAL = _env_int("KUBERNETES_READONLY_MCP_USAGE_SAMPLE_INTERVAL", 15)
+USAGE_SAMPLES = _env_int("KUBERNETES_READONLY_MCP_USAGE_SAMPLES", 240)
+# Response cache of get_resource and list_resource, per cluster. Off by default:
+# a hit can be as old as its kind's TTL (seconds). RESPONSE_CACHE_TTLS holds
+# per-kind overrides as "Kind=seconds,..."; 0 never caches a kind.
+RESPONSE_CACHE_ENABLED = _env_flag("KUBERNETES_READONLY_MCP_RESPONSE_CACHE")
+RESPONSE_CACHE_MAX_BYTES = _env_int("KUBERNETES_READONLY_MCP_RESPONSE_CACHE_MAX_BYTES", 64 << 20)
+RESPONSE_CACHE_TTL_SECONDS = _env_int("KUBERNETES_READONLY_MCP_RESPONSE_CACHE_TTL", 30)
+RESPONSE_CACHE_KIND_TTLS = _env_kind_ints(
+    "KUBERNETES_READONLY_MCP_RESPONSE_CACHE_TTLS",
+    {"Pod": 5, "Endpoints": 5, "EndpointSlice": 5, "Event": 0, "Lease": 0},
+)
+
+# Where API discovery results are persisted between processes, and for how
+# long (seconds) a cached discovery document is trusted. 0 disables reuse.
+DISCOVERY_CACHE_DIR = os.environ.get(
+    "KUBERNETES_READONLY_MCP_DISCOVERY_CACHE_DIR",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+        "kubernetes-readonly-mcp",
+    ),
+)
+DISCOVERY_CACHE_TTL_SECONDS = _env_int("KUBERNETES_READONLY_MCP_DISCOVERY_CACHE_TTL", 3600)
+
+# Serve every tool from a snapshot directory written by --capture instead of a
+# cluster (see snapshot.py). Set by --snapshot or this variable.
+SNAPSHOT_DIR = os.environ.get("KUBERNETES_READONLY_MCP_SNAPSHOT") or None
+# Log lines kept per container by --capture.
+SNAPSHOT_LOG_TAIL_LINES = _env_int("KUBERNETES_READONLY_MCP_SNAPSHOT_LOG_TAIL", 1000)
+
+
+class _Reflector:
+    """In-memory LIST+WATCH mirror of one resource kind across all namespaces.
+
+    The first ``list()`` performs a single LIST, records its resourceVersion and
+    starts a daemon thread that WATCHes from there, applying ADDED/MODIFIED/
+    DELETED events to the store. An expired resourceVersion (410 Gone) triggers
+    a fresh LIST. Every later ``list()`` is a dict lookup with no API traffic.
+
+    Objects are kept as the raw JSON dicts the API server sent (no model
+    deserialization), the same shape the typed list tools' fast path reads.
+    """
+
+    def __init__(self, list_func, watch_timeout: int = WATCH_TIMEOUT_SECONDS):
+        self._list_func = list_func
+        self._watch_timeout = watch_timeout
+        # namespace ('' for cluster-scoped kinds) -> {name: raw object}
+        self._store = {}
+        self._resource_version = None
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._synced = False
+        self._stopped = threading.Event()
+        self._thread = None
+        # (replace(objects), apply(event_type, obj)) pairs kept in step with the store.
+        self._listeners = []
+
+    def subscribe(self, replace, apply):
+        """Mirror the store into another index, e.g. the _OwnerGraph.
+
+        ``replace`` receives every object after each (re)LIST, and right away
+        if the store is already synced; ``apply`` receives each watch event.
+        Both are called under the store lock, so they see changes in order.
+        """
+        with self._lock:
+            self._listeners.append((replace, apply))
+            if self._synced:
+                replace([obj for by_name in self._store.values() for obj in by_name.values()])
+
+    @property
+    def resource_version(self) -> Optional[str]:
+        """The resourceVersion of the last LIST or watch event applied."""
+        return self._resource_version
+
+    def list(self, namespace: Optional[str] = None) -> list:
+        """Return the cached objects, optionally limited to one namespace."""
+        if not self._synced:
+            with self._sync_lock:
+                if not self._synced:
+                    self._relist()
+                    self._start()
+        with self._lock:
+            if namespace:
+                return list(self._store.get(namespace, {}).values())
+            return [obj for by_name in self._store.values() for obj in by_name.values()]
+
+    def stop(self):
+        """Stop the background watch; the next list() starts over with a LIST."""
+        self._stopped.set()
+        self._synced = False
+
+    def _start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="k8s-reflector", daemon=True)
+        self._thread.start()
+
+    def _relist(self):
+        ret = _read_json(self._list_func(watch=False, _preload_content=False))
+        store = {}
+        for obj in ret.get("items") or []:
+            metadata = obj["metadata"]
+            store.setdefault(metadata.get("namespace") or "", {})[metadata["name"]] = obj
+        with self._lock:
+            self._store = store
+            self._resource_version = ret["metadata"].get("resourceVersion")
+            for replace, _ in self._listeners:
+                replace(ret.get("items") or [])
+        self._synced = True
+
+    def _run(self):
+        backoff = 1
+        while not self._stopped.is_set():
+            try:
+                self._watch_once()
+                backoff = 1
+            except client.exceptions.ApiException as e:
+                if e.status == 410:
+                    # Our resourceVersion fell out of the API server's window.
+                    logger.info("watch expired (410 Gone); relisting")
+                    try:
+                        self._relist()
+                        continue
+                    except Exception:
+                        logger.exception("relist failed")
+                else:
+                    logger.warning("watch failed: %s", e)
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, 30)
+            except Exception:
+                logger.exception("watch failed")
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, 30)
+
+    def _watch_once(self):
+        """Consume one WATCH request until its server-side timeout."""
+
+        # A wrapper without a return annotation makes Watch hand back the raw
+        # event dicts instead of deserializing every object into a model.
+        def list_raw(**kwargs):
+            return self._list_func(**kwargs)
+
+        w = watch.Watch()
+        for event in w.stream(
+            list_raw,
+            resource_version=self._resource_version,
+            timeout_seconds=self._watch_timeout,
+            allow_watch_bookmarks=True,
+        ):
+            self._apply(event)
+            if self._stopped.is_set():
+                w.stop()
+                break
+
+    def _apply(self, event):
+        event_type = event.get("type")
+        obj = event.get("object") or {}
+        metadata = obj.get("metadata") or {}
+        with self._lock:
+            if event_type in ("ADDED", "MODIFIED"):
+                namespace = metadata.get("namespace") or ""
+                self._store.setdefault(namespace, {})[metadata["name"]] = obj
+            elif event_type == "DELETED":
+                namespace = metadata.get("namespace") or ""
+                self._store.get(namespace, {}).pop(metadata["name"], None)
+            if event_type in ("ADDED", "MODIFIED", "DELETED"):
+                for _, apply in self._listeners:
+                    apply(event_type, obj)
+            if metadata.get("resourceVersion"):
+                self._resource_version = metadata["resourceVersion"]
+
+
+# Group/version of the resource metrics API served by metrics-server.
+METRICS_API_VERSION = "metrics.k8s.io/v1beta1"
+
+# Kinds the typed list tools can serve from a reflector:
+# cache key -> (KubernetesManager accessor, cluster-wide list method).
+_REFLECTED_KINDS = {
+    "pods": ("get_core_api", "list_pod_for_all_namespaces"),
+    "deployments": ("get_apps_api", "list_deployment_for_all_namespaces"),
+    "services": ("get_core_api", "list_service_for_all_namespaces"),
+    "namespaces": ("get_core_api", "list_namespace"),
+    "nodes": ("get_core_api", "list_node"),
+    "replicasets": ("get_apps_api", "list_replica_set_for_all_namespaces"),
+    "jobs": ("get_batch_api", "list_job_for_all_namespaces"),
+    "events": ("get_core_api", "list_event_for_all_namespaces"),
+}
+
+# Workload kinds the _OwnerGraph resolves: kind -> (apiVersion, kinds it owns).
+_OWNER_KINDS = {
+    "Deployment": ("apps/v1", ("ReplicaSet",)),
+    "ReplicaSet": ("apps/v1", ("Pod",)),
+    "StatefulSet": ("apps/v1", ("Pod",)),
+    "DaemonSet": ("apps/v1", ("Pod",)),
+    "CronJob": ("batch/v1", ("Job",)),
+    "Job": ("batch/v1", ("Pod",)),
+}
+# Owned kinds the graph indexes: kind -> (reflector key, accessor, namespaced list method).
+_OWNED_KINDS = {
+    "ReplicaSet": ("replicasets", "get_apps_api", "list_namespaced_replica_set"),
+    "Job": ("jobs", "get_batch_api", "list_namespaced_job"),
+    "Pod": ("pods", "get_core_api", "list_namespaced_pod"),
+}
+
+
+class _OwnerGraph:
+    """Index of ownerReferences: each owner -> the raw objects that it owns.
+
+    Objects are indexed under every owner they reference, by (namespace,
+    owner kind, owner name), so Deployment -> ReplicaSet -> Pod is two dict
+    lookups and never involves a label selector. Updates are per object; the
+    graph remembers each object's owners so a change or delete can unlink it.
+    """
 
     def __init__(self):
-        """Initialize the Kubernetes clients once."""
+        # (namespace, owner kind, owner name) -> {(kind, name): raw object}
+        self._children = {}
+        # (namespace, kind, name) -> owner keys it is indexed under
+        self._owners = {}
+        self._lock = threading.Lock()
+
+    def replace(self, kind: str, objects: list):
+        """Drop every object of ``kind`` and index ``objects`` instead."""
+        with self._lock:
+            for key in [key for key in self._owners if key[1] == kind]:
+                self._unlink(key)
+            for obj in objects:
+                self._link(kind, obj)
+
+    def apply(self, kind: str, event_type: str, obj: dict):
+        """Apply one ADDED/MODIFIED/DELETED watch event for an object of ``kind``."""
+        metadata = obj.get("metadata") or {}
+        with self._lock:
+            self._unlink((metadata.get("namespace") or "", kind, metadata.get("name")))
+            if event_type != "DELETED":
+                self._link(kind, obj)
+
+    def _link(self, kind: str, obj: dict):
+        metadata = obj.get("metadata") or {}
+        namespace, name = metadata.get("namespace") or "", metadata.get("name")
+        owners = [
+            (namespace, ref.get("kind"), ref.get("name"))
+            for ref in metadata.get("ownerReferences") or []
+        ]
+        for owner in owners:
+            self._children.setdefault(owner, {})[(kind, name)] = obj
+        if owners:
+            self._owners[(namespace, kind, name)] = owners
+
+    def _unlink(self, key: tuple):
+        namespace, kind, name = key
+        for owner in self._owners.pop(key, ()):
+            children = self._children.get(owner)
+            if children is not None:
+                children.pop((kind, name), None)
+                if not children:
+                    del self._children[owner]
+
+    def owned(self, namespace: str, kind: str, name: str, recursive: bool = True) -> list:
+        """Return (kind, raw object) for what an object owns, breadth first.
+
+        With ``recursive``, the objects those own too (e.g. a Deployment's
+        ReplicaSets and then their Pods).
+        """
+        found = []
+        pending = [(kind, name)]
+        seen = set(pending)
+        with self._lock:
+            while pending:
+                owner_kind, owner_name = pending.pop(0)
+                children = self._children.get((namespace, owner_kind, owner_name), {})
+                for child_key, obj in sorted(children.items()):
+                    if child_key in seen:
+                        continue
+                    seen.add(child_key)
+                    found.append((child_key[0], obj))
+                    if recursive:
+                        pending.append(child_key)
+        return found
+
+
+def _version_number(resource_version) -> Optional[int]:
+    """A resourceVersion as an int, for ordering; None if it is not a number."""
+    try:
+        return int(resource_version)
+    except (TypeError, ValueError):
+        return None
+
+
+class _EventFeed:
+    """Bounded ring buffer of Event changes, the source of watch_events_since.
+
+    Subscribed to the events reflector: every ADDED/MODIFIED/DELETED watch event
+    is appended with its resourceVersion and the oldest change falls off once
+    ``size`` are held. The buffer holds every change after ``horizon``, so a
+    cursor at or past it is answered from memory; an older cursor, or any
+    cursor from before a relist (whose gap is unknown), needs a relist.
+    """
+
+    def __init__(self, reflector: "_Reflector", size: int = EVENT_BUFFER_SIZE):
+        self._reflector = reflector
+        # (resourceVersion, watch event type, raw Event), oldest first
+        self._changes = deque()
+        self._size = size
+        self._horizon = None
+        self._latest = None
+        self._lock = threading.Lock()
+        reflector.subscribe(self._replace, self._apply)
+        reflector.list()  # LIST (and start watching) now if not yet synced.
+
+    def cursor(self) -> Optional[int]:
+        """The newest resourceVersion seen: pass it to changes() to resume from now."""
+        with self._lock:
+            return self._latest
+
+    def changes(self, cursor: int) -> Optional[list]:
+        """Return the changes after ``cursor``, oldest first, or None if it expired."""
+        with self._lock:
+            if self._horizon is None or cursor < self._horizon:
+                return None
+            changes = []
+            for change in reversed(self._changes):
+                if change[0] <= cursor:
+                    break
+                changes.append(change)
+        changes.reverse()
+        return changes
+
+    def current(self, namespace: Optional[str] = None) -> list:
+        """The Events that exist now, from the reflector's store."""
+        return self._reflector.list(namespace)
+
+    def _replace(self, objects: list):
+        # A (re)LIST: what changed before it is unknown, so start over from its version.
+        version = _version_number(self._reflector.resource_version)
+        with self._lock:
+            self._changes.clear()
+            self._horizon = self._latest = version or 0
+
+    def _apply(self, event_type: str, obj: dict):
+        version = _version_number((obj.get("metadata") or {}).get("resourceVersion"))
+        if version is None:
+            return
+        with self._lock:
+            self._changes.append((version, event_type, obj))
+            if len(self._changes) > self._size:
+                self._horizon = self._changes.popleft()[0]
+            self._latest = max(self._latest or 0, version)
+
+
+def _quantity(value) -> float:
+    """A resource quantity ('250m', '1.5Gi', '123456789n') as a float; 0 if absent."""
+    return float(_utils.parse_quantity(value)) if value is not None else 0.0
+
+
+def _pod_usage(item: dict) -> tuple:
+    """(CPU cores, memory bytes) of a PodMetrics item, summed over its containers."""
+    cpu = memory = 0.0
+    for container in item.get("containers") or []:
+        usage = container.get("usage") or {}
+        cpu += _quantity(usage.get("cpu"))
+        memory += _quantity(usage.get("memory"))
+    return cpu, memory
+
+
+def _node_usage(item: dict) -> tuple:
+    """(CPU cores, memory bytes) of a NodeMetrics item."""
+    usage = item.get("usage") or {}
+    return _quantity(usage.get("cpu")), _quantity(usage.get("memory"))
+
+
+def _timestamp_seconds(value) -> float:
+    """An API timestamp as Unix seconds; now if it is missing or malformed."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return time.time()
+
+
+class _UsageRing:
+    """Fixed-size ring of (timestamp, CPU cores, memory bytes) usage samples.
+
+    The samples live in three preallocated float arrays written round-robin,
+    so a pod's history costs 24 bytes per sample however long it runs.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._times = array("d", bytes(8 * size))
+        self._cpu = array("d", bytes(8 * size))
+        self._memory = array("d", bytes(8 * size))
+        self._next = 0
+        self._count = 0
+
+    def append(self, timestamp: float, cpu: float, memory: float) -> bool:
+        """Record a sample; False (and nothing recorded) if it is not newer than the last."""
+        if self._count and timestamp <= self._times[self._next - 1]:
+            return False
+        self._times[self._next] = timestamp
+        self._cpu[self._next] = cpu
+        self._memory[self._next] = memory
+        self._next = (self._next + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+        return True
+
+    def samples(self) -> tuple:
+        """(timestamps, cpu, memory) lists, oldest sample first."""
+        start = (self._next - self._count) % self._size
+        order = [(start + i) % self._size for i in range(self._count)]
+        return (
+            [self._times[i] for i in order],
+            [self._cpu[i] for i in order],
+            [self._memory[i] for i in order],
+        )
+
+    def stats(self) -> dict:
+        """Average, p95 and maximum CPU and memory, and the memory growth rate."""
+        times, cpu, memory = self.samples()
+        window = times[-1] - times[0] if times else 0.0
+        return {
+            "samples": len(times),
+            "window_seconds": round(window, 1),
+            "cpu_millicores": _distribution(cpu, 1000),
+            "memory_bytes": _distribution(memory, 1),
+            # Slope between the oldest and newest sample: a steady rise is a leak.
+            "memory_growth_bytes_per_second": (
+                round((memory[-1] - memory[0]) / window, 1) if window else None
+            ),
+        }
+
+
+def _distribution(values: list, scale: float) -> dict:
+    """avg/p95/max of ``values`` times ``scale``; p95 by nearest rank."""
+    if not values:
+        return {"avg": None, "p95": None, "max": None}
+    ordered = sorted(values)
+    p95 = ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+    return {
+        "avg": round(sum(ordered) / len(ordered) * scale, 1),
+        "p95": round(p95 * scale, 1),
+        "max": round(ordered[-1] * scale, 1),
+    }
+
+
+class _UsageSampler:
+    """Background scraper of metrics.k8s.io keeping a _UsageRing per pod and node.
+
+    ``scrape()`` returns the current PodMetrics and NodeMetrics items. The first
+    ``latest()`` scrapes synchronously and starts a daemon thread that scrapes
+    again every ``interval`` seconds; later calls are answered from memory.
+    Pods and nodes missing from a scrape are forgotten, history and all.
+    """
+
+    def __init__(self, scrape, interval: int = USAGE_SAMPLE_INTERVAL, size: int = USAGE_SAMPLES):
+        self._scrape = scrape
+        self._interval = interval
+        self._size = size
+        # (namespace, name) or node name -> (_UsageRing, latest metrics item)
+        self._pods = {}
+        self._nodes = {}
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._synced = False
+        self._stopped = threading.Event()
+
+    def latest(self) -> tuple:
+        """Return ([(PodMetrics, stats)], [(NodeMetrics, stats)]) from the last scrape."""
+        if not self._synced:
+            with self._sync_lock:
+                if not self._synced:
+                    self._sample()
+                    self._synced = True
+                    self._stopped.clear()
+                    threading.Thread(target=self._run, name="k8s-usage", daemon=True).start()
+        with self._lock:
+            return (
+                [(item, ring.stats()) for ring, item in self._pods.values()],
+                [(item, ring.stats()) for ring, item in self._nodes.values()],
+            )
+
+    def stop(self):
+        """Stop the background scrapes; the next latest() starts over."""
+        self._stopped.set()
+        self._synced = False
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            try:
+                self._sample()
+            except Exception as e:
+                logger.warning("usage scrape failed: %s", e)
+
+    def _sample(self):
+        pod_items, node_items = self._scrape()
+        with self._lock:
+            self._pods = self._record(self._pods, pod_items, _pod_usage, namespaced=True)
+            self._nodes = self._record(self._nodes, node_items, _node_usage, namespaced=False)
+
+    def _record(self, rings: dict, items: list, usage, namespaced: bool) -> dict:
+        recorded = {}
+        for item in items:
+            metadata = item.get("metadata") or {}
+            key = (
+                (metadata.get("namespace"), metadata.get("name"))
+                if namespaced
+                else metadata.get("name")
+            )
+            ring = rings[key][0] if key in rings else _UsageRing(self._size)
+            cpu, memory = usage(item)
+            ring.append(_timestamp_seconds(item.get("timestamp")), cpu, memory)
+            recorded[key] = (ring, item)
+        return recorded
+
+
+class _ResponseCache:
+    """Size-bounded LRU cache of sanitized get_resource/list_resource responses.
+
+    Values are stored as serialized UTF-8 bytes, so the memory cap is counted
+    in bytes and every hit hands out its own copy. An entry past its TTL is kept until it is
+    evicted: its resourceVersion makes the refresh cheap (see _cached_read).
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        # key -> (serialized value, resourceVersion, expiry in monotonic seconds)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = Counter()
+
+    def get(self, key) -> Optional[tuple]:
+        """Return (value, resourceVersion, expired) for ``key``, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            expired = time.monotonic() >= entry[2]
+            self._stats["expired" if expired else "hits"] += 1
+        return _loads(entry[0]), entry[1], expired
+
+    def put(self, key, value, resource_version: Optional[str], ttl: float):
+        """Store ``value``, evicting least recently used entries beyond the cap."""
+        data = _dumps(value, default=str)
+        if isinstance(data, str):  # json.dumps; orjson already returns bytes.
+            data = data.encode()
+        with self._lock:
+            self._discard(key)
+            if len(data) > self.max_bytes:
+                return
+            self._entries[key] = (data, resource_version, time.monotonic() + ttl)
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes:
+                _, (evicted, _, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._stats["evictions"] += 1
+
+    def renew(self, key, ttl: float):
+        """Start a new TTL for an entry that was revalidated unchanged."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], entry[1], time.monotonic() + ttl)
+                self._stats["revalidated"] += 1
+
+    def stats(self) -> dict:
+        """Counters plus the current number of entries and bytes held."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._bytes}
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[0])
+
+
+@functools.cache
+def _memoized_discoverer():
+    """Return the ``_MemoizedDiscoverer`` class, defined on first use.
+
+    Its base class lives in the kubernetes package, which is loaded lazily.
+    """
+    from kubernetes.dynamic.discovery import LazyDiscoverer
+
+    class _MemoizedDiscoverer(LazyDiscoverer):
+        """LazyDiscoverer that memoizes ``resources.get(...)`` lookups.
+
+        Resolving (api_version, kind) walks the discovered group tree on every
+        call; the memo turns repeat lookups into a dict hit. It is cleared whenever
+        discovery is invalidated, which LazyDiscoverer already does (and then
+        rediscovers) when a search finds no match, e.g. for a freshly added CRD.
+        """
+
+        def __init__(self, client, cache_file):
+            self._lookups = {}
+            super().__init__(client, cache_file)
+
+        def get(self, **kwargs):
+            key = tuple(sorted(kwargs.items()))
+            resource = self._lookups.get(key)
+            if resource is None:
+                resource = super().get(**kwargs)
+                self._lookups[key] = resource
+            return resource
+
+        def invalidate_cache(self):
+            self._lookups = {}
+            super().invalidate_cache()
+
+    return _MemoizedDiscoverer
+
+
+def __getattr__(name):
+    # Keeps ``server._MemoizedDiscoverer`` importable without an eager kubernetes import.
+    if name == "_MemoizedDiscoverer":
+        return _memoized_discoverer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _discovery_cache_file(api_client) -> str:
+    """Return the on-disk discovery cache path for this cluster.
+
+    The file is keyed by API server URL and server version, so an upgrade
+    (which can add or drop API versions) never reuses stale discovery. Files
+    older than DISCOVERY_CACHE_TTL_SECONDS are removed so discovery reruns.
+    """
+    host = api_client.configuration.host
+    try:
+        server_version = client.VersionApi(api_client).get_code().git_version
+    except Exception:
+        server_version = "unknown"
+    digest = hashlib.sha256(f"{host}|{server_version}".encode()).hexdigest()[:32]
+    path = os.path.join(DISCOVERY_CACHE_DIR, f"discovery-{digest}.json")
+    try:
+        os.makedirs(DISCOVERY_CACHE_DIR, exist_ok=True)
+        if time.time() - os.path.getmtime(path) >= DISCOVERY_CACHE_TTL_SECONDS:
+            os.remove(path)
+    except OSError:
+        pass  # Missing file or unwritable dir: discovery simply runs uncached.
+    return path
+
+
+def _tune_configuration(configuration):
+    """Apply the connection pool and TCP settings to a client Configuration."""
+    configuration.connection_pool_maxsize = POOL_MAXSIZE
+    if TCP_KEEPALIVE:
         try:
-            # Try to load from kubeconfig.
-            config.load_kube_config()
-        except Exception:
-            # Fall back to in-cluster config if running in a pod.
-            config.load_incluster_config()
-
-        # Initialize the typed API clients used by the curated tools.
-        self.core_api = client.CoreV1Api()
-        self.apps_api = client.AppsV1Api()
-        self.batch_api = client.BatchV1Api()
-        self.networking_api = client.NetworkingV1Api()
+            from kubernetes.utils.keepalive import tcp_keepalive_socket_options
+        except ImportError:  # Older kubernetes clients: keep the OS socket defaults.
+            return configuration
+        configuration.socket_options = tcp_keepalive_socket_options(
+            TCP_KEEPALIVE_IDLE, TCP_KEEPALIVE_INTERVAL, TCP_KEEPALIVE_COUNT
+        )
+    return configuration
+
+
+class KubernetesManager:
+    """Manages Kubernetes API client connections (read-only use)."""
+
+    def __init__(self, context: Optional[str] = None):
+        """Initialize the Kubernetes clients once.
+
+        Args:
+            context (str, optional): kubeconfig context to connect to. The current
+                                    context (or in-cluster config) is used when omitted.
+        """
+        self.context = context
+        self.snapshot = None
+        if SNAPSHOT_DIR:
+            self.snapshot = snapshot.Snapshot(SNAPSHOT_DIR)
+            if context not in (None, self.snapshot.context):
+                self.snapshot.close()
+                raise ValueError(
+                    f"Snapshot {SNAPSHOT_DIR} was captured from context "
+                    f"{self.snapshot.context!r}, not {context!r}"
+                )
+            # Requests are answered from the snapshot; the host only keys the
+            # discovery cache, so it names the capture.
+            configuration = client.Configuration()
+            configuration.host = f"https://{self.snapshot.id}.snapshot.invalid"
+            self.api_client = client.ApiClient(configuration)
+            self.api_client.rest_client = snapshot.SnapshotRestClient(self.snapshot)
+        elif context is None:
+            try:
+                # Try to load from kubeconfig.
+                config.load_kube_config()
+            except Exception:
+                # Fall back to in-cluster config if running in a pod.
+                config.load_incluster_config()
+            configuration = client.Configuration.get_default_copy()
+            self.api_client = client.ApiClient(_tune_configuration(configuration))
+        else:
+            # A named context gets its own configuration, leaving the global default alone.
+            self.api_client = config.new_client_from_config(
+                context=context, client_configuration=_tune_configuration(client.Configuration())
+            )
+
+        if metrics.ENABLED:
+            metrics.instrument_api_client(self.api_client)
+
+        # Initialize the typed API clients used by the curated tools. They share
+        # this context's ApiClient and therefore its one connection pool.
+        self.core_api = client.CoreV1Api(self.api_client)
+        self.apps_api = client.AppsV1Api(self.api_client)
+        self.batch_api = client.BatchV1Api(self.api_client)
+        self.networking_api = client.NetworkingV1Api(self.api_client)
         # Dynamic client powers the generic read-any-kind tools (incl. CRDs).
-        self.dynamic_api = dynamic.DynamicClient(client.ApiClient())
+        # Discovery is persisted on disk so a new process skips the full walk.
+        self.dynamic_api = dynamic.DynamicClient(
+            self.api_client,
+            cache_file=_discovery_cache_file(self.api_client),
+            discoverer=_memoized_discoverer(),
+        )
+        # Watch-backed caches, created on first use (see _from_watch_cache).
+        self._reflectors = {}
+        self._reflectors_lock = threading.Lock()
+        # ownerReferences graph fed by the pod, ReplicaSet and Job reflectors.
+        self._owner_graph = None
+        self._owner_graph_lock = threading.Lock()
+        # Event ring buffer behind watch_events_since, created on first use.
+        self._event_feed = None
+        self._event_feed_lock = threading.Lock()
+        # metrics.k8s.io sampler behind top_pods/top_nodes, when enabled.
+        self._usage_sampler = None
+        self._usage_sampler_lock = threading.Lock()
+        # Responses of the generic read tools, when enabled (see _cached_read).
+        self.response_cache = _ResponseCache(RESPONSE_CACHE_MAX_BYTES)
+
+    def close(self):
+        """Stop this manager's watch caches and release its connection pool."""
+        with self._reflectors_lock:
+            reflectors, self._reflectors = list(self._reflectors.values()), {}
+        for reflector in reflectors:
+            reflector.stop()
+        with self._usage_sampler_lock:
+            if self._usage_sampler is not None:
+                self._usage_sampler.stop()
+        for tail in _sweep_log_tails(self):
+            tail.stop()
+        self.api_client.close()
 
     def get_core_api(self):
         """Get the CoreV1Api client."""
@@ -67,18 +993,945 @@ class KubernetesManager:
         """Get the dynamic client."""
         return self.dynamic_api
 
+    def get_reflector(self, kind: str) -> _Reflector:
+        """Get the shared reflector for a kind in _REFLECTED_KINDS."""
+        with self._reflectors_lock:
+            reflector = self._reflectors.get(kind)
+            if reflector is None:
+                accessor, method = _REFLECTED_KINDS[kind]
+                reflector = _Reflector(getattr(getattr(self, accessor)(), method))
+                self._reflectors[kind] = reflector
+            return reflector
+
+    def get_owner_graph(self) -> Optional[_OwnerGraph]:
+        """Get the watch-fed ownerReferences graph, or None if the watch cache is off."""
+        if not WATCH_CACHE_ENABLED or SNAPSHOT_DIR:
+            return None
+        with self._owner_graph_lock:
+            if self._owner_graph is None:
+                graph = _OwnerGraph()
+                for kind, (cache_key, _, _) in _OWNED_KINDS.items():
+                    reflector = self.get_reflector(cache_key)
+                    reflector.subscribe(
+                        functools.partial(graph.replace, kind),
+                        functools.partial(graph.apply, kind),
+                    )
+                    reflector.list()  # LIST (and start watching) now if not yet synced.
+                self._owner_graph = graph
+            return self._owner_graph
+
+    def get_event_feed(self) -> Optional[_EventFeed]:
+        """Get the watch-fed Event ring buffer, or None when serving a snapshot.
+
+        Unlike the list caches this does not depend on the watch cache setting:
+        asking for event deltas is asking for the watch.
+        """
+        if SNAPSHOT_DIR:
+            return None
+        with self._event_feed_lock:
+            if self._event_feed is None:
+                self._event_feed = _EventFeed(self.get_reflector("events"))
+            return self._event_feed
+
+    def get_usage_sampler(self) -> Optional[_UsageSampler]:
+        """Get the background metrics.k8s.io sampler, or None if sampling is off."""
+        if not USAGE_SAMPLER_ENABLED or SNAPSHOT_DIR:
+            return None
+        with self._usage_sampler_lock:
+            if self._usage_sampler is None:
+                self._usage_sampler = _UsageSampler(
+                    lambda: (_list_metrics(self, "PodMetrics"), _list_metrics(self, "NodeMetrics"))
+                )
+            return self._usage_sampler
+
+
+# One KubernetesManager per kubeconfig context (None is the current context),
+# created on first use and kept in least-recently-used order. Managers idle for
+# longer than CONTEXT_IDLE_SECONDS, or beyond MAX_CONTEXTS, are closed.
+MAX_CONTEXTS = _env_int("KUBERNETES_READONLY_MCP_MAX_CONTEXTS", 16)
+CONTEXT_IDLE_SECONDS = _env_int("KUBERNETES_READONLY_MCP_CONTEXT_IDLE_TIMEOUT", 1800)
+
+_managers = OrderedDict()  # context -> (manager, last used, monotonic seconds)
+_managers_lock = threading.Lock()
+
+
+# Managers in use by tool calls in progress: manager -> number of calls. An
+# evicted manager still in use is closed when its last call finishes.
+_manager_users = Counter()
+_retired_managers = set()
+# The managers the tool call in progress on this thread (or context) holds.
+_held_managers = contextvars.ContextVar("kubernetes_readonly_mcp_managers", default=None)
+
+
+def _get_manager(context: Optional[str] = None) -> "KubernetesManager":
+    """Return the KubernetesManager for a kubeconfig context, creating it on first use.
+
+    Inside a tool call (see _holding_managers) the manager is held until the
+    call returns, so evicting it meanwhile does not close it under the call.
+    """
+    while True:
+        with _managers_lock:
+            entry = _managers.get(context)
+        # Connect outside the lock so a slow cluster does not hold up the others.
+        created = None if entry else KubernetesManager(context)
+
+        evicted = []
+        with _managers_lock:
+            entry = _managers.pop(context, None)
+            if entry is None and created is None:
+                # Evicted by another call since we looked: connect again.
+                continue
+            now = time.monotonic()
+            manager = entry[0] if entry else created
+            if entry and created:
+                # Another call connected to the same context first; keep theirs.
+                evicted.append(created)
+            # Close idle managers, and the least recently used beyond the limit.
+            while _managers:
+                oldest, (_, last_used) = next(iter(_managers.items()))
+                if len(_managers) < MAX_CONTEXTS and now - last_used < CONTEXT_IDLE_SECONDS:
+                    break
+                idle = _managers.pop(oldest)[0]
+                if _manager_users[idle]:
+                    _retired_managers.add(idle)
+                else:
+                    evicted.append(idle)
+            _managers[context] = (manager, now)
+            held = _held_managers.get()
+            if held is not None and manager not in held:
+                held.append(manager)
+                _manager_users[manager] += 1
+        break
+
+    _close_managers(evicted)
+    return manager
+
+
+def _close_managers(managers: list):
+    """Close evicted managers, logging (not raising) any error."""
+    for manager in managers:
+        try:
+            manager.close()
+        except Exception:
+            logger.debug("Error closing Kubernetes client for context %s", manager.context)
+
+
+def _holding_managers(func):
+    """Tool decorator: hold the managers the call gets from _get_manager until it returns."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        held = []
+        token = _held_managers.set(held)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _held_managers.reset(token)
+            released = []
+            with _managers_lock:
+                for manager in held:
+                    _manager_users[manager] -= 1
+                    if not _manager_users[manager]:
+                        del _manager_users[manager]
+                        if manager in _retired_managers:
+                            _retired_managers.discard(manager)
+                            released.append(manager)
+            _close_managers(released)
+
+    return wrapper
+
+
+# Followed container logs: (context, namespace, pod, container) -> _LogTail.
+_log_tails = {}
+_log_tails_lock = threading.Lock()
+
+
+def _sweep_log_tails(manager=None) -> list:
+    """Forget stopped and idle tails (all of ``manager``'s, if given); return them to stop."""
+    now = time.monotonic()
+    with _log_tails_lock:
+        done = [
+            key
+            for key, tail in _log_tails.items()
+            if tail.stopped
+            or now - tail.last_used > FOLLOW_IDLE_SECONDS
+            or (manager is not None and tail.manager is manager)
+        ]
+        return [_log_tails.pop(key) for key in done]
+
+
+def _followed_log(
+    context: Optional[str], namespace: str, pod_name: str, container: Optional[str]
+) -> Optional["_LogTail"]:
+    """The tail following a container's log, if any; None container means the first."""
+    for tail in _sweep_log_tails():
+        tail.stop()
+    with _log_tails_lock:
+        if container is None:
+            for (ctx, ns, pod, _), tail in _log_tails.items():
+                if (ctx, ns, pod) == (context, namespace, pod_name):
+                    container = tail.container_names[0] if tail.container_names else None
+                    break
+        return _log_tails.get((context, namespace, pod_name, container))
+
+
+def _read_followed_log(
+    tail: "_LogTail",
+    tail_lines: Optional[int],
+    limit_bytes: Optional[int] = None,
+    pattern=None,
+    context_lines: int = 0,
+) -> Optional[dict]:
+    """
+    Read a followed log from its buffer the way the API reads are made.
+
+    limit_bytes bounds the bytes read as the API's limitBytes does, and with a
+    pattern the lines go through _grep_lines as in _grep_pod_log.
+
+    Returns:
+        A dict with "logs", "bytes_read" and "truncated" (plus "matches" with a
+        pattern), or None if the buffer does not hold the requested lines.
+    """
+    lines = tail.lines(tail_lines)
+    if lines is None:
+        return None
+    data = b"".join(lines)
+    if pattern is not None:
+        data = data[:limit_bytes] if limit_bytes else data
+        return _grep_lines(data.splitlines(keepends=True), pattern, context_lines)
+    budget = min(limit_bytes, LOG_MAX_BYTES) if limit_bytes else LOG_MAX_BYTES
+    return {
+        "logs": data[:budget].decode("utf-8", errors="replace").split("\n"),
+        "truncated": len(data) > budget,
+        "bytes_read": min(len(data), budget),
+    }
+
+
+def _from_watch_cache(manager, kind: str, namespace: Optional[str] = None, fresh: bool = False):
+    """Return the cached items for a reflected kind, or None to query the API.
+
+    None means the watch cache is disabled (always, when serving a snapshot)
+    or the caller asked for fresh data.
+    """
+    if fresh or not WATCH_CACHE_ENABLED or SNAPSHOT_DIR:
+        return None
+    return manager.get_reflector(kind).list(namespace)
+
+
+def _response_cache(manager) -> Optional[_ResponseCache]:
+    """Return the manager's response cache, or None when it is disabled."""
+    if not RESPONSE_CACHE_ENABLED or SNAPSHOT_DIR:
+        return None
+    return manager.response_cache
+
+
+def _response_cache_ttl(kind: str) -> int:
+    """Seconds a cached response of ``kind`` is served without asking the API server."""
+    return RESPONSE_CACHE_KIND_TTLS.get(kind, RESPONSE_CACHE_TTL_SECONDS)
+
+
+def _cached_read(cache: _ResponseCache, kind: str, key: tuple, fetch, fresh: bool = False):
+    """Serve a generic read through a cluster's response cache.
+
+    ``fetch(resource_version)`` makes the request and returns the sanitized
+    value and its resourceVersion. Within the kind's TTL a hit costs no request.
+    Past it, the request is repeated with the cached resourceVersion
+    (NotOlderThan), which the API server answers from its watch cache rather
+    than with a quorum read from etcd; an unchanged version just renews the
+    entry. fresh=True always does a quorum read and refills the entry.
+
+    A list's resourceVersion is the store's latest revision, which any write to
+    any object of the kind moves on, so lists seldom renew: their revalidation
+    saves the quorum read, but usually transfers and stores the list again.
+    """
+    ttl = _response_cache_ttl(kind)
+    if ttl <= 0:
+        return fetch(None)[0]
+    entry = None if fresh else cache.get(key)
+    if entry is not None and not entry[2]:
+        return entry[0]
+    cached_version = entry[1] if entry is not None else None
+    value, resource_version = fetch(cached_version)
+    if cached_version and resource_version == cached_version:
+        cache.renew(key, ttl)
+    else:
+        cache.put(key, value, resource_version, ttl)
+    return value
+
+
+def _owned_objects(manager, namespace: str, kind: str, name: str, recursive: bool = True):
+    """Resolve what a workload owns through ownerReferences.
+
+    With the watch cache on this is a lookup in the manager's live graph.
+    Otherwise a one-off graph is built from raw LISTs of only the kinds that
+    ``kind`` can own, scoped to its namespace.
+
+    Returns:
+        A list of (kind, raw object) tuples, breadth first.
+    """
+    graph = manager.get_owner_graph()
+    if graph is None:
+        graph = _OwnerGraph()
+        pending = list(_OWNER_KINDS[kind][1])
+        while pending:
+            owned_kind = pending.pop(0)
+            _, accessor, method = _OWNED_KINDS[owned_kind]
+            api = getattr(manager, accessor)()
+            ret = _read_json(getattr(api, method)(namespace=namespace, _preload_content=False))
+            graph.replace(owned_kind, ret.get("items") or [])
+            if recursive and owned_kind in _OWNER_KINDS:
+                pending += [k for k in _OWNER_KINDS[owned_kind][1] if k not in pending]
+    return graph.owned(namespace, kind, name, recursive)
+
+
+def _owner_kind(resource_type: str) -> Optional[str]:
+    """Map 'deployment', 'Deployments', ... to its _OWNER_KINDS key, or None."""
+    lowered = (resource_type or "").lower()
+    for kind in _OWNER_KINDS:
+        if lowered in (kind.lower(), kind.lower() + "s"):
+            return kind
+    return None
+
+
+def _owner_exists(manager, namespace: str, kind: str, name: str) -> bool:
+    """GET a workload to tell "owns nothing" apart from "does not exist"."""
+    api = manager.get_dynamic_api().resources.get(api_version=_OWNER_KINDS[kind][0], kind=kind)
+    try:
+        api.get(name=name, namespace=namespace)
+    except Exception as e:
+        if getattr(e, "status", None) == 404:
+            return False
+        raise
+    return True
+
+
+def _list_metrics(manager, kind: str, namespace: Optional[str] = None, **params) -> list:
+    """LIST PodMetrics or NodeMetrics items from metrics.k8s.io (metrics-server)."""
+    api = manager.get_dynamic_api().resources.get(api_version=METRICS_API_VERSION, kind=kind)
+    return _read_json(api.get(namespace=namespace, serialize=False, **params)).get("items") or []
+
+
+def _fan_out(func, items: list, max_workers: int, deadline: Optional[float], on_timeout) -> list:
+    """Run ``func`` over ``items`` on a bounded thread pool, preserving order.
+
+    Items that have not finished when ``deadline`` seconds have passed are
+    replaced by ``on_timeout(item)``; the rest keep their real results, so a
+    few slow items never cost the whole batch. Unstarted work is cancelled and
+    the call returns without waiting for stragglers.
+    """
+    if not items:
+        return []
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    try:
+        if metrics.ENABLED:
+            # Keep the workers' API requests attributed to the calling tool.
+            futures = [executor.submit(metrics.context_runner(), func, item) for item in items]
+        else:
+            futures = [executor.submit(func, item) for item in items]
+        wait(futures, timeout=deadline)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return [
+        future.result() if future.done() and not future.cancelled() else on_timeout(item)
+        for future, item in zip(futures, items)
+    ]
+
+
+class _LogBudget:
+    """Bytes of log lines a get_logs response may still return, shared by its pod reads."""
+
+    def __init__(self, max_bytes: int):
+        self.remaining = max_bytes
+        self.exhausted = False
+        self._lock = threading.Lock()
+
+    def take(self, lines: list) -> list:
+        """Charge the leading lines that fit to the budget and return them."""
+        with self._lock:
+            size = 0
+            for index, line in enumerate(lines):
+                line_size = len(line.encode()) + 1
+                if size + line_size > self.remaining:
+                    self.exhausted = True
+                    lines = lines[:index]
+                    break
+                size += line_size
+            self.remaining -= size
+            return lines
+
+
+def _read_pod_log(core, limit_bytes=None, **kwargs) -> tuple:
+    """
+    Stream one container's log, stopping once the byte budget is reached.
+
+    The body is read in chunks with _preload_content=False so a chatty container
+    never costs more than the budget in memory. One byte past the budget is
+    requested from the API server so a log that was cut short can be told apart
+    from one that fit exactly.
+
+    Returns:
+        A (text, bytes_read, truncated) tuple.
+    """
+    budget = min(limit_bytes, LOG_MAX_BYTES) if limit_bytes else LOG_MAX_BYTES
+    resp = core.read_namespaced_pod_log(limit_bytes=budget + 1, _preload_content=False, **kwargs)
+    chunks = []
+    size = 0
+    truncated = False
+    try:
+        for chunk in resp.stream(_LOG_CHUNK_BYTES):
+            if size + len(chunk) > budget:
+                chunks.append(chunk[: budget - size])
+                size = budget
+                truncated = True
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+    finally:
+        if truncated:
+            # Drop the connection rather than return one with unread data to the pool.
+            resp.close()
+        resp.release_conn()
+    return b"".join(chunks).decode("utf-8", errors="replace"), size, truncated
+
+
+class _LogTail:
+    """Follows one container's log into a byte-bounded ring buffer of lines.
+
+    A daemon thread keeps a ``follow=True`` log request open, starting from the
+    last ``initial_lines`` lines, and appends each line as it arrives; the
+    oldest lines are dropped beyond ``max_bytes``. When the stream ends (the
+    container exited, or the connection dropped) the buffer is refilled from a
+    new request, so it never mixes two container instances. A 404 ends the
+    tail for good.
+    """
+
+    def __init__(
+        self,
+        manager,
+        namespace: str,
+        pod_name: str,
+        container: str,
+        container_names: list,
+        phase: Optional[str],
+        max_bytes: int = FOLLOW_MAX_BYTES,
+        initial_lines: int = FOLLOW_INITIAL_LINES,
+    ):
+        self.manager = manager
+        self.namespace = namespace
+        self.pod_name = pod_name
+        self.container = container
+        self.container_names = container_names
+        self.phase = phase
+        self.last_used = time.monotonic()
+        self._max_bytes = max_bytes
+        self._initial_lines = initial_lines
+        self._lines = deque()
+        self._bytes = 0
+        self._received = 0
+        self._evicted = False
+        self._ready = False
+        self._backlog_done = False
+        self._last_data = time.monotonic()
+        self._resp = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        threading.Thread(target=self._run, name="k8s-log-tail", daemon=True).start()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def lines(self, tail_lines: Optional[int] = None) -> Optional[list]:
+        """The last ``tail_lines`` lines (all when None) as bytes, or None if not held.
+
+        The buffer can answer when it holds that many lines, or for the whole
+        log when nothing was dropped and the initial read was not cut short.
+        Nothing is served while the initial read is still arriving.
+        """
+        with self._lock:
+            if not self._settled():
+                return None
+            whole = not self._evicted and self._received < self._initial_lines
+            if tail_lines is None or tail_lines > len(self._lines):
+                if not whole:
+                    return None
+                tail_lines = len(self._lines)
+            self.last_used = time.monotonic()
+            return list(itertools.islice(self._lines, len(self._lines) - tail_lines, None))
+
+    def describe(self) -> dict:
+        with self._lock:
+            return {
+                "namespace": self.namespace,
+                "pod_name": self.pod_name,
+                "container": self.container,
+                "ready": self._settled(),
+                "buffered_lines": len(self._lines),
+                "buffered_bytes": self._bytes,
+            }
+
+    def _settled(self) -> bool:
+        """True once the stream is open and its initial read has arrived (lock held)."""
+        if not self._ready:
+            return False
+        if not self._backlog_done:
+            quiet = time.monotonic() - self._last_data
+            if self._received < self._initial_lines and quiet < _FOLLOW_SETTLE_SECONDS:
+                return False
+            self._backlog_done = True
+        return True
+
+    def stop(self):
+        self._stopped.set()
+        with self._lock:
+            resp, self._resp = self._resp, None
+        if resp is not None:
+            # Unblocks the thread's read.
+            resp.close()
+
+    def _run(self):
+        core = self.manager.get_core_api()
+        backoff = 1
+        while not self._stopped.is_set():
+            try:
+                resp = core.read_namespaced_pod_log(
+                    name=self.pod_name,
+                    namespace=self.namespace,
+                    container=self.container,
+                    follow=True,
+                    tail_lines=self._initial_lines,
+                    _preload_content=False,
+                )
+            except client.exceptions.ApiException as e:
+                if e.status == 404:
+                    logger.info(
+                        "pod %s/%s is gone; no longer following", self.namespace, self.pod_name
+                    )
+                    self._stopped.set()
+                    break
+                # e.g. 400 while the container is still waiting to start.
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, 30)
+                continue
+            except Exception:
+                logger.exception("following %s/%s failed", self.namespace, self.pod_name)
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, 30)
+                continue
+            with self._lock:
+                self._lines.clear()
+                self._bytes = self._received = 0
+                self._evicted = False
+                self._ready = True
+                self._backlog_done = False
+                self._last_data = time.monotonic()
+                self._resp = resp
+            backoff = 1
+            try:
+                for line in _iter_log_lines(resp):
+                    self._append(line)
+                    if time.monotonic() - self.last_used > FOLLOW_IDLE_SECONDS:
+                        self._stopped.set()
+                    if self._stopped.is_set():
+                        break
+            except Exception as e:
+                if not self._stopped.is_set():
+                    logger.info("log stream of %s/%s ended: %s", self.namespace, self.pod_name, e)
+            finally:
+                with self._lock:
+                    self._resp = None
+                resp.close()
+                resp.release_conn()
+            if self._stopped.is_set() or self._finished(core):
+                break
+            with self._lock:
+                self._ready = False
+            self._stopped.wait(backoff)
+
+    def _finished(self, core) -> bool:
+        """After a stream ended: True if the pod has completed, so its log is final."""
+        try:
+            pod = _read_json(
+                core.read_namespaced_pod(
+                    name=self.pod_name, namespace=self.namespace, _preload_content=False
+                )
+            )
+        except Exception:
+            return False
+        self.phase = (pod.get("status") or {}).get("phase")
+        # The buffer stays readable; a restarting container is followed again.
+        return self.phase in ("Succeeded", "Failed")
+
+    def _append(self, line: bytes):
+        with self._lock:
+            self._lines.append(line)
+            self._bytes += len(line)
+            self._received += 1
+            self._last_data = time.monotonic()
+            while self._bytes > self._max_bytes and self._lines:
+                self._bytes -= len(self._lines.popleft())
+                self._evicted = True
+
+
+def _iter_log_lines(resp):
+    """Yield the lines (as bytes, newline included) of a streamed log body."""
+    pending = b""
+    for chunk in resp.stream(_LOG_CHUNK_BYTES):
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line + b"\n"
+    if pending:
+        yield pending
+
+
+def _grep_lines(raw_lines, pattern, context_lines: int = 0) -> dict:
+    """
+    Keep only the log lines matching a compiled regex.
+
+    Each matching line is returned with up to ``context_lines`` lines before and after
+    it; non-adjacent groups are separated by "--" as with grep -C. Lines are
+    scanned one by one and only the selected ones are kept, so the output, not
+    the log, is bounded by LOG_MAX_BYTES.
+
+    Args:
+        raw_lines: Iterable of log lines as bytes, newline included.
+
+    Returns:
+        A dict with "logs" (the selected lines), "matches", "bytes_read" (bytes
+        scanned) and "truncated" (output cut at LOG_MAX_BYTES).
+    """
+    before = deque(maxlen=context_lines)
+    lines = []
+    size = 0
+    matches = 0
+    after = 0
+    last_kept = -1
+    bytes_read = 0
+    truncated = False
+
+    def keep(index, text):
+        nonlocal size, last_kept
+        if lines and index > last_kept + 1:
+            lines.append("--")
+        lines.append(text)
+        size += len(text) + 1
+        last_kept = index
+
+    for index, raw in enumerate(raw_lines):
+        bytes_read += len(raw)
+        text = raw.removesuffix(b"\n").decode("utf-8", errors="replace")
+        if pattern.search(text):
+            matches += 1
+            for offset, previous in enumerate(before, start=index - len(before)):
+                keep(offset, previous)
+            before.clear()
+            keep(index, text)
+            after = context_lines
+        elif after:
+            keep(index, text)
+            after -= 1
+        else:
+            before.append(text)
+        if size > LOG_MAX_BYTES:
+            truncated = True
+            break
+    return {
+        "logs": lines,
+        "matches": matches,
+        "bytes_read": bytes_read,
+        "truncated": truncated,
+    }
+
+
+def _grep_pod_log(core, pattern, context_lines: int = 0, limit_bytes=None, **kwargs) -> dict:
+    """
+    Stream one container's log through _grep_lines.
+
+    Returns:
+        The _grep_lines result for the log.
+    """
+    resp = core.read_namespaced_pod_log(limit_bytes=limit_bytes, _preload_content=False, **kwargs)
+    result = None
+    try:
+        result = _grep_lines(_iter_log_lines(resp), pattern, context_lines)
+    finally:
+        if result is not None and result["truncated"]:
+            resp.close()
+        resp.release_conn()
+    return result
+
+
+def _page(items: list, continue_token: Optional[str], remaining_item_count: Optional[int]) -> dict:
+    """Wrap one chunk of a paginated LIST with the cursor for the next chunk.
+
+    ``continue_token`` is None on the last page; pass it back unchanged (with
+    the same filters) to fetch the next one.
+    """
+    return {
+        "items": items,
+        "continue_token": continue_token or None,
+        "remaining_item_count": remaining_item_count,
+    }
+
+
+def _json_size(item) -> int:
+    """Size of ``item`` serialized as JSON, in bytes."""
+    return len(_dumps(item, default=str))
+
+
+def _group_counts(items: list, key) -> dict:
+    """Count items per group, largest first, folding the long tail into '<other>'."""
+    counts = Counter("<none>" if k is None else str(k) for k in map(key, items))
+    groups = dict(counts.most_common(_SUMMARY_TOP_GROUPS))
+    other = sum(counts.values()) - sum(groups.values())
+    if other:
+        groups["<other>"] = other
+    return groups
+
+
+def _apply_budget(items: list, max_bytes: Optional[int], group_by: dict) -> tuple:
+    """Keep the leading items whose JSON fits the response budget.
+
+    Sizes are added up item by item as the result is built, and measuring
+    stops at the first item that does not fit. Over budget, the kept items
+    come back with the total count and per-group counts of all items, keyed
+    by the names in ``group_by`` (name -> function of a result item).
+
+    Returns:
+        An (items, overflow) tuple; ``overflow`` is None when everything fit,
+        otherwise a dict to merge into the tool's response.
+    """
+    budget = RESPONSE_MAX_BYTES if max_bytes is None else max_bytes
+    if budget <= 0:
+        return items, None
+    size = 2  # The enclosing brackets.
+    for index, item in enumerate(items):
+        size += _json_size(item) + 1
+        if size > budget:
+            break
+    else:
+        return items, None
+    return items[:index], {
+        "truncated": True,
+        "returned_count": index,
+        "total_count": len(items),
+        "summary": {name: _group_counts(items, key) for name, key in group_by.items()},
+        "message": (
+            f"The full result exceeds the {budget}-byte response budget; only the first "
+            f"{index} of {len(items)} items are returned. Narrow the query (namespace, "
+            "selectors, fields) or page through it with limit/continue_token."
+        ),
+    }
+
+
+def _budgeted(items: list, max_bytes: Optional[int], group_by: dict):
+    """Return ``items`` if it fits the response budget, else the first page and a summary."""
+    kept, overflow = _apply_budget(items, max_bytes, group_by)
+    return kept if overflow is None else {"items": kept, **overflow}
+
+
+def _item_namespace(item: dict):
+    return item.get("namespace")
 
-# Lazy module-level singleton: the synchronous kubernetes client is created
-# once on first tool use, not at import time.
-_manager = None
 
+def _object_namespace(item: dict):
+    return (item.get("metadata") or {}).get("namespace")
 
-def _get_manager() -> "KubernetesManager":
-    """Return the shared KubernetesManager, creating it on first use."""
-    global _manager
-    if _manager is None:
-        _manager = KubernetesManager()
-    return _manager
+
+# One step of a field path: .name, ['quoted.key'], [0] or [*].
+_FIELD_TOKEN = re.compile(r"""\.?([^.\[\]]+)|\[\s*(?:'([^']*)'|"([^"]*)"|(\d+)|(\*))\s*\]""")
+_MISSING = object()
+
+
+def _parse_field_path(path: str) -> list:
+    """Parse a dotted or JSONPath-style field path into keys, indexes and '*'.
+
+    Accepts 'status.phase', 'spec.containers[*].image', 'spec.containers[0].name',
+    "metadata.labels['app.kubernetes.io/name']" and the JSONPath spellings
+    '$.metadata.name' / '{.metadata.name}'.
+    """
+    path = path.strip()
+    if path.startswith("{") and path.endswith("}"):
+        path = path[1:-1].strip()
+    if path.startswith("$"):
+        path = path[1:]
+    tokens = []
+    pos = 0
+    while pos < len(path):
+        match = _FIELD_TOKEN.match(path, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Invalid field path: {path!r}")
+        key, single, double, index, star = match.groups()
+        if index is not None:
+            tokens.append(int(index))
+        elif star is not None:
+            tokens.append("*")
+        else:
+            tokens.append(next(t for t in (key, single, double) if t is not None))
+        pos = match.end()
+    return tokens
+
+
+def _plain(value):
+    """Convert dynamic-client ResourceFields (and lists of them) to plain data."""
+    if isinstance(value, _resource.ResourceInstance):
+        return value.to_dict()
+    if isinstance(value, _resource.ResourceField):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+
+def _project_path(node, tokens):
+    """Extract one parsed path from node, keeping its nesting; _MISSING if absent."""
+    if not tokens:
+        return _plain(node)
+    token, rest = tokens[0], tokens[1:]
+    if isinstance(node, _resource.ResourceInstance):
+        node = node.attributes
+    if isinstance(token, str) and token != "*":
+        if isinstance(node, _resource.ResourceField):
+            child = node.__dict__.get(token, _MISSING)
+        elif isinstance(node, dict):
+            child = node.get(token, _MISSING)
+        else:
+            return _MISSING
+        if child is _MISSING:
+            return _MISSING
+        value = _project_path(child, rest)
+        return _MISSING if value is _MISSING else {token: value}
+    if not isinstance(node, (list, tuple)):
+        return _MISSING
+    if token == "*":
+        values = [_project_path(child, rest) for child in node]
+        return [None if v is _MISSING else v for v in values]
+    if token >= len(node):
+        return _MISSING
+    value = _project_path(node[token], rest)
+    if value is _MISSING:
+        return _MISSING
+    # Keep the element at its position, so it lines up with '*' paths when merged.
+    return [value if index == token else None for index in range(len(node))]
+
+
+def _merge(into, value):
+    """Deep-merge one projected path into the accumulated projection."""
+    if isinstance(into, dict) and isinstance(value, dict):
+        for key, child in value.items():
+            into[key] = _merge(into[key], child) if key in into else child
+        return into
+    if isinstance(into, list) and isinstance(value, list):
+        merged = [_merge(a, b) if b is not None else a for a, b in zip(into, value)]
+        longer = into if len(into) > len(value) else value
+        return merged + longer[len(merged) :]
+    return value
+
+
+def _project(obj, paths: list) -> dict:
+    """Build a dict holding only the parsed ``paths`` of a dynamic-client object.
+
+    Walks the object's fields directly, so the unrequested parts of spec/status
+    are never converted to dicts. Missing paths are simply omitted.
+    """
+    projected = {}
+    for tokens in paths:
+        value = _project_path(obj, tokens)
+        if value is not _MISSING:
+            projected = _merge(projected, value)
+    return projected
+
+
+def _field_values(node, tokens) -> list:
+    """Leaf values at one parsed path of a dynamic-client object.
+
+    Unlike _project_path this flattens: each '*' fans out over a list, and a
+    missing path yields no values rather than a placeholder.
+    """
+    if isinstance(node, _resource.ResourceInstance):
+        node = node.attributes
+    if not tokens:
+        return [_plain(node)]
+    token, rest = tokens[0], tokens[1:]
+    if isinstance(token, str) and token != "*":
+        if isinstance(node, _resource.ResourceField):
+            child = node.__dict__.get(token, _MISSING)
+        elif isinstance(node, dict):
+            child = node.get(token, _MISSING)
+        else:
+            return []
+        return [] if child is _MISSING or child is None else _field_values(child, rest)
+    if not isinstance(node, (list, tuple)):
+        return []
+    if token == "*":
+        return [value for child in node for value in _field_values(child, rest)]
+    return _field_values(node[token], rest) if token < len(node) else []
+
+
+# A summarize_resource filter: 'path', 'path==value', 'path!=value', 'path>=n', ...
+_WHERE = re.compile(r"^(?P<path>.+?)\s*(?:(?P<op>==|!=|>=|<=|=|>|<)\s*(?P<value>.*))?$")
+
+
+def _parse_where(expression: str):
+    """Parse one filter into a predicate over a dynamic-client object.
+
+    With '*' in the path the filter holds if any of the values matches.
+    A bare path holds if the field is present and truthy.
+    """
+    match = _WHERE.match(expression.strip())
+    if not match:
+        raise ValueError(f"Invalid filter: {expression!r}")
+    tokens = _parse_field_path(match["path"])
+    op, expected = match["op"], (match["value"] or "").strip()
+    if op is None:
+        return tokens, lambda values: any(values)
+    if op in ("=", "=="):
+        return tokens, lambda values: any(_as_text(v) == expected for v in values)
+    if op == "!=":
+        return tokens, lambda values: all(_as_text(v) != expected for v in values)
+    try:
+        bound = float(expected)
+    except ValueError:
+        raise ValueError(f"Invalid filter: {expression!r} compares with a non-number")
+    compare = {
+        ">": lambda v: v > bound,
+        "<": lambda v: v < bound,
+        ">=": lambda v: v >= bound,
+        "<=": lambda v: v <= bound,
+    }[op]
+    return tokens, lambda values: any(compare(v) for v in values if _is_number(v))
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _as_text(value) -> str:
+    """Render a field value for grouping and equality filters."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return str(value)
+
+
+# Secret fields that _sanitize strips (the annotations hold kubectl's copy of data).
+_SECRET_PATHS = (["data"], ["stringData"], ["metadata", "annotations"])
+
+
+def _check_secret_paths(kind: str, paths: list):
+    """Refuse field paths that would read Secret values (mirrors _sanitize).
+
+    A path is refused if it leads into one of _SECRET_PATHS or to an ancestor
+    of one, e.g. a bare 'metadata', since its value would contain it.
+    """
+    if kind != "Secret":
+        return
+    for tokens in paths:
+        for secret in _SECRET_PATHS:
+            if all(token in ("*", part) for token, part in zip(tokens, secret)):
+                raise ValueError("Secret data and annotations cannot be summarized")
 
 
 def _sanitize(obj_dict, kind):
@@ -91,67 +1944,485 @@ def _sanitize(obj_dict, kind):
       embeds the full original manifest (including the redacted values) when the
       Secret was created with client-side ``kubectl apply``.
 
-    This is the single chokepoint enforcing Secret redaction, so it cannot be
-    bypassed (e.g. via a generic ``get_resource(kind="Secret")`` call).
-    """
-    if not isinstance(obj_dict, dict):
-        return obj_dict
-    metadata = obj_dict.get("metadata")
-    if isinstance(metadata, dict):
-        metadata.pop("managedFields", None)
-    if kind == "Secret":
-        obj_dict.pop("data", None)
-        obj_dict.pop("stringData", None)
-        # kubectl client-side apply stores the full original manifest (incl.
-        # data/stringData) here, so drop it to avoid leaking Secret values.
-        if isinstance(metadata, dict):
-            annotations = metadata.get("annotations")
-            if isinstance(annotations, dict):
-                annotations.pop("kubectl.kubernetes.io/last-applied-configuration", None)
-    return obj_dict
+    This is the single chokepoint enforcing Secret redaction, so it cannot be
+    bypassed (e.g. via a generic ``get_resource(kind="Secret")`` call).
+    """
+    if not isinstance(obj_dict, dict):
+        return obj_dict
+    metadata = obj_dict.get("metadata")
+    if isinstance(metadata, dict):
+        metadata.pop("managedFields", None)
+    if kind == "Secret":
+        obj_dict.pop("data", None)
+        obj_dict.pop("stringData", None)
+        # kubectl client-side apply stores the full original manifest (incl.
+        # data/stringData) here, so drop it to avoid leaking Secret values.
+        if isinstance(metadata, dict):
+            annotations = metadata.get("annotations")
+            if isinstance(annotations, dict):
+                annotations.pop("kubectl.kubernetes.io/last-applied-configuration", None)
+    return obj_dict
+
+
+def _isoformat(value):
+    """Render an optional datetime as ISO 8601 (None stays None)."""
+    return value.isoformat() if value else None
+
+
+def _pod_summary(pod) -> dict:
+    """Summarize a V1Pod for list_pods."""
+    return {
+        "name": pod.metadata.name,
+        "namespace": pod.metadata.namespace,
+        "ip": pod.status.pod_ip,
+        "status": pod.status.phase,
+        "labels": pod.metadata.labels,
+        "creation_timestamp": _isoformat(pod.metadata.creation_timestamp),
+        "node": pod.spec.node_name,
+        "containers": [container.name for container in pod.spec.containers],
+    }
+
+
+def _deployment_summary(item) -> dict:
+    """Summarize a V1Deployment for list_deployments."""
+    return {
+        "name": item.metadata.name,
+        "namespace": item.metadata.namespace,
+        "replicas": item.spec.replicas,
+        "available_replicas": item.status.available_replicas,
+        "labels": item.metadata.labels,
+        "creation_timestamp": _isoformat(item.metadata.creation_timestamp),
+        "selector": (item.spec.selector.match_labels if item.spec.selector else None),
+    }
+
+
+def _service_summary(item) -> dict:
+    """Summarize a V1Service for list_services."""
+    ports = []
+    if item.spec.ports:
+        for port in item.spec.ports:
+            port_info = {
+                "name": port.name,
+                "port": port.port,
+                "target_port": port.target_port,
+                "protocol": port.protocol,
+            }
+            if port.node_port:
+                port_info["node_port"] = port.node_port
+            ports.append(port_info)
+
+    # Older generated clients spell the field external_i_ps.
+    external_ips = getattr(item.spec, "external_ips", None) or getattr(
+        item.spec, "external_i_ps", None
+    )
+
+    return {
+        "name": item.metadata.name,
+        "namespace": item.metadata.namespace,
+        "type": item.spec.type,
+        "cluster_ip": item.spec.cluster_ip,
+        "external_ips": external_ips,
+        "ports": ports,
+        "selector": item.spec.selector,
+        "creation_timestamp": _isoformat(item.metadata.creation_timestamp),
+    }
+
+
+def _namespace_summary(item) -> dict:
+    """Summarize a V1Namespace for list_namespaces."""
+    return {
+        "name": item.metadata.name,
+        "status": item.status.phase,
+        "creation_timestamp": _isoformat(item.metadata.creation_timestamp),
+    }
+
+
+def _event_summary(event) -> dict:
+    """Summarize a CoreV1Event for get_events."""
+    return {
+        "type": event.type,
+        "reason": event.reason,
+        "message": event.message,
+        "count": event.count,
+        "first_timestamp": _isoformat(event.first_timestamp),
+        "last_timestamp": _isoformat(event.last_timestamp),
+        "involved_object": {
+            "kind": event.involved_object.kind,
+            "name": event.involved_object.name,
+            "namespace": event.involved_object.namespace,
+        },
+        "source": {
+            "component": event.source.component if event.source else None,
+            "host": event.source.host if event.source else None,
+        },
+    }
+
+
+def _node_summary(item) -> dict:
+    """Summarize a V1Node for list_nodes."""
+    # Extract node status.
+    status = None
+    for condition in item.status.conditions:
+        if condition.type == "Ready":
+            status = "Ready" if condition.status == "True" else "NotReady"
+            break
+
+    # Extract node roles.
+    roles = [role for role in item.metadata.labels if "node-role.kubernetes.io" in role]
+    if not roles:
+        roles = ["<none>"]  # Handle nodes with no specific role label.
+
+    # Extract IP addresses.
+    addresses = {address.type: address.address for address in item.status.addresses}
+
+    node_info = item.status.node_info
+    return {
+        "name": item.metadata.name,
+        "status": status,
+        "roles": roles,
+        "addresses": addresses,
+        "capacity": {
+            "cpu": item.status.capacity.get("cpu"),
+            "memory": item.status.capacity.get("memory"),
+            "pods": item.status.capacity.get("pods"),
+        },
+        "allocatable": {
+            "cpu": item.status.allocatable.get("cpu"),
+            "memory": item.status.allocatable.get("memory"),
+            "pods": item.status.allocatable.get("pods"),
+        },
+        "node_info": {
+            "kubelet_version": node_info.kubelet_version,
+            "os_image": node_info.os_image,
+            "container_runtime_version": node_info.container_runtime_version,
+        },
+        "creation_timestamp": _isoformat(item.metadata.creation_timestamp),
+        "labels": item.metadata.labels,
+        "taints": (
+            [
+                {
+                    "key": taint.key,
+                    "value": taint.value,
+                    "effect": taint.effect,
+                }
+                for taint in item.spec.taints
+            ]
+            if item.spec.taints
+            else []
+        ),
+    }
+
+
+# Accept header asking the API server for metadata only (no spec/status), with a
+# plain JSON fallback for servers or aggregated APIs that do not support it.
+_METADATA_ONLY_ACCEPT = (
+    "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json"
+)
+
+
+def _metadata_only_headers() -> dict:
+    """Build fresh header_params for a metadata-only LIST (the client mutates them)."""
+    return {"Accept": _METADATA_ONLY_ACCEPT}
+
+
+def _rfc3339(value):
+    """Render an API timestamp string the way the typed tools render datetimes."""
+    if isinstance(value, str) and value.endswith("Z"):
+        return value[:-1] + "+00:00"
+    return value
+
+
+def _metadata_summary(item) -> dict:
+    """Summarize a PartialObjectMetadata item for the typed tools' metadata_only mode."""
+    metadata = item.metadata
+    return {
+        "name": metadata.name,
+        "namespace": metadata.namespace,
+        "labels": _plain(metadata.labels),
+        "owner_references": [
+            {"kind": ref.kind, "name": ref.name, "controller": ref.controller}
+            for ref in metadata.ownerReferences or []
+        ],
+        "creation_timestamp": _rfc3339(metadata.creationTimestamp),
+    }
+
+
+def _metadata_listing(
+    api_version: str,
+    kind: str,
+    namespace: Optional[str] = None,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+    context: Optional[str] = None,
+    max_response_bytes: Optional[int] = None,
+):
+    """List only object metadata for a typed list tool (PartialObjectMetadataList)."""
+    api = _get_manager(context).get_dynamic_api().resources.get(api_version=api_version, kind=kind)
+    res = api.get(
+        namespace=namespace,
+        limit=limit,
+        _continue=continue_token,
+        header_params=_metadata_only_headers(),
+    )
+    summaries = [_metadata_summary(item) for item in res.items]
+    if limit is not None or continue_token is not None:
+        return _page(summaries, res.metadata["continue"], res.metadata["remainingItemCount"])
+    return _budgeted(summaries, max_response_bytes, {"by_namespace": _item_namespace})
+
+
+# Raw-JSON counterparts of the summaries above. The typed list tools fetch with
+# _preload_content=False and read these straight from the parsed response,
+# skipping model construction; the output is identical to the model versions.
+
+
+def _pod_summary_raw(pod: dict) -> dict:
+    """Summarize a raw Pod dict for list_pods."""
+    metadata = pod.get("metadata") or {}
+    spec = pod.get("spec") or {}
+    status = pod.get("status") or {}
+    return {
+        "name": metadata.get("name"),
+        "namespace": metadata.get("namespace"),
+        "ip": status.get("podIP"),
+        "status": status.get("phase"),
+        "labels": metadata.get("labels"),
+        "creation_timestamp": _rfc3339(metadata.get("creationTimestamp")),
+        "node": spec.get("nodeName"),
+        "containers": [container.get("name") for container in spec.get("containers") or []],
+    }
+
+
+def _deployment_summary_raw(item: dict) -> dict:
+    """Summarize a raw Deployment dict for list_deployments."""
+    metadata = item.get("metadata") or {}
+    spec = item.get("spec") or {}
+    selector = spec.get("selector")
+    return {
+        "name": metadata.get("name"),
+        "namespace": metadata.get("namespace"),
+        "replicas": spec.get("replicas"),
+        "available_replicas": (item.get("status") or {}).get("availableReplicas"),
+        "labels": metadata.get("labels"),
+        "creation_timestamp": _rfc3339(metadata.get("creationTimestamp")),
+        "selector": selector.get("matchLabels") if selector else None,
+    }
+
+
+def _service_summary_raw(item: dict) -> dict:
+    """Summarize a raw Service dict for list_services."""
+    metadata = item.get("metadata") or {}
+    spec = item.get("spec") or {}
+    ports = []
+    for port in spec.get("ports") or []:
+        port_info = {
+            "name": port.get("name"),
+            "port": port.get("port"),
+            "target_port": port.get("targetPort"),
+            "protocol": port.get("protocol"),
+        }
+        if port.get("nodePort"):
+            port_info["node_port"] = port["nodePort"]
+        ports.append(port_info)
+    return {
+        "name": metadata.get("name"),
+        "namespace": metadata.get("namespace"),
+        "type": spec.get("type"),
+        "cluster_ip": spec.get("clusterIP"),
+        "external_ips": spec.get("externalIPs"),
+        "ports": ports,
+        "selector": spec.get("selector"),
+        "creation_timestamp": _rfc3339(metadata.get("creationTimestamp")),
+    }
+
+
+def _namespace_summary_raw(item: dict) -> dict:
+    """Summarize a raw Namespace dict for list_namespaces."""
+    metadata = item.get("metadata") or {}
+    return {
+        "name": metadata.get("name"),
+        "status": (item.get("status") or {}).get("phase"),
+        "creation_timestamp": _rfc3339(metadata.get("creationTimestamp")),
+    }
+
+
+def _node_summary_raw(item: dict) -> dict:
+    """Summarize a raw Node dict for list_nodes."""
+    metadata = item.get("metadata") or {}
+    status = item.get("status") or {}
+    labels = metadata.get("labels")
+
+    ready = None
+    for condition in status.get("conditions") or []:
+        if condition.get("type") == "Ready":
+            ready = "Ready" if condition.get("status") == "True" else "NotReady"
+            break
+
+    roles = [role for role in labels or {} if "node-role.kubernetes.io" in role]
+    capacity = status.get("capacity") or {}
+    allocatable = status.get("allocatable") or {}
+    node_info = status.get("nodeInfo") or {}
+    taints = (item.get("spec") or {}).get("taints") or []
+    return {
+        "name": metadata.get("name"),
+        "status": ready,
+        "roles": roles or ["<none>"],
+        "addresses": {a.get("type"): a.get("address") for a in status.get("addresses") or []},
+        "capacity": {
+            "cpu": capacity.get("cpu"),
+            "memory": capacity.get("memory"),
+            "pods": capacity.get("pods"),
+        },
+        "allocatable": {
+            "cpu": allocatable.get("cpu"),
+            "memory": allocatable.get("memory"),
+            "pods": allocatable.get("pods"),
+        },
+        "node_info": {
+            "kubelet_version": node_info.get("kubeletVersion"),
+            "os_image": node_info.get("osImage"),
+            "container_runtime_version": node_info.get("containerRuntimeVersion"),
+        },
+        "creation_timestamp": _rfc3339(metadata.get("creationTimestamp")),
+        "labels": labels,
+        "taints": [
+            {"key": taint.get("key"), "value": taint.get("value"), "effect": taint.get("effect")}
+            for taint in taints
+        ],
+    }
+
+
+def _event_summary_raw(event: dict) -> dict:
+    """Summarize a raw Event dict for watch_events_since."""
+    involved = event.get("involvedObject") or {}
+    source = event.get("source")
+    return {
+        "type": event.get("type"),
+        "reason": event.get("reason"),
+        "message": event.get("message"),
+        "count": event.get("count"),
+        "first_timestamp": _rfc3339(event.get("firstTimestamp")),
+        "last_timestamp": _rfc3339(event.get("lastTimestamp")),
+        "involved_object": {
+            "kind": involved.get("kind"),
+            "name": involved.get("name"),
+            "namespace": involved.get("namespace"),
+        },
+        "source": {
+            "component": source.get("component") if source else None,
+            "host": source.get("host") if source else None,
+        },
+    }
+
+
+def _listable_api_resources(discovered, resource_list_type=None) -> list:
+    """Reduce discovered API resources to the listable kinds, one per (group_version, kind)."""
+    resource_list_type = resource_list_type or _resource.ResourceList
+    resources = []
+    seen = set()
+    for resource in discovered:
+        # Skip synthetic ResourceList entries (PodList, SecretList, ...).
+        # They inherit the base 'list' verb but ResourceList.get() expects a
+        # body, so list_resource(kind="PodList") would fail. Don't advertise.
+        if isinstance(resource, resource_list_type):
+            continue
+        verbs = resource.verbs or []
+        if "list" not in verbs:
+            continue
+        key = (resource.group_version, resource.kind)
+        if key in seen:
+            continue
+        seen.add(key)
+        resources.append(
+            {
+                "group_version": resource.group_version,
+                "kind": resource.kind,
+                "namespaced": resource.namespaced,
+                "verbs": list(verbs),
+            }
+        )
+    return resources
 
 
 @mcp.tool(
     description="List all pods in a namespace or across all namespaces",
     annotations=_ro("List Pods"),
 )
-def list_pods(namespace: Optional[str] = None):
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def list_pods(
+    namespace: Optional[str] = None,
+    fresh: bool = False,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+    metadata_only: bool = False,
+    max_response_bytes: Optional[int] = None,
+    context: Optional[str] = None,
+):
     """
     List all pods in a specified namespace or across all namespaces if none is specified.
 
     Args:
         namespace (str, optional): The Kubernetes namespace to list pods from.
                                   If not provided, pods from all namespaces will be listed.
+        fresh (bool, optional): Bypass the watch cache (when enabled) and query the
+                               API server directly. Default is False.
+        limit (int, optional): Maximum number of pods to return in one page. Paged
+                              calls always go to the API server.
+        continue_token (str, optional): Cursor returned by a previous paged call.
+        metadata_only (bool, optional): Return only name, namespace, labels, owner
+                                       references and creation timestamp, fetched as
+                                       PartialObjectMetadata so the API server skips
+                                       spec and status. Default is False.
+        max_response_bytes (int, optional): Response budget, in bytes of JSON, for this
+                                           call; 0 disables it. Defaults to the
+                                           server-wide budget (1 MiB).
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
 
     Returns:
         A list of pod dicts including name, namespace, ip, status, labels, node, and containers.
+        When limit or continue_token is given, a dict with the page under "items" plus
+        "continue_token" (None on the last page) and "remaining_item_count".
+        If the list exceeds the response budget, a dict with the first "items",
+        "truncated", "returned_count", "total_count" and a "summary" of counts per
+        namespace and status instead.
     """
     try:
-        core = _get_manager().get_core_api()
-        if namespace:
-            ret = core.list_namespaced_pod(namespace=namespace, watch=False)
-        else:
-            ret = core.list_pod_for_all_namespaces(watch=False)
-
-        pods = []
-        for i in ret.items:
-            pods.append(
-                {
-                    "name": i.metadata.name,
-                    "namespace": i.metadata.namespace,
-                    "ip": i.status.pod_ip,
-                    "status": i.status.phase,
-                    "labels": i.metadata.labels,
-                    "creation_timestamp": (
-                        i.metadata.creation_timestamp.isoformat()
-                        if i.metadata.creation_timestamp
-                        else None
-                    ),
-                    "node": i.spec.node_name,
-                    "containers": [container.name for container in i.spec.containers],
-                }
+        if metadata_only:
+            return _metadata_listing(
+                "v1", "Pod", namespace, limit, continue_token, context, max_response_bytes
             )
-        return pods
+        manager = _get_manager(context)
+        paged = limit is not None or continue_token is not None
+        ret = None
+        items = None if paged else _from_watch_cache(manager, "pods", namespace, fresh)
+        if items is None:
+            core = manager.get_core_api()
+            if namespace:
+                resp = core.list_namespaced_pod(
+                    namespace=namespace,
+                    watch=False,
+                    limit=limit,
+                    _continue=continue_token,
+                    _preload_content=False,
+                )
+            else:
+                resp = core.list_pod_for_all_namespaces(
+                    watch=False, limit=limit, _continue=continue_token, _preload_content=False
+                )
+            ret = _read_json(resp)
+            items = ret.get("items") or []
+
+        pods = [_pod_summary_raw(i) for i in items]
+        if paged:
+            list_meta = ret.get("metadata") or {}
+            return _page(pods, list_meta.get("continue"), list_meta.get("remainingItemCount"))
+        return _budgeted(
+            pods,
+            max_response_bytes,
+            {"by_namespace": _item_namespace, "by_status": lambda pod: pod["status"]},
+        )
     except Exception as e:
         return {"error": str(e)}
 
@@ -160,43 +2431,60 @@ def list_pods(namespace: Optional[str] = None):
     description="List all deployments in a specified namespace",
     annotations=_ro("List Deployments"),
 )
-def list_deployments(namespace: Optional[str] = None):
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def list_deployments(
+    namespace: Optional[str] = None,
+    fresh: bool = False,
+    metadata_only: bool = False,
+    max_response_bytes: Optional[int] = None,
+    context: Optional[str] = None,
+):
     """
     List all deployments in a specified namespace or across all namespaces if none is specified.
 
     Args:
         namespace (str, optional): The Kubernetes namespace to list deployments from.
                                   If not provided, deployments from all namespaces will be listed.
+        fresh (bool, optional): Bypass the watch cache (when enabled) and query the
+                               API server directly. Default is False.
+        metadata_only (bool, optional): Return only name, namespace, labels, owner
+                                       references and creation timestamp, fetched as
+                                       PartialObjectMetadata so the API server skips
+                                       spec and status. Default is False.
+        max_response_bytes (int, optional): Response budget, in bytes of JSON, for this
+                                           call; 0 disables it. Defaults to the
+                                           server-wide budget (1 MiB).
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
 
     Returns:
         A list of deployment dicts including name, namespace, replicas, available_replicas,
         labels, and selector.
+        If the list exceeds the response budget, a dict with the first "items",
+        "truncated", "returned_count", "total_count" and a "summary" of counts per
+        namespace instead.
     """
     try:
-        apps = _get_manager().get_apps_api()
-        if namespace:
-            ret = apps.list_namespaced_deployment(namespace=namespace, watch=False)
-        else:
-            ret = apps.list_deployment_for_all_namespaces(watch=False)
-
-        deployments = []
-        for item in ret.items:
-            deployments.append(
-                {
-                    "name": item.metadata.name,
-                    "namespace": item.metadata.namespace,
-                    "replicas": item.spec.replicas,
-                    "available_replicas": item.status.available_replicas,
-                    "labels": item.metadata.labels,
-                    "creation_timestamp": (
-                        item.metadata.creation_timestamp.isoformat()
-                        if item.metadata.creation_timestamp
-                        else None
-                    ),
-                    "selector": (item.spec.selector.match_labels if item.spec.selector else None),
-                }
+        if metadata_only:
+            return _metadata_listing(
+                "apps/v1", "Deployment", namespace, None, None, context, max_response_bytes
             )
-        return deployments
+        manager = _get_manager(context)
+        items = _from_watch_cache(manager, "deployments", namespace, fresh)
+        if items is None:
+            apps = manager.get_apps_api()
+            if namespace:
+                resp = apps.list_namespaced_deployment(
+                    namespace=namespace, watch=False, _preload_content=False
+                )
+            else:
+                resp = apps.list_deployment_for_all_namespaces(watch=False, _preload_content=False)
+            items = _read_json(resp).get("items") or []
+
+        deployments = [_deployment_summary_raw(item) for item in items]
+        return _budgeted(deployments, max_response_bytes, {"by_namespace": _item_namespace})
     except Exception as e:
         return {"error": str(e)}
 
@@ -205,12 +2493,17 @@ def list_deployments(namespace: Optional[str] = None):
     description="Get logs from a pod in a specified namespace",
     annotations=_ro("Get Pod Logs"),
 )
+@metrics.instrumented
+@_coalesced
+@_holding_managers
 def get_pod_logs(
     namespace: str,
     pod_name: str,
     container: Optional[str] = None,
     tail_lines: Optional[int] = None,
     previous: bool = False,
+    limit_bytes: Optional[int] = None,
+    context: Optional[str] = None,
 ):
     """
     Get logs from a pod in a specified namespace.
@@ -225,12 +2518,31 @@ def get_pod_logs(
                                    If not specified, all logs will be returned.
         previous (bool, optional): If true, return logs from a previous instantiation of the
                                   container. Default is False.
+        limit_bytes (int, optional): Maximum number of log bytes to return. Capped by the
+                                    server-wide limit (1 MiB by default).
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
 
     Returns:
-        A dict containing the pod logs and metadata.
+        A dict containing the pod logs and metadata. "truncated" is true when the
+        log was cut at the byte limit, and "bytes_read" is the number of bytes kept.
     """
     try:
-        core = _get_manager().get_core_api()
+        core = _get_manager(context).get_core_api()
+
+        # A followed log (see follow_logs) is answered from its buffer.
+        tail = None if previous else _followed_log(context, namespace, pod_name, container)
+        buffered = _read_followed_log(tail, tail_lines, limit_bytes) if tail else None
+        if buffered is not None:
+            return {
+                "pod_name": pod_name,
+                "namespace": namespace,
+                "container": tail.container,
+                **buffered,
+                "container_names": tail.container_names,
+                "status": tail.phase,
+                "followed": True,
+            }
 
         # Get pod information to check if it exists and get container names.
         pod_info = core.read_namespaced_pod(name=pod_name, namespace=namespace)
@@ -240,7 +2552,9 @@ def get_pod_logs(
         if not container and container_names:
             container = container_names[0]
 
-        logs = core.read_namespaced_pod_log(
+        logs, bytes_read, truncated = _read_pod_log(
+            core,
+            limit_bytes,
             name=pod_name,
             namespace=namespace,
             container=container,
@@ -255,6 +2569,8 @@ def get_pod_logs(
             "logs": logs.split("\n"),
             "container_names": container_names,
             "status": pod_info.status.phase,
+            "truncated": truncated,
+            "bytes_read": bytes_read,
         }
 
     except client.exceptions.ApiException as e:
@@ -269,59 +2585,64 @@ def get_pod_logs(
     description="List all services in a namespace or across all namespaces",
     annotations=_ro("List Services"),
 )
-def list_services(namespace: Optional[str] = None):
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def list_services(
+    namespace: Optional[str] = None,
+    fresh: bool = False,
+    metadata_only: bool = False,
+    max_response_bytes: Optional[int] = None,
+    context: Optional[str] = None,
+):
     """
     List all services in a specified namespace or across all namespaces if none is specified.
 
     Args:
         namespace (str, optional): The Kubernetes namespace to list services from.
                                   If not provided, services from all namespaces will be listed.
+        fresh (bool, optional): Bypass the watch cache (when enabled) and query the
+                               API server directly. Default is False.
+        metadata_only (bool, optional): Return only name, namespace, labels, owner
+                                       references and creation timestamp, fetched as
+                                       PartialObjectMetadata so the API server skips
+                                       spec and status. Default is False.
+        max_response_bytes (int, optional): Response budget, in bytes of JSON, for this
+                                           call; 0 disables it. Defaults to the
+                                           server-wide budget (1 MiB).
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
 
     Returns:
         A list of service dicts including name, namespace, type, cluster_ip, external_ips,
         ports, and selector.
+        If the list exceeds the response budget, a dict with the first "items",
+        "truncated", "returned_count", "total_count" and a "summary" of counts per
+        namespace and type instead.
     """
     try:
-        core = _get_manager().get_core_api()
-        if namespace:
-            ret = core.list_namespaced_service(namespace=namespace, watch=False)
-        else:
-            ret = core.list_service_for_all_namespaces(watch=False)
-
-        services = []
-        for item in ret.items:
-            ports = []
-            if item.spec.ports:
-                for port in item.spec.ports:
-                    port_info = {
-                        "name": port.name,
-                        "port": port.port,
-                        "target_port": port.target_port,
-                        "protocol": port.protocol,
-                    }
-                    if port.node_port:
-                        port_info["node_port"] = port.node_port
-                    ports.append(port_info)
-
-            external_ips = item.spec.external_i_ps if hasattr(item.spec, "external_i_ps") else None
-
-            services.append(
-                {
-                    "name": item.metadata.name,
-                    "namespace": item.metadata.namespace,
-                    "type": item.spec.type,
-                    "cluster_ip": item.spec.cluster_ip,
-                    "external_ips": external_ips,
-                    "ports": ports,
-                    "selector": item.spec.selector,
-                    "creation_timestamp": (
-                        item.metadata.creation_timestamp.isoformat()
-                        if item.metadata.creation_timestamp
-                        else None
-                    ),
-                }
+        if metadata_only:
+            return _metadata_listing(
+                "v1", "Service", namespace, None, None, context, max_response_bytes
             )
-        return services
+        manager = _get_manager(context)
+        items = _from_watch_cache(manager, "services", namespace, fresh)
+        if items is None:
+            core = manager.get_core_api()
+            if namespace:
+                resp = core.list_namespaced_service(
+                    namespace=namespace, watch=False, _preload_content=False
+                )
+            else:
+                resp = core.list_service_for_all_namespaces(watch=False, _preload_content=False)
+            items = _read_json(resp).get("items") or []
+
+        services = [_service_summary_raw(item) for item in items]
+        return _budgeted(
+            services,
+            max_response_bytes,
+            {"by_namespace": _item_namespace, "by_type": lambda service: service["type"]},
+        )
     except Exception as e:
         return {"error": str(e)}
 
@@ -330,30 +2651,50 @@ def list_services(namespace: Optional[str] = None):
     description="List all namespaces in the cluster",
     annotations=_ro("List Namespaces"),
 )
-def list_namespaces():
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def list_namespaces(
+    fresh: bool = False,
+    metadata_only: bool = False,
+    max_response_bytes: Optional[int] = None,
+    context: Optional[str] = None,
+):
     """
     List all namespaces in the Kubernetes cluster.
 
+    Args:
+        fresh (bool, optional): Bypass the watch cache (when enabled) and query the
+                               API server directly. Default is False.
+        metadata_only (bool, optional): Return only name, namespace, labels, owner
+                                       references and creation timestamp, fetched as
+                                       PartialObjectMetadata so the API server skips
+                                       spec and status. Default is False.
+        max_response_bytes (int, optional): Response budget, in bytes of JSON, for this
+                                           call; 0 disables it. Defaults to the
+                                           server-wide budget (1 MiB).
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
+
     Returns:
         A list of namespace dicts including name, status, and creation_timestamp.
+        If the list exceeds the response budget, a dict with the first "items",
+        "truncated", "returned_count", "total_count" and a "summary" of counts per
+        status instead.
     """
     try:
-        ret = _get_manager().get_core_api().list_namespace(watch=False)
-
-        namespaces = []
-        for item in ret.items:
-            namespaces.append(
-                {
-                    "name": item.metadata.name,
-                    "status": item.status.phase,
-                    "creation_timestamp": (
-                        item.metadata.creation_timestamp.isoformat()
-                        if item.metadata.creation_timestamp
-                        else None
-                    ),
-                }
+        if metadata_only:
+            return _metadata_listing(
+                "v1", "Namespace", None, None, None, context, max_response_bytes
             )
-        return namespaces
+        manager = _get_manager(context)
+        cached = _from_watch_cache(manager, "namespaces", fresh=fresh)
+        if cached is not None:
+            namespaces = [_namespace_summary_raw(item) for item in cached]
+        else:
+            items = manager.get_core_api().list_namespace(watch=False).items
+            namespaces = [_namespace_summary(item) for item in items]
+        return _budgeted(namespaces, max_response_bytes, {"by_status": lambda ns: ns["status"]})
     except Exception as e:
         return {"error": str(e)}
 
@@ -362,7 +2703,17 @@ def list_namespaces():
     description="Get Kubernetes events from the cluster for a specific namespace or all namespaces",
     annotations=_ro("Get Events"),
 )
-def get_events(namespace: Optional[str] = None, field_selector: Optional[str] = None):
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def get_events(
+    namespace: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+    max_response_bytes: Optional[int] = None,
+    context: Optional[str] = None,
+):
     """
     Get Kubernetes events from the cluster for a specific namespace or all namespaces.
 
@@ -371,47 +2722,165 @@ def get_events(namespace: Optional[str] = None, field_selector: Optional[str] =
                                   If not provided, events from all namespaces will be returned.
         field_selector (str, optional): Selector to restrict the list of returned events by field.
                                        For example 'involvedObject.name=my-pod'.
+        limit (int, optional): Maximum number of events to return in one page.
+        continue_token (str, optional): Cursor returned by a previous paged call.
+        max_response_bytes (int, optional): Response budget, in bytes of JSON, for this
+                                           call; 0 disables it. Defaults to the
+                                           server-wide budget (1 MiB).
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
 
     Returns:
-        A dict containing the requested namespace, field_selector, and a list of events.
+        A dict containing the requested namespace, field_selector, a list of events, and
+        "continue_token" / "remaining_item_count" for fetching the next page.
+        If an unpaged result exceeds the response budget, only the first events are
+        kept and "truncated", "returned_count", "total_count" and a "summary" of
+        counts per namespace, type and reason are added.
     """
     try:
-        core = _get_manager().get_core_api()
+        core = _get_manager(context).get_core_api()
         if namespace:
-            events = core.list_namespaced_event(namespace=namespace, field_selector=field_selector)
+            events = core.list_namespaced_event(
+                namespace=namespace,
+                field_selector=field_selector,
+                limit=limit,
+                _continue=continue_token,
+            )
         else:
-            events = core.list_event_for_all_namespaces(field_selector=field_selector)
+            events = core.list_event_for_all_namespaces(
+                field_selector=field_selector, limit=limit, _continue=continue_token
+            )
 
-        event_list = []
-        for event in events.items:
-            event_list.append(
+        event_list = [_event_summary(event) for event in events.items]
+        overflow = None
+        if limit is None and continue_token is None:
+            event_list, overflow = _apply_budget(
+                event_list,
+                max_response_bytes,
                 {
-                    "type": event.type,
-                    "reason": event.reason,
-                    "message": event.message,
-                    "count": event.count,
-                    "first_timestamp": (
-                        event.first_timestamp.isoformat() if event.first_timestamp else None
-                    ),
-                    "last_timestamp": (
-                        event.last_timestamp.isoformat() if event.last_timestamp else None
-                    ),
-                    "involved_object": {
-                        "kind": event.involved_object.kind,
-                        "name": event.involved_object.name,
-                        "namespace": event.involved_object.namespace,
-                    },
-                    "source": {
-                        "component": event.source.component if event.source else None,
-                        "host": event.source.host if event.source else None,
-                    },
-                }
+                    "by_namespace": lambda event: event["involved_object"]["namespace"],
+                    "by_type": lambda event: event["type"],
+                    "by_reason": lambda event: event["reason"],
+                },
             )
 
         return {
             "namespace": namespace,
             "field_selector": field_selector,
             "events": event_list,
+            "continue_token": events.metadata._continue or None,
+            "remaining_item_count": events.metadata.remaining_item_count,
+            **(overflow or {}),
+        }
+    except Exception as e:
+        return {"error": f"Error retrieving events: {str(e)}"}
+
+
+@mcp.tool(
+    description=(
+        "Get only the Kubernetes events added, modified or deleted since a cursor returned "
+        "by a previous call, instead of the whole event list. Call without a cursor first."
+    ),
+    annotations=_ro("Watch Events Since"),
+)
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def watch_events_since(
+    cursor: Optional[str] = None,
+    namespace: Optional[str] = None,
+    limit: int = 1000,
+    max_response_bytes: Optional[int] = None,
+    context: Optional[str] = None,
+):
+    """
+    Poll for event changes: return the events changed after ``cursor``.
+
+    Served from a bounded ring buffer kept current by one WATCH on events per
+    cluster, started by the first call. Without a cursor, or when the cursor
+    is older than the buffer (or the watch had to relist since), every current
+    event is returned with "reset": true instead, and the caller should replace
+    what it has.
+
+    Args:
+        cursor (str, optional): The "cursor" of a previous call (a resourceVersion).
+        namespace (str, optional): Only return events of this namespace.
+        limit (int, optional): Maximum number of changes to return. If there are more,
+                              "more" is true and the cursor resumes after the last
+                              one returned. Default is 1000.
+        max_response_bytes (int, optional): Response budget, in bytes of JSON, of a
+                                           reset; 0 disables it. Defaults to the
+                                           server-wide budget (1 MiB).
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
+
+    Returns:
+        A dict with "cursor" for the next call, "reset", "more" and "events": per
+        change the event summary plus "change" (ADDED, MODIFIED or DELETED) and
+        "resource_version". A reset lists the current events (without "change"),
+        budgeted like get_events. Or a dict with an "error" key.
+    """
+    try:
+        since = None
+        if cursor is not None:
+            since = _version_number(cursor)
+            if since is None:
+                return {"error": f"Invalid cursor: {cursor!r}"}
+        manager = _get_manager(context)
+        feed = manager.get_event_feed()
+        if feed is None:
+            # A snapshot has no watch: every call is a reset.
+            listed = _read_json(
+                manager.get_core_api().list_event_for_all_namespaces(_preload_content=False)
+            )
+            next_cursor = listed["metadata"].get("resourceVersion")
+            current = [
+                event
+                for event in listed.get("items") or []
+                if not namespace or event["metadata"].get("namespace") == namespace
+            ]
+            changes = None
+        else:
+            # The cursor is read before the events, so nothing between is lost; a
+            # change listed now may come again as a change on the next call.
+            next_cursor = feed.cursor()
+            changes = feed.changes(since) if since is not None else None
+            current = feed.current(namespace) if changes is None else None
+
+        if changes is None:
+            events, overflow = _apply_budget(
+                [_event_summary_raw(event) for event in current],
+                max_response_bytes,
+                {
+                    "by_namespace": lambda event: event["involved_object"]["namespace"],
+                    "by_type": lambda event: event["type"],
+                    "by_reason": lambda event: event["reason"],
+                },
+            )
+            return {
+                "cursor": str(next_cursor) if next_cursor is not None else None,
+                "reset": True,
+                "more": False,
+                "events": events,
+                **(overflow or {}),
+            }
+
+        if changes:
+            next_cursor = max(next_cursor, changes[-1][0])
+        if namespace:
+            changes = [c for c in changes if c[2]["metadata"].get("namespace") == namespace]
+        more = len(changes) > limit
+        if more:
+            changes = changes[:limit]
+            next_cursor = changes[-1][0]
+        return {
+            "cursor": str(next_cursor),
+            "reset": False,
+            "more": more,
+            "events": [
+                {**_event_summary_raw(obj), "change": event_type, "resource_version": str(version)}
+                for version, event_type, obj in changes
+            ],
         }
     except Exception as e:
         return {"error": f"Error retrieving events: {str(e)}"}
@@ -421,6 +2890,9 @@ def get_events(namespace: Optional[str] = None, field_selector: Optional[str] =
     description="Get logs from pods, deployments, jobs, or resources matching a label selector",
     annotations=_ro("Get Logs"),
 )
+@metrics.instrumented
+@_coalesced
+@_holding_managers
 def get_logs(
     resource_type: str,
     namespace: Optional[str] = None,
@@ -430,12 +2902,27 @@ def get_logs(
     tail: Optional[int] = None,
     since_seconds: Optional[int] = None,
     timestamps: bool = False,
+    max_concurrency: Optional[int] = None,
+    pod_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    limit_bytes: Optional[int] = None,
+    pattern: Optional[str] = None,
+    context_lines: int = 0,
+    max_response_bytes: Optional[int] = None,
+    context: Optional[str] = None,
 ):
     """
     Get logs from pods, deployments, jobs, or resources matching a label selector.
 
+    Logs of the matching pods are fetched in parallel. Pods whose logs are not
+    read within the deadline are reported with an "error" entry while the rest
+    are still returned. The log lines of all pods together are capped by the
+    response budget; pods read after it runs out return fewer lines or none.
+
     Args:
-        resource_type (str): Type of resource to get logs from ('pod', 'deployment', 'job', etc.)
+        resource_type (str): Type of resource to get logs from: 'pod', or a workload
+                            ('deployment', 'replicaset', 'statefulset', 'daemonset',
+                            'job', 'cronjob'), whose pods are found by ownerReferences.
         namespace (str, optional): The Kubernetes namespace. If not provided and name is
                                   specified, uses the 'default' namespace. If neither name nor
                                   namespace is provided, searches across all namespaces.
@@ -449,216 +2936,647 @@ def get_logs(
         since_seconds (int, optional): Return logs newer than a relative duration in seconds.
         timestamps (bool, optional): Include timestamps at the beginning of each line.
                                   Default is False.
+        max_concurrency (int, optional): Maximum number of pods read in parallel.
+                                        Default is 10.
+        pod_timeout (float, optional): Timeout in seconds for each pod's log request.
+                                      Default is 30.
+        deadline (float, optional): Overall time budget in seconds for all pods.
+                                   Default is 120.
+        limit_bytes (int, optional): Maximum number of log bytes returned per pod. Capped
+                                    by the server-wide limit (1 MiB by default). With a
+                                    pattern, the number of bytes scanned per pod instead.
+        pattern (str, optional): Regular expression; only matching lines (plus context) are
+                                returned. Logs are scanned line by line as they stream in.
+        context_lines (int, optional): Number of lines kept before and after each match.
+                                      Default is 0.
+        max_response_bytes (int, optional): Budget, in bytes of log lines, for all pods
+                                           together. Defaults to the server-wide
+                                           response budget (1 MiB); 0 disables it.
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
+
+    Returns:
+        A dict containing the logs and metadata, with one entry per pod in the
+        order the pods were resolved. Each entry reports "truncated" and "bytes_read",
+        and "matches" when a pattern is given. When the response budget cut any
+        logs, the dict also has "truncated": True and a "message".
+    """
+    try:
+        manager = _get_manager(context)
+        core = manager.get_core_api()
+
+        # Validate input parameters.
+        if not name and not label_selector:
+            return {"error": "Either name or label_selector must be provided"}
+
+        # Set default namespace if name is provided but namespace is not.
+        if name and not namespace:
+            namespace = "default"
+
+        try:
+            regex = re.compile(pattern) if pattern else None
+        except re.error as e:
+            return {"error": f"Invalid pattern: {e}"}
+
+        # Resolve the set of pods to read logs from, as raw dicts.
+        pods_to_get_logs_from = []
+        owner_kind = _owner_kind(resource_type)
+
+        if resource_type.lower() == "pod" and name:
+            # Direct pod access by name.
+            try:
+                pod = _read_json(
+                    core.read_namespaced_pod(name=name, namespace=namespace, _preload_content=False)
+                )
+                pods_to_get_logs_from.append(pod)
+            except client.exceptions.ApiException as e:
+                if e.status == 404:
+                    return {"error": f"Pod {name} not found in namespace {namespace}"}
+                raise
+
+        elif owner_kind and name:
+            # Workloads map to their pods through ownerReferences, never labels,
+            # so pods of other workloads sharing a label are not picked up.
+            pods_to_get_logs_from = [
+                obj
+                for kind, obj in _owned_objects(manager, namespace, owner_kind, name)
+                if kind == "Pod"
+            ]
+            if not pods_to_get_logs_from and not _owner_exists(
+                manager, namespace, owner_kind, name
+            ):
+                return {"error": f"{owner_kind} {name} not found in namespace {namespace}"}
+
+        elif label_selector:
+            # Get pods by label selector.
+            if namespace:
+                resp = core.list_namespaced_pod(
+                    namespace=namespace, label_selector=label_selector, _preload_content=False
+                )
+            else:
+                resp = core.list_pod_for_all_namespaces(
+                    label_selector=label_selector, _preload_content=False
+                )
+            pods_to_get_logs_from.extend(_read_json(resp).get("items") or [])
+
+        else:
+            return {
+                "error": (
+                    f"Unsupported resource type: {resource_type} or missing required parameters"
+                )
+            }
+
+        # If no pods found.
+        if not pods_to_get_logs_from:
+            return {"error": "No pods found matching the specified criteria"}
+
+        # Get logs from all matching pods, a bounded number at a time.
+        request_timeout = pod_timeout or LOG_POD_TIMEOUT_SECONDS
+        max_bytes = RESPONSE_MAX_BYTES if max_response_bytes is None else max_response_bytes
+        budget = _LogBudget(max_bytes) if max_bytes > 0 else None
+
+        def read_logs(pod):
+            result = read_pod_logs(pod)
+            if budget is not None and "logs" in result:
+                kept = budget.take(result["logs"])
+                if len(kept) < len(result["logs"]):
+                    result["logs"] = kept
+                    result["truncated"] = True
+            return result
+
+        def read_pod_logs(pod):
+            metadata = pod.get("metadata") or {}
+            pod_name = metadata.get("name")
+            pod_namespace = metadata.get("namespace")
+            container_names = [
+                c.get("name") for c in (pod.get("spec") or {}).get("containers") or []
+            ]
+            phase = (pod.get("status") or {}).get("phase")
+
+            # If container is not specified, default to the first container.
+            container_to_use = container
+            if not container_to_use and container_names:
+                container_to_use = container_names[0]
+
+            log_options = dict(
+                name=pod_name,
+                namespace=pod_namespace,
+                container=container_to_use,
+                tail_lines=tail,
+                timestamps=timestamps,
+                since_seconds=since_seconds,
+                _request_timeout=request_timeout,
+            )
+            # A followed log (see follow_logs) is answered from its buffer, unless
+            # timestamps or a time window are asked for, which it does not keep.
+            followed = None
+            if not timestamps and since_seconds is None:
+                followed = _followed_log(context, pod_namespace, pod_name, container_to_use)
+            if followed is not None:
+                buffered = _read_followed_log(
+                    followed, tail, limit_bytes, regex, max(context_lines, 0)
+                )
+                if buffered is not None:
+                    return {
+                        "pod_name": pod_name,
+                        "namespace": pod_namespace,
+                        "container": container_to_use,
+                        **buffered,
+                        "container_names": container_names,
+                        "status": phase,
+                        "followed": True,
+                    }
+
+            try:
+                if regex:
+                    return {
+                        "pod_name": pod_name,
+                        "namespace": pod_namespace,
+                        "container": container_to_use,
+                        **_grep_pod_log(
+                            core, regex, max(context_lines, 0), limit_bytes, **log_options
+                        ),
+                        "container_names": container_names,
+                        "status": phase,
+                    }
+
+                # Read no more than the response budget has left.
+                cap = min(limit_bytes, LOG_MAX_BYTES) if limit_bytes else LOG_MAX_BYTES
+                read_limit = cap if budget is None else max(min(cap, budget.remaining), 1)
+                logs, bytes_read, truncated = _read_pod_log(core, read_limit, **log_options)
+                if truncated and read_limit < cap:
+                    budget.exhausted = True
+                return {
+                    "pod_name": pod_name,
+                    "namespace": pod_namespace,
+                    "container": container_to_use,
+                    "logs": logs.split("\n"),
+                    "container_names": container_names,
+                    "status": phase,
+                    "truncated": truncated,
+                    "bytes_read": bytes_read,
+                }
+            except Exception as e:
+                return {
+                    "pod_name": pod_name,
+                    "namespace": pod_namespace,
+                    "error": str(e),
+                }
+
+        total_deadline = deadline or LOG_DEADLINE_SECONDS
+        results = _fan_out(
+            read_logs,
+            pods_to_get_logs_from,
+            max_concurrency or LOG_CONCURRENCY,
+            total_deadline,
+            lambda pod: {
+                "pod_name": pod["metadata"].get("name"),
+                "namespace": pod["metadata"].get("namespace"),
+                "error": f"Timed out: logs not retrieved within {total_deadline}s deadline",
+            },
+        )
+
+        response = {
+            "resource_type": resource_type,
+            "name": name,
+            "namespace": namespace,
+            "label_selector": label_selector,
+            "results": results,
+        }
+        if budget is not None and budget.exhausted:
+            response["truncated"] = True
+            response["message"] = (
+                f"Logs were cut to fit the {max_bytes}-byte response budget. Narrow the "
+                "query (tail, since_seconds, pattern, container) or read fewer pods at a time."
+            )
+        return response
+
+    except Exception as e:
+        return {"error": f"Error retrieving logs: {str(e)}"}
+
+
+@mcp.tool(
+    description=(
+        "Keep streaming a pod's logs into a server-side buffer so later get_pod_logs and "
+        "get_logs calls on it are answered instantly, without API requests. Use for pods "
+        "under investigation; buffers are dropped once unread for a while."
+    ),
+    annotations=_ro("Follow Logs"),
+)
+@metrics.instrumented
+@_holding_managers
+def follow_logs(
+    namespace: str,
+    pod_name: str,
+    container: Optional[str] = None,
+    stop: bool = False,
+    context: Optional[str] = None,
+):
+    """
+    Start (or stop) following a pod's container logs into ring buffers.
+
+    Each followed container keeps one streaming log request open and its most
+    recent lines in a buffer capped at 1 MiB by default. get_pod_logs and
+    get_logs read from the buffer whenever it holds the requested lines (not
+    for previous logs, timestamps or since_seconds). A buffer nobody reads for
+    10 minutes (by default) is dropped along with its stream.
+
+    Args:
+        namespace (str): The Kubernetes namespace of the pod.
+        pod_name (str): The pod whose logs to follow.
+        container (str, optional): Follow only this container. Default is every
+                                  container of the pod.
+        stop (bool, optional): Stop following instead. Default is False.
+        context (str, optional): kubeconfig context (cluster) of the pod. Defaults to the
+                                current context.
+
+    Returns:
+        A dict with "following": every log followed in this context after the
+        call, with its buffered lines and bytes, or a dict with an "error" key.
+    """
+    try:
+        if SNAPSHOT_DIR:
+            return {"error": "follow_logs is not available when serving a snapshot"}
+        manager = _get_manager(context)
+        for tail in _sweep_log_tails():
+            tail.stop()
+        pod_key = (context, namespace, pod_name)
+
+        if stop:
+            with _log_tails_lock:
+                stopped = [
+                    _log_tails.pop(key)
+                    for key in list(_log_tails)
+                    if key[:3] == pod_key and container in (None, key[3])
+                ]
+            for tail in stopped:
+                tail.stop()
+        else:
+            pod = _read_json(
+                manager.get_core_api().read_namespaced_pod(
+                    name=pod_name, namespace=namespace, _preload_content=False
+                )
+            )
+            container_names = [
+                c.get("name") for c in (pod.get("spec") or {}).get("containers") or []
+            ]
+            if container and container not in container_names:
+                return {
+                    "error": f"Container {container} not found in pod {pod_name}; "
+                    f"containers: {', '.join(container_names)}"
+                }
+            phase = (pod.get("status") or {}).get("phase")
+            with _log_tails_lock:
+                targets = [container] if container else container_names
+                new = [name for name in targets if pod_key + (name,) not in _log_tails]
+                if len(_log_tails) + len(new) > FOLLOW_MAX_STREAMS:
+                    return {
+                        "error": f"At most {FOLLOW_MAX_STREAMS} logs can be followed at once "
+                        f"({len(_log_tails)} already are); stop one first"
+                    }
+                for name in targets:
+                    if name in new:
+                        _log_tails[pod_key + (name,)] = _LogTail(
+                            manager, namespace, pod_name, name, container_names, phase
+                        )
+                    else:
+                        _log_tails[pod_key + (name,)].last_used = time.monotonic()
+
+        with _log_tails_lock:
+            tails = [tail for key, tail in _log_tails.items() if key[0] == context]
+        return {"following": [tail.describe() for tail in tails]}
+    except client.exceptions.ApiException as e:
+        if e.status == 404:
+            return {"error": f"Pod {pod_name} not found in namespace {namespace}"}
+        return {"error": f"Error following logs: {str(e)}"}
+    except Exception as e:
+        return {"error": f"Unexpected error: {str(e)}"}
+
+
+@mcp.tool(
+    description=(
+        "List what a workload owns via ownerReferences: a Deployment's ReplicaSets and "
+        "Pods, a CronJob's Jobs and Pods, the Pods of a StatefulSet, DaemonSet or Job"
+    ),
+    annotations=_ro("Get Owned Resources"),
+)
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def get_owned_resources(
+    kind: str,
+    name: str,
+    namespace: str = "default",
+    recursive: bool = True,
+    context: Optional[str] = None,
+):
+    """
+    List the objects owned by a workload, following ownerReferences.
+
+    Ownership comes from the objects' ownerReferences rather than label
+    selectors, so it is exact. With the watch cache enabled it is answered
+    from an in-memory graph kept current by the pod, ReplicaSet and Job
+    watches, without any API request.
+
+    Args:
+        kind (str): Owner kind: Deployment, ReplicaSet, StatefulSet, DaemonSet, Job or
+                   CronJob (case-insensitive).
+        name (str): Name of the owner.
+        namespace (str, optional): Namespace of the owner. Default is 'default'.
+        recursive (bool, optional): Also list what the owned objects own, e.g. the Pods of
+                                   a Deployment's ReplicaSets. Default is True.
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
+
+    Returns:
+        A dict with the owner and "owned": a list of dicts with kind, name,
+        namespace, owner_references and creation_timestamp (plus status for
+        Pods), or a dict with an "error" key.
+    """
+    try:
+        owner_kind = _owner_kind(kind)
+        if owner_kind is None:
+            return {"error": f"Unsupported kind: {kind}. Supported: {', '.join(_OWNER_KINDS)}"}
+        manager = _get_manager(context)
+        owned = _owned_objects(manager, namespace, owner_kind, name, recursive)
+        if not owned and not _owner_exists(manager, namespace, owner_kind, name):
+            return {"error": f"{owner_kind} {name} not found in namespace {namespace}"}
+        results = []
+        for owned_kind, obj in owned:
+            metadata = obj.get("metadata") or {}
+            entry = {
+                "kind": owned_kind,
+                "name": metadata.get("name"),
+                "namespace": metadata.get("namespace"),
+                "owner_references": [
+                    {
+                        "kind": ref.get("kind"),
+                        "name": ref.get("name"),
+                        "controller": ref.get("controller"),
+                    }
+                    for ref in metadata.get("ownerReferences") or []
+                ],
+                "creation_timestamp": _rfc3339(metadata.get("creationTimestamp")),
+            }
+            if owned_kind == "Pod":
+                entry["status"] = (obj.get("status") or {}).get("phase")
+            results.append(entry)
+        return {"kind": owner_kind, "name": name, "namespace": namespace, "owned": results}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(
+    description="List all nodes in the cluster",
+    annotations=_ro("List Nodes"),
+)
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def list_nodes(
+    fresh: bool = False,
+    metadata_only: bool = False,
+    max_response_bytes: Optional[int] = None,
+    context: Optional[str] = None,
+):
+    """
+    Lists all nodes in the Kubernetes cluster, providing detailed information for each.
+
+    The information includes node name, current status (e.g., Ready, NotReady), assigned roles,
+    IP addresses, resource capacity and allocatable resources, node info (kubelet version,
+    OS image, container runtime), creation timestamp, labels, and taints.
+
+    Args:
+        fresh (bool, optional): Bypass the watch cache (when enabled) and query the
+                               API server directly. Default is False.
+        metadata_only (bool, optional): Return only name, namespace, labels, owner
+                                       references and creation timestamp, fetched as
+                                       PartialObjectMetadata so the API server skips
+                                       spec and status. Default is False.
+        max_response_bytes (int, optional): Response budget, in bytes of JSON, for this
+                                           call; 0 disables it. Defaults to the
+                                           server-wide budget (1 MiB).
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
 
     Returns:
-        A dict containing the logs and metadata.
+        A list of node dicts with the details above, or a dict with an "error" key on failure.
+        If the list exceeds the response budget, a dict with the first "items",
+        "truncated", "returned_count", "total_count" and a "summary" of counts per
+        status instead.
     """
     try:
-        manager = _get_manager()
-        core = manager.get_core_api()
+        if metadata_only:
+            return _metadata_listing("v1", "Node", None, None, None, context, max_response_bytes)
+        manager = _get_manager(context)
+        items = _from_watch_cache(manager, "nodes", fresh=fresh)
+        if items is None:
+            resp = manager.get_core_api().list_node(watch=False, _preload_content=False)
+            items = _read_json(resp).get("items") or []
 
-        # Validate input parameters.
-        if not name and not label_selector:
-            return {"error": "Either name or label_selector must be provided"}
+        nodes = [_node_summary_raw(item) for item in items]
+        return _budgeted(nodes, max_response_bytes, {"by_status": lambda node: node["status"]})
+    except Exception as e:
+        return {"error": str(e)}
 
-        # Set default namespace if name is provided but namespace is not.
-        if name and not namespace:
-            namespace = "default"
 
-        # Resolve the set of pods to read logs from.
-        pods_to_get_logs_from = []
+# How top_pods and top_nodes can rank: sort_by -> value of a result entry.
+_USAGE_SORT_KEYS = {
+    "cpu": lambda entry: entry["cpu_millicores"],
+    "memory": lambda entry: entry["memory_bytes"],
+    "cpu_p95": lambda entry: entry["history"]["cpu_millicores"]["p95"],
+    "memory_p95": lambda entry: entry["history"]["memory_bytes"]["p95"],
+    "memory_growth": lambda entry: entry["history"]["memory_growth_bytes_per_second"],
+}
 
-        if resource_type.lower() == "pod" and name:
-            # Direct pod access by name.
-            try:
-                pod = core.read_namespaced_pod(name=name, namespace=namespace)
-                pods_to_get_logs_from.append(pod)
-            except client.exceptions.ApiException as e:
-                if e.status == 404:
-                    return {"error": f"Pod {name} not found in namespace {namespace}"}
-                raise
 
-        elif resource_type.lower() == "deployment" and name:
-            # Get pods from a deployment.
-            try:
-                deployment = manager.get_apps_api().read_namespaced_deployment(
-                    name=name, namespace=namespace
-                )
-                selector = deployment.spec.selector.match_labels
-                label_selector = ",".join([f"{k}={v}" for k, v in selector.items()])
+def _usage_samples(manager, kind: str, sort_by: str, **params) -> tuple:
+    """
+    Current metrics items of ``kind`` with their sampled history, for the top tools.
 
-                pods = core.list_namespaced_pod(namespace=namespace, label_selector=label_selector)
-                pods_to_get_logs_from.extend(pods.items)
-            except client.exceptions.ApiException as e:
-                if e.status == 404:
-                    return {"error": f"Deployment {name} not found in namespace {namespace}"}
-                raise
+    Returns:
+        ("sampler", [(item, stats), ...]) when the background sampler is on,
+        otherwise ("metrics.k8s.io", [(item, None), ...]) from a LIST made now.
+    """
+    if sort_by not in _USAGE_SORT_KEYS:
+        raise ValueError(
+            f"Unsupported sort_by: {sort_by}. Supported: {', '.join(_USAGE_SORT_KEYS)}"
+        )
+    sampler = manager.get_usage_sampler()
+    if sampler is not None:
+        pods, nodes = sampler.latest()
+        return "sampler", pods if kind == "PodMetrics" else nodes
+    if sort_by not in ("cpu", "memory"):
+        raise ValueError(
+            f"sort_by={sort_by} needs usage history: set KUBERNETES_READONLY_MCP_USAGE_SAMPLER=1"
+        )
+    try:
+        return "metrics.k8s.io", [(item, None) for item in _list_metrics(manager, kind, **params)]
+    except _dynamic_exceptions.ResourceNotFoundError:
+        raise ValueError(
+            f"{METRICS_API_VERSION} is not served; is metrics-server installed?"
+        ) from None
 
-        elif resource_type.lower() == "job" and name:
-            # Get pods from a job.
-            try:
-                job = manager.get_batch_api().read_namespaced_job(name=name, namespace=namespace)
-                selector = job.spec.selector.match_labels
-                label_selector = ",".join([f"{k}={v}" for k, v in selector.items()])
 
-                pods = core.list_namespaced_pod(namespace=namespace, label_selector=label_selector)
-                pods_to_get_logs_from.extend(pods.items)
-            except client.exceptions.ApiException as e:
-                if e.status == 404:
-                    return {"error": f"Job {name} not found in namespace {namespace}"}
-                raise
+def _ranked(entries: list, sort_by: str, limit: Optional[int]) -> list:
+    rank = _USAGE_SORT_KEYS[sort_by]
+    entries.sort(key=lambda entry: rank(entry) or 0, reverse=True)
+    return entries[:limit] if limit else entries
 
-        elif label_selector:
-            # Get pods by label selector.
-            if namespace:
-                pods = core.list_namespaced_pod(namespace=namespace, label_selector=label_selector)
-            else:
-                pods = core.list_pod_for_all_namespaces(label_selector=label_selector)
-            pods_to_get_logs_from.extend(pods.items)
 
-        else:
-            return {
-                "error": (
-                    f"Unsupported resource type: {resource_type} or missing required parameters"
-                )
-            }
+def _with_history(entry: dict, stats: Optional[dict]) -> dict:
+    if stats is not None:
+        entry["history"] = stats
+    return entry
 
-        # If no pods found.
-        if not pods_to_get_logs_from:
-            return {"error": "No pods found matching the specified criteria"}
 
-        # Get logs from all matching pods.
-        results = []
-        for pod in pods_to_get_logs_from:
-            pod_name = pod.metadata.name
-            pod_namespace = pod.metadata.namespace
-            container_names = [c.name for c in pod.spec.containers]
+@mcp.tool(
+    description=(
+        "Show CPU and memory usage of pods (like kubectl top pods) from metrics.k8s.io, "
+        "ranked, with p95 and memory growth when usage sampling is enabled. Read-only."
+    ),
+    annotations=_ro("Top Pods"),
+)
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def top_pods(
+    namespace: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    sort_by: str = "cpu",
+    limit: Optional[int] = 20,
+    context: Optional[str] = None,
+):
+    """
+    Rank pods by resource usage, as reported by metrics-server.
 
-            # If container is not specified, default to the first container.
-            container_to_use = container
-            if not container_to_use and container_names:
-                container_to_use = container_names[0]
+    Args:
+        namespace (str, optional): Only pods of this namespace. Default is all namespaces.
+        label_selector (str, optional): Only pods matching this selector, e.g. 'app=web'.
+        sort_by (str, optional): 'cpu' (default) or 'memory' for current usage; with the
+                                usage sampler on also 'cpu_p95', 'memory_p95' and
+                                'memory_growth'.
+        limit (int, optional): Number of pods to return, highest first. Default is 20;
+                              0 or None returns all.
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
 
-            try:
-                logs = core.read_namespaced_pod_log(
-                    name=pod_name,
-                    namespace=pod_namespace,
-                    container=container_to_use,
-                    tail_lines=tail,
-                    timestamps=timestamps,
-                    since_seconds=since_seconds,
-                )
+    Returns:
+        A dict with "source", "sort_by", "total_count" and "pods": per pod its
+        namespace, name, cpu_millicores, memory_bytes, per-container usage and
+        the metrics timestamp, plus "history" (samples, window, avg/p95/max CPU
+        and memory, memory growth per second) when the sampler is on. Or a
+        dict with an "error" key.
+    """
+    try:
+        manager = _get_manager(context)
+        source, samples = _usage_samples(
+            manager, "PodMetrics", sort_by, namespace=namespace, label_selector=label_selector
+        )
+        if source == "sampler":
+            matches = snapshot.label_selector_matcher(label_selector)
+            samples = [
+                (item, stats)
+                for item, stats in samples
+                if (not namespace or item["metadata"].get("namespace") == namespace)
+                and matches(item["metadata"].get("labels") or {})
+            ]
 
-                results.append(
-                    {
-                        "pod_name": pod_name,
-                        "namespace": pod_namespace,
-                        "container": container_to_use,
-                        "logs": logs.split("\n"),
-                        "container_names": container_names,
-                        "status": pod.status.phase,
-                    }
-                )
-            except Exception as e:
-                results.append(
+        entries = []
+        for item, stats in samples:
+            cpu, memory = _pod_usage(item)
+            containers = []
+            for container in item.get("containers") or []:
+                usage = container.get("usage") or {}
+                containers.append(
                     {
-                        "pod_name": pod_name,
-                        "namespace": pod_namespace,
-                        "error": str(e),
+                        "name": container.get("name"),
+                        "cpu_millicores": round(_quantity(usage.get("cpu")) * 1000, 1),
+                        "memory_bytes": int(_quantity(usage.get("memory"))),
                     }
                 )
-
+            entry = {
+                "namespace": item["metadata"].get("namespace"),
+                "name": item["metadata"].get("name"),
+                "cpu_millicores": round(cpu * 1000, 1),
+                "memory_bytes": int(memory),
+                "containers": containers,
+                "timestamp": item.get("timestamp"),
+            }
+            entries.append(_with_history(entry, stats))
         return {
-            "resource_type": resource_type,
-            "name": name,
-            "namespace": namespace,
-            "label_selector": label_selector,
-            "results": results,
+            "source": source,
+            "sort_by": sort_by,
+            "total_count": len(entries),
+            "pods": _ranked(entries, sort_by, limit),
         }
-
     except Exception as e:
-        return {"error": f"Error retrieving logs: {str(e)}"}
+        return {"error": str(e)}
 
 
 @mcp.tool(
-    description="List all nodes in the cluster",
-    annotations=_ro("List Nodes"),
+    description=(
+        "Show CPU and memory usage of nodes (like kubectl top nodes) from metrics.k8s.io, "
+        "as amounts and as a percentage of allocatable. Read-only."
+    ),
+    annotations=_ro("Top Nodes"),
 )
-def list_nodes():
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def top_nodes(sort_by: str = "cpu", limit: Optional[int] = None, context: Optional[str] = None):
     """
-    Lists all nodes in the Kubernetes cluster, providing detailed information for each.
+    Rank nodes by resource usage, as reported by metrics-server.
 
-    The information includes node name, current status (e.g., Ready, NotReady), assigned roles,
-    IP addresses, resource capacity and allocatable resources, node info (kubelet version,
-    OS image, container runtime), creation timestamp, labels, and taints.
+    Args:
+        sort_by (str, optional): 'cpu' (default) or 'memory' for current usage; with the
+                                usage sampler on also 'cpu_p95', 'memory_p95' and
+                                'memory_growth'.
+        limit (int, optional): Number of nodes to return, highest first. Default is all.
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
 
     Returns:
-        A list of node dicts with the details above, or a dict with an "error" key on failure.
+        A dict with "source", "sort_by", "total_count" and "nodes": per node its
+        name, cpu_millicores, memory_bytes, cpu_percent and memory_percent of
+        allocatable and the metrics timestamp, plus "history" when the sampler
+        is on. Or a dict with an "error" key.
     """
     try:
-        ret = _get_manager().get_core_api().list_node(watch=False)
-
-        nodes = []
-        for item in ret.items:
-            # Extract node status.
-            status = None
-            for condition in item.status.conditions:
-                if condition.type == "Ready":
-                    status = "Ready" if condition.status == "True" else "NotReady"
-                    break
-
-            # Extract node roles.
-            roles = [role for role in item.metadata.labels if "node-role.kubernetes.io" in role]
-            if not roles:
-                roles = ["<none>"]  # Handle nodes with no specific role label.
-
-            # Extract IP addresses.
-            addresses = {address.type: address.address for address in item.status.addresses}
-
-            node_info = item.status.node_info
-            nodes.append(
-                {
-                    "name": item.metadata.name,
-                    "status": status,
-                    "roles": roles,
-                    "addresses": addresses,
-                    "capacity": {
-                        "cpu": item.status.capacity.get("cpu"),
-                        "memory": item.status.capacity.get("memory"),
-                        "pods": item.status.capacity.get("pods"),
-                    },
-                    "allocatable": {
-                        "cpu": item.status.allocatable.get("cpu"),
-                        "memory": item.status.allocatable.get("memory"),
-                        "pods": item.status.allocatable.get("pods"),
-                    },
-                    "node_info": {
-                        "kubelet_version": node_info.kubelet_version,
-                        "os_image": node_info.os_image,
-                        "container_runtime_version": node_info.container_runtime_version,
-                    },
-                    "creation_timestamp": (
-                        item.metadata.creation_timestamp.isoformat()
-                        if item.metadata.creation_timestamp
-                        else None
-                    ),
-                    "labels": item.metadata.labels,
-                    "taints": (
-                        [
-                            {
-                                "key": taint.key,
-                                "value": taint.value,
-                                "effect": taint.effect,
-                            }
-                            for taint in item.spec.taints
-                        ]
-                        if item.spec.taints
-                        else []
-                    ),
-                }
-            )
+        manager = _get_manager(context)
+        source, samples = _usage_samples(manager, "NodeMetrics", sort_by)
+        nodes = _from_watch_cache(manager, "nodes")
+        if nodes is None:
+            resp = manager.get_core_api().list_node(watch=False, _preload_content=False)
+            nodes = _read_json(resp).get("items") or []
+        allocatable = {
+            node["metadata"]["name"]: (node.get("status") or {}).get("allocatable") or {}
+            for node in nodes
+        }
 
-        return nodes
+        entries = []
+        for item, stats in samples:
+            name = item["metadata"].get("name")
+            cpu, memory = _node_usage(item)
+            cpu_allocatable = _quantity(allocatable.get(name, {}).get("cpu"))
+            memory_allocatable = _quantity(allocatable.get(name, {}).get("memory"))
+            entry = {
+                "name": name,
+                "cpu_millicores": round(cpu * 1000, 1),
+                "memory_bytes": int(memory),
+                "cpu_percent": round(100 * cpu / cpu_allocatable, 1) if cpu_allocatable else None,
+                "memory_percent": (
+                    round(100 * memory / memory_allocatable, 1) if memory_allocatable else None
+                ),
+                "timestamp": item.get("timestamp"),
+            }
+            entries.append(_with_history(entry, stats))
+        return {
+            "source": source,
+            "sort_by": sort_by,
+            "total_count": len(entries),
+            "nodes": _ranked(entries, sort_by, limit),
+        }
     except Exception as e:
         return {"error": str(e)}
 
@@ -670,12 +3588,22 @@ def list_nodes():
     ),
     annotations=_ro("List Resource"),
 )
+@metrics.instrumented
+@_coalesced
+@_holding_managers
 def list_resource(
     kind: str,
     api_version: str = "v1",
     namespace: Optional[str] = None,
     label_selector: Optional[str] = None,
     field_selector: Optional[str] = None,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    metadata_only: bool = False,
+    max_response_bytes: Optional[int] = None,
+    fresh: bool = False,
+    context: Optional[str] = None,
 ):
     """
     List resources of an arbitrary kind using the dynamic client.
@@ -691,19 +3619,221 @@ def list_resource(
                                    across all namespaces (or cluster-scoped).
         label_selector (str, optional): Label selector, e.g. 'app=nginx'.
         field_selector (str, optional): Field selector, e.g. 'metadata.name=foo'.
+        limit (int, optional): Maximum number of objects to return in one page.
+        continue_token (str, optional): Cursor returned by a previous paged call.
+        fields (list[str], optional): Only return these field paths of each object,
+                                     e.g. ['metadata.name', 'status.phase',
+                                     'spec.containers[*].image']. JSONPath-style
+                                     '$.metadata.name' / '{.metadata.name}' also work.
+        metadata_only (bool, optional): Request PartialObjectMetadataList so the API
+                                       server returns only apiVersion, kind and metadata
+                                       (no spec/status). Default is False.
+        max_response_bytes (int, optional): Response budget, in bytes of JSON, for this
+                                           call; 0 disables it. Defaults to the
+                                           server-wide budget (1 MiB).
+        fresh (bool, optional): Bypass the response cache, when enabled, and list the
+                               latest state. Paged calls are never cached.
+                               Default is False.
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
 
     Returns:
-        A list of sanitized resource dicts, or a dict with an "error" key.
+        A list of sanitized resource dicts, or a dict with an "error" key. When
+        limit or continue_token is given, a dict with the page under "items" plus
+        "continue_token" (None on the last page) and "remaining_item_count".
+        If the list exceeds the response budget, a dict with the first "items",
+        "truncated", "returned_count", "total_count" and a "summary" of counts per
+        namespace and kind instead.
     """
     try:
-        dyn = _get_manager().get_dynamic_api()
-        api = dyn.resources.get(api_version=api_version, kind=kind)
-        res = api.get(
-            namespace=namespace,
-            label_selector=label_selector,
-            field_selector=field_selector,
+        paths = [_parse_field_path(f) for f in fields] if fields else None
+        manager = _get_manager(context)
+        api = manager.get_dynamic_api().resources.get(api_version=api_version, kind=kind)
+        headers = {"header_params": _metadata_only_headers()} if metadata_only else {}
+        paged = limit is not None or continue_token is not None
+        cache = _response_cache(manager)
+        if paged or cache is None:
+            res = api.get(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                limit=limit,
+                _continue=continue_token,
+                **headers,
+            )
+            items = [
+                _sanitize(_project(item, paths) if paths else item.to_dict(), kind)
+                for item in res.items
+            ]
+            if paged:
+                metadata = res.metadata
+                return _page(items, metadata["continue"], metadata["remainingItemCount"])
+        else:
+
+            def fetch(resource_version):
+                body = _read_json(
+                    api.get(
+                        namespace=namespace,
+                        label_selector=label_selector,
+                        field_selector=field_selector,
+                        resource_version=resource_version,
+                        resource_version_match="NotOlderThan" if resource_version else None,
+                        serialize=False,
+                        **headers,
+                    )
+                )
+                # As the dynamic client does: list items carry no kind/apiVersion.
+                list_kind = body.get("kind") or f"{kind}List"
+                for item in body.get("items") or []:
+                    item.setdefault("kind", list_kind.removesuffix("List"))
+                    item.setdefault("apiVersion", body.get("apiVersion", api_version))
+                    _sanitize(item, kind)
+                return body.get("items") or [], (body.get("metadata") or {}).get("resourceVersion")
+
+            key = ("list", api_version, kind, namespace, label_selector, field_selector)
+            items = _cached_read(cache, kind, key + (metadata_only,), fetch, fresh)
+            if paths:
+                items = [_project(item, paths) for item in items]
+        return _budgeted(
+            items,
+            max_response_bytes,
+            {"by_namespace": _object_namespace, "by_kind": lambda item: item.get("kind", kind)},
         )
-        return [_sanitize(item.to_dict(), kind) for item in res.items]
+    except Exception as e:
+        return {"error": str(e)}
+
+
+# Objects fetched per LIST request by summarize_resource.
+_SUMMARY_PAGE_SIZE = 500
+
+
+@mcp.tool(
+    description=(
+        "Count, group and aggregate resources of any kind server-side (e.g. pods by "
+        "status.phase and spec.nodeName, restarts by namespace, deployments with "
+        "unavailable replicas) without returning the objects. Read-only."
+    ),
+    annotations=_ro("Summarize Resource"),
+)
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def summarize_resource(
+    kind: str,
+    api_version: str = "v1",
+    namespace: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    group_by: Optional[list[str]] = None,
+    stats: Optional[list[str]] = None,
+    where: Optional[list[str]] = None,
+    top: int = 50,
+    context: Optional[str] = None,
+):
+    """
+    Summarize resources of an arbitrary kind using the dynamic client.
+
+    Pages through the LIST and folds each object into the counts as it arrives,
+    reading only the requested fields, so neither the objects nor dicts of them
+    are kept. When every path is under metadata, only object metadata is fetched.
+
+    Args:
+        kind (str): Resource kind, e.g. 'Pod', 'Deployment', 'MyCustomResource'.
+        api_version (str, optional): Group/version, e.g. 'v1' (default) or 'apps/v1'.
+        namespace (str, optional): Namespace to scope to. If omitted, all namespaces.
+        label_selector (str, optional): Label selector, e.g. 'app=nginx'.
+        field_selector (str, optional): Field selector, e.g. 'status.phase=Running'.
+        group_by (list[str], optional): Field paths to group by, e.g.
+                                       ['status.phase', 'spec.nodeName']. Without it,
+                                       all matching objects form a single group.
+        stats (list[str], optional): Numeric field paths to aggregate per group (sum,
+                                    min, max, avg), e.g.
+                                    ['status.containerStatuses[*].restartCount'].
+                                    Values under '*' are summed per object first.
+        where (list[str], optional): Filters that must all hold, e.g.
+                                    ['status.unavailableReplicas>0',
+                                    'status.containerStatuses[*].state.waiting.reason'
+                                    '==CrashLoopBackOff']. Operators: ==, !=, >, <, >=,
+                                    <=; a bare path means present and non-empty.
+        top (int, optional): Number of largest groups to return. Default is 50.
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
+
+    Returns:
+        A dict with "scanned" and "matched" object counts, "group_count", and
+        "groups": a list of {"key": {path: value}, "count", "stats"} sorted by
+        count, or a dict with an "error" key.
+    """
+    try:
+        group_paths = [_parse_field_path(path) for path in group_by or []]
+        stat_paths = [_parse_field_path(path) for path in stats or []]
+        filters = [_parse_where(expression) for expression in where or []]
+        all_paths = group_paths + stat_paths + [tokens for tokens, _ in filters]
+        _check_secret_paths(kind, all_paths)
+        # Counting alone, or by metadata only, needs no spec or status.
+        metadata_only = all(tokens and tokens[0] == "metadata" for tokens in all_paths)
+
+        dyn = _get_manager(context).get_dynamic_api()
+        api = dyn.resources.get(api_version=api_version, kind=kind)
+
+        groups = {}
+        scanned = 0
+        continue_token = None
+        while True:
+            res = api.get(
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                limit=_SUMMARY_PAGE_SIZE,
+                _continue=continue_token,
+                **({"header_params": _metadata_only_headers()} if metadata_only else {}),
+            )
+            for item in res.items:
+                scanned += 1
+                if not all(test(_field_values(item, tokens)) for tokens, test in filters):
+                    continue
+                key = tuple(
+                    ",".join(_as_text(v) for v in _field_values(item, tokens)) or None
+                    for tokens in group_paths
+                )
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = {"count": 0, "stats": [[] for _ in stat_paths]}
+                group["count"] += 1
+                for values, tokens in zip(group["stats"], stat_paths):
+                    numbers = [v for v in _field_values(item, tokens) if _is_number(v)]
+                    if numbers:
+                        values.append(sum(numbers))
+            continue_token = res.metadata["continue"]
+            if not continue_token:
+                break
+
+        ordered = sorted(groups.items(), key=lambda entry: entry[1]["count"], reverse=True)
+        summaries = []
+        for key, group in ordered[: max(top, 1)]:
+            summary = {"key": dict(zip(group_by or [], key)), "count": group["count"]}
+            if stat_paths:
+                summary["stats"] = {
+                    path: (
+                        {
+                            "sum": sum(values),
+                            "min": min(values),
+                            "max": max(values),
+                            "avg": sum(values) / len(values),
+                        }
+                        if values
+                        else None
+                    )
+                    for path, values in zip(stats, group["stats"])
+                }
+            summaries.append(summary)
+        return {
+            "kind": kind,
+            "scanned": scanned,
+            "matched": sum(group["count"] for group in groups.values()),
+            "group_count": len(groups),
+            "groups": summaries,
+        }
     except Exception as e:
         return {"error": str(e)}
 
@@ -715,11 +3845,17 @@ def list_resource(
     ),
     annotations=_ro("Get Resource"),
 )
+@metrics.instrumented
+@_coalesced
+@_holding_managers
 def get_resource(
     kind: str,
     name: str,
     api_version: str = "v1",
     namespace: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    fresh: bool = False,
+    context: Optional[str] = None,
 ):
     """
     Get a single resource of an arbitrary kind by name using the dynamic client.
@@ -733,15 +3869,39 @@ def get_resource(
         api_version (str, optional): Group/version, e.g. 'v1' (default) or
                                     'apps/v1'.
         namespace (str, optional): Namespace for namespaced resources.
+        fields (list[str], optional): Only return these field paths, e.g.
+                                     ['metadata.ownerReferences', 'status.conditions'].
+        fresh (bool, optional): Bypass the response cache, when enabled, and read the
+                               latest state. Default is False.
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
 
     Returns:
         A sanitized resource dict, or a dict with an "error" key.
     """
     try:
-        dyn = _get_manager().get_dynamic_api()
-        api = dyn.resources.get(api_version=api_version, kind=kind)
-        res = api.get(name=name, namespace=namespace)
-        return _sanitize(res.to_dict(), kind)
+        paths = [_parse_field_path(f) for f in fields] if fields else None
+        manager = _get_manager(context)
+        api = manager.get_dynamic_api().resources.get(api_version=api_version, kind=kind)
+        cache = _response_cache(manager)
+        if cache is None:
+            res = api.get(name=name, namespace=namespace)
+            return _sanitize(_project(res, paths) if paths else res.to_dict(), kind)
+
+        def fetch(resource_version):
+            obj = _read_json(
+                api.get(
+                    name=name,
+                    namespace=namespace,
+                    resource_version=resource_version,
+                    serialize=False,
+                )
+            )
+            return _sanitize(obj, kind), obj["metadata"].get("resourceVersion")
+
+        key = ("get", api_version, kind, namespace, name)
+        obj = _cached_read(cache, kind, key, fetch, fresh)
+        return _project(obj, paths) if paths else obj
     except Exception as e:
         return {"error": str(e)}
 
@@ -753,7 +3913,10 @@ def get_resource(
     ),
     annotations=_ro("List API Resources"),
 )
-def list_api_resources():
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def list_api_resources(context: Optional[str] = None):
     """
     Discover the listable resource kinds available on the cluster.
 
@@ -761,43 +3924,411 @@ def list_api_resources():
     'list', so callers know what they can pass to list_resource/get_resource
     (including CRDs). Entries are deduplicated by (group_version, kind).
 
+    Args:
+        context (str, optional): kubeconfig context (cluster) to query. Defaults to the
+                                current context.
+
     Returns:
         A list of dicts with group_version, kind, namespaced, and verbs, or a
         dict with an "error" key.
     """
     try:
-        dyn = _get_manager().get_dynamic_api()
-        resources = []
-        seen = set()
-        for resource in dyn.resources.search():
-            # Skip synthetic ResourceList entries (PodList, SecretList, ...).
-            # They inherit the base 'list' verb but ResourceList.get() expects a
-            # body, so list_resource(kind="PodList") would fail. Don't advertise.
-            if isinstance(resource, ResourceList):
-                continue
-            verbs = resource.verbs or []
-            if "list" not in verbs:
-                continue
-            key = (resource.group_version, resource.kind)
-            if key in seen:
-                continue
-            seen.add(key)
-            resources.append(
+        dyn = _get_manager(context).get_dynamic_api()
+        return _listable_api_resources(dyn.resources.search())
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool(
+    description="List the kubeconfig contexts (clusters) that tools can target via 'context'",
+    annotations=_ro("List Contexts"),
+)
+@metrics.instrumented
+@_coalesced
+@_holding_managers
+def list_contexts():
+    """
+    List the contexts defined in the kubeconfig.
+
+    Any of the returned names can be passed as the "context" argument of the
+    other tools to query that cluster from the same server process. When
+    serving a snapshot, the one context it was captured from is returned, with
+    its snapshot directory and captured_at time.
+
+    Returns:
+        A list of dicts with name, cluster, user, namespace and current, or a
+        dict with an "error" key.
+    """
+    try:
+        if SNAPSHOT_DIR:
+            captured = _get_manager().snapshot
+            return [
                 {
-                    "group_version": resource.group_version,
-                    "kind": resource.kind,
-                    "namespaced": resource.namespaced,
-                    "verbs": list(verbs),
+                    "name": captured.context,
+                    "cluster": None,
+                    "user": None,
+                    "namespace": None,
+                    "current": True,
+                    "snapshot": SNAPSHOT_DIR,
+                    "captured_at": captured.captured_at,
                 }
-            )
-        return resources
+            ]
+        contexts, active = config.list_kube_config_contexts()
+        active_name = active["name"] if active else None
+        return [
+            {
+                "name": ctx["name"],
+                "cluster": ctx["context"].get("cluster"),
+                "user": ctx["context"].get("user"),
+                "namespace": ctx["context"].get("namespace"),
+                "current": ctx["name"] == active_name,
+            }
+            for ctx in contexts
+        ]
     except Exception as e:
         return {"error": str(e)}
 
 
-def main():
+# Tools batch_read can run, by name.
+_BATCH_TOOLS = {
+    tool.__name__: tool
+    for tool in (
+        list_pods,
+        list_deployments,
+        get_pod_logs,
+        list_services,
+        list_namespaces,
+        get_events,
+        watch_events_since,
+        get_logs,
+        get_owned_resources,
+        list_nodes,
+        top_pods,
+        top_nodes,
+        list_resource,
+        summarize_resource,
+        get_resource,
+        list_api_resources,
+        list_contexts,
+    )
+}
+
+
+@mcp.tool(
+    description=(
+        "Run several read-only tools concurrently in one call, e.g. get_resource on a pod "
+        "plus get_events, its node and its service. Results come back in request order."
+    ),
+    annotations=_ro("Batch Read"),
+)
+@metrics.instrumented
+def batch_read(
+    requests: list[dict],
+    max_concurrency: Optional[int] = None,
+    deadline: Optional[float] = None,
+    context: Optional[str] = None,
+):
+    """
+    Run a list of tool calls concurrently and return their results in order.
+
+    The batch takes as long as its slowest call rather than the sum of them.
+    Calls still running at the deadline are reported with an "error" entry
+    while the others keep their results.
+
+    Args:
+        requests (list[dict]): The calls, each {"tool": name, "arguments": {...}}, e.g.
+                              [{"tool": "get_resource", "arguments": {"kind": "Pod",
+                              "name": "web-1", "namespace": "default"}},
+                              {"tool": "get_events", "arguments": {"namespace": "default"}}].
+                              Any tool of this server except batch_read itself.
+        max_concurrency (int, optional): Maximum number of calls run at once. Default is 10.
+        deadline (float, optional): Time budget in seconds for the whole batch. Default is 60.
+        context (str, optional): kubeconfig context (cluster) for calls whose arguments do
+                                not name one. Defaults to the current context.
+
+    Returns:
+        A dict with "results": one {"tool", "result"} or {"tool", "error"} per
+        request, in request order, or a dict with an "error" key.
+    """
+    if len(requests) > BATCH_MAX_REQUESTS:
+        return {"error": f"At most {BATCH_MAX_REQUESTS} requests per batch, got {len(requests)}"}
+
+    def run(request):
+        # Malformed items get an error of their own instead of failing the batch.
+        name = request.get("tool") if isinstance(request, dict) else None
+        try:
+            tool = _BATCH_TOOLS.get(name) if isinstance(name, str) else None
+            if tool is None:
+                return {"tool": name, "error": f"Unknown tool: {name!r}"}
+            arguments = request.get("arguments") or {}
+            if not isinstance(arguments, dict):
+                kind = type(arguments).__name__
+                return {"tool": name, "error": f"Invalid arguments: expected an object, got {kind}"}
+            arguments = dict(arguments)
+            signature = inspect.signature(tool)
+            if context is not None and "context" in signature.parameters:
+                arguments.setdefault("context", context)
+            try:
+                signature.bind(**arguments)
+            except TypeError as e:
+                return {"tool": name, "error": f"Invalid arguments: {e}"}
+            return {"tool": name, "result": tool(**arguments)}
+        except Exception as e:
+            return {"tool": name, "error": str(e)}
+
+    total_deadline = deadline or BATCH_DEADLINE_SECONDS
+    results = _fan_out(
+        run,
+        list(requests),
+        max_concurrency or BATCH_CONCURRENCY,
+        total_deadline,
+        lambda request: {
+            "tool": request.get("tool") if isinstance(request, dict) else None,
+            "error": f"Timed out: not finished within {total_deadline}s deadline",
+        },
+    )
+    return {"results": results}
+
+
+@mcp.tool(
+    description=(
+        "Per-tool server metrics: call counts, latency, Kubernetes API requests and bytes, "
+        "response sizes and errors. Requires KUBERNETES_READONLY_MCP_METRICS=1."
+    ),
+    annotations=_ro("Server Stats"),
+)
+def server_stats():
+    """
+    Report the metrics collected for each tool since the server started.
+
+    Returns:
+        A dict with "enabled", per tool calls, errors by type, latency
+        (avg/max/sum and histogram buckets), api_requests, api_bytes and
+        response_bytes, "coalesced": per tool, the calls that shared the
+        result of an identical call already in flight, and "response_cache":
+        per context, hits, misses, expired and revalidated lookups, evictions,
+        entries and bytes (when the response cache is on).
+    """
+    with _in_flight_lock:
+        coalesced = dict(sorted(_coalesced_calls.items()))
+    with _managers_lock:
+        managers = [(context, manager) for context, (manager, _) in _managers.items()]
+    response_cache = {}
+    for context, manager in managers:
+        cache = _response_cache(manager)
+        if cache is not None:
+            response_cache[context or "(current)"] = cache.stats()
+    return {
+        "enabled": metrics.ENABLED,
+        "tools": metrics.snapshot(),
+        "coalesced": coalesced,
+        "response_cache": response_cache,
+    }
+
+
+if metrics.ENABLED:
+
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def prometheus_metrics(request):
+        """Serve the tool metrics as Prometheus text (HTTP transports only)."""
+        from starlette.responses import PlainTextResponse
+
+        return PlainTextResponse(
+            metrics.render_prometheus(), media_type="text/plain; version=0.0.4"
+        )
+
+
+# Objects fetched per LIST request by capture_snapshot.
+_SNAPSHOT_PAGE_SIZE = 500
+
+
+def _snapshot_log_targets(pod: dict) -> list:
+    """(namespace, pod, container, previous) for each container log worth capturing."""
+    metadata, status = pod.get("metadata") or {}, pod.get("status") or {}
+    statuses = (status.get("initContainerStatuses") or []) + (status.get("containerStatuses") or [])
+    if not statuses and status.get("phase") in ("Running", "Succeeded", "Failed"):
+        # No per-container status reported: assume every container has started.
+        statuses = [
+            {"name": container.get("name"), "state": {"running": {}}}
+            for container in (pod.get("spec") or {}).get("containers") or []
+        ]
+    targets = []
+    for container in statuses:
+        state = container.get("state") or {}
+        key = (metadata.get("namespace"), metadata.get("name"), container.get("name"))
+        if "running" in state or "terminated" in state:
+            targets.append(key + (False,))
+        if container.get("restartCount"):
+            targets.append(key + (True,))
+    return targets
+
+
+def capture_snapshot(
+    path: str, context: Optional[str] = None, log_tail_lines: int = SNAPSHOT_LOG_TAIL_LINES
+) -> dict:
+    """
+    Write a snapshot of a cluster that --snapshot can serve the tools from offline.
+
+    Captures the discovery documents, every object of every listable kind, page
+    by page, and the last log lines of each started container (and of the
+    previous instance of restarted ones). Objects are stored sanitized exactly
+    as the tools return them, so Secret values never reach the disk.
+
+    Args:
+        path (str): Directory to write the snapshot to.
+        context (str, optional): kubeconfig context (cluster) to capture. Defaults to the
+                                current context.
+        log_tail_lines (int, optional): Log lines kept per container. Each log is also
+                                       capped at KUBERNETES_READONLY_MCP_LOG_MAX_BYTES.
+
+    Returns:
+        A dict with the number of kinds, objects and logs captured, and "errors"
+        for anything that could not be read (e.g. kinds the user may not list).
+    """
+    manager = _get_manager(context)
+    dyn = manager.get_dynamic_api()
+    core = manager.get_core_api()
+    writer = snapshot.SnapshotWriter(path, context)
+
+    def fetch(path, **params):
+        return _read_json(dyn.request("GET", path, serialize=False, **params))
+
+    def capture_document(path):
+        try:
+            body = fetch(path)
+        except Exception as e:
+            writer.add_error(f"GET {path}", e)
+            return {}
+        writer.add_document(path, _dumps(body))
+        return body
+
+    # Discovery, so the dynamic client (and list_api_resources) work offline.
+    for document_path in ("/version", "/api", "/api/v1"):
+        capture_document(document_path)
+    for group in capture_document("/apis").get("groups") or []:
+        for version in group.get("versions") or []:
+            capture_document(f"/apis/{version['groupVersion']}")
+
+    discovered = dyn.resources.search()
+    listable = {(r["group_version"], r["kind"]) for r in _listable_api_resources(discovered)}
+    kinds = objects_count = 0
+    log_targets = []
+    for resource in discovered:
+        key = (getattr(resource, "group_version", None), getattr(resource, "kind", None))
+        if key not in listable:
+            continue
+        listable.discard(key)
+        collection = resource.path()
+        objects = None
+        continue_token = None
+        try:
+            while True:
+                page = fetch(collection, limit=_SNAPSHOT_PAGE_SIZE, _continue=continue_token)
+                if objects is None:
+                    objects = writer.add_resource(
+                        collection,
+                        resource.kind,
+                        resource.group_version,
+                        resource.namespaced,
+                        page.get("kind") or f"{resource.kind}List",
+                    )
+                    kinds += 1
+                for item in page.get("items") or []:
+                    # LIST items carry no kind/apiVersion, but a GET of one does.
+                    item.setdefault("kind", resource.kind)
+                    item.setdefault("apiVersion", resource.group_version)
+                    writer.add_object(objects, _sanitize(item, resource.kind))
+                    objects_count += 1
+                    if key == ("v1", "Pod"):
+                        log_targets += _snapshot_log_targets(item)
+                continue_token = (page.get("metadata") or {}).get("continue")
+                if not continue_token:
+                    break
+        except Exception as e:
+            writer.add_error(f"LIST {collection}", e)
+
+    def capture_log(target):
+        namespace, pod, container, previous = target
+        try:
+            text, _, _ = _read_pod_log(
+                core,
+                LOG_MAX_BYTES,
+                name=pod,
+                namespace=namespace,
+                container=container,
+                tail_lines=log_tail_lines,
+                previous=previous,
+                _request_timeout=LOG_POD_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            writer.add_error(f"log {namespace}/{pod}/{container}", e)
+            return False
+        writer.add_log(namespace, pod, container, text.encode("utf-8"), previous)
+        return True
+
+    logs = _fan_out(capture_log, log_targets, LOG_CONCURRENCY, None, lambda target: False)
+    index = writer.close()
+    return {
+        "path": path,
+        "context": context,
+        "kinds": kinds,
+        "objects": objects_count,
+        "logs": sum(logs),
+        "errors": index["errors"],
+    }
+
+
+def main(argv=None):
     """Entry point for the MCP server when run as a script."""
-    mcp.run()  # Default: uses STDIO transport.
+    global SNAPSHOT_DIR
+    parser = argparse.ArgumentParser(
+        prog="kubernetes-readonly-mcp",
+        description="Read-only Kubernetes MCP server.",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        default=_env_flag("KUBERNETES_READONLY_MCP_ASYNC"),
+        help="serve the asyncio implementation (requires the 'async' extra)",
+    )
+    parser.add_argument(
+        "--snapshot",
+        metavar="DIR",
+        default=SNAPSHOT_DIR,
+        help="serve the tools from a snapshot written by --capture, with no cluster access",
+    )
+    parser.add_argument(
+        "--capture",
+        metavar="DIR",
+        help="write a snapshot of the cluster to DIR and exit",
+    )
+    parser.add_argument(
+        "--context",
+        help="kubeconfig context to capture (default: the current context)",
+    )
+    parser.add_argument(
+        "--log-tail-lines",
+        type=int,
+        default=SNAPSHOT_LOG_TAIL_LINES,
+        help="log lines captured per container (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.capture:
+        print(
+            json.dumps(capture_snapshot(args.capture, args.context, args.log_tail_lines), indent=2)
+        )
+        return
+    if args.snapshot:
+        if args.use_async:
+            parser.error("--snapshot is not supported with --async")
+        SNAPSHOT_DIR = args.snapshot
+
+    server = mcp
+    if args.use_async:
+        from kubernetes_readonly_mcp.aio import mcp as server
+    server.run()  # Default: uses STDIO transport.
 
 
 if __name__ == "__main__":
@@ -0,0 +1,430 @@
+"""Offline cluster snapshots for the read-only Kubernetes MCP server.
+
+``kubernetes-readonly-mcp --capture DIR`` writes a snapshot of a cluster, and
+``kubernetes-readonly-mcp --snapshot DIR`` serves every tool from it with no
+cluster access, e.g. for post-incident analysis, air-gapped review or
+deterministic tests. A snapshot is a directory holding two files:
+
+- ``objects.bin``: the captured objects, logs and discovery documents, each
+  zlib-compressed on its own and appended one after the other;
+- ``index.json.gz``: where each of them lives in ``objects.bin``, as
+  ``[offset, length]`` pairs, per resource sorted by namespace and name.
+
+When serving, ``objects.bin`` is memory-mapped and only the records a request
+touches are decompressed, so a GET by kind, namespace and name is a dict
+lookup plus one slice however large the snapshot is, and a LIST reads just
+its page. Requests are answered by ``SnapshotRestClient``, which stands in for
+an ApiClient's REST client: the typed APIs, the dynamic client and discovery
+all work unchanged on top of it.
+"""
+
+import gzip
+import io
+import json
+import mmap
+import os
+import re
+import threading
+import time
+import uuid
+import zlib
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import urllib3
+
+if TYPE_CHECKING:
+    from kubernetes.client.rest import RESTResponse
+
+FORMAT_VERSION = 1
+OBJECTS_FILE = "objects.bin"
+INDEX_FILE = "index.json.gz"
+
+_PARTIAL_METADATA = "as=PartialObjectMetadata"
+
+
+class SnapshotWriter:
+    """Append captured API data to a new snapshot directory.
+
+    Thread-safe, so logs can be written from a fan-out of worker threads. The
+    index is written by ``close()``; a snapshot without one cannot be served.
+    """
+
+    def __init__(self, path: str, context: Optional[str] = None):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self._file = open(os.path.join(path, OBJECTS_FILE), "wb")
+        self._lock = threading.Lock()
+        self._index = {
+            "format": FORMAT_VERSION,
+            "id": uuid.uuid4().hex,
+            "context": context,
+            "captured_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "documents": {},
+            "resources": {},
+            "logs": {},
+            "errors": {},
+        }
+
+    def _append(self, data: bytes) -> list:
+        record = zlib.compress(data)
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(record)
+        return [offset, len(record)]
+
+    def add_document(self, path: str, body: bytes):
+        """Store a raw response body (discovery, /version) to replay for ``path``."""
+        self._index["documents"][_normalize(path)] = self._append(body)
+
+    def add_resource(
+        self, path: str, kind: str, api_version: str, namespaced: bool, list_kind: str
+    ) -> list:
+        """Register a resource by its collection path, e.g. '/apis/apps/v1/deployments'."""
+        entry = {
+            "kind": kind,
+            "api_version": api_version,
+            "namespaced": namespaced,
+            "list_kind": list_kind,
+            "objects": [],
+        }
+        self._index["resources"][_normalize(path)] = entry
+        return entry["objects"]
+
+    def add_object(self, objects: list, obj: dict):
+        """Store one object of a resource registered with ``add_resource``."""
+        metadata = obj.get("metadata") or {}
+        location = self._append(json.dumps(obj, separators=(",", ":")).encode())
+        objects.append([metadata.get("namespace") or "", metadata.get("name") or ""] + location)
+
+    def add_log(self, namespace: str, pod: str, container: str, text: bytes, previous=False):
+        """Store one container's log (or its previous instance's)."""
+        location = self._append(text)
+        with self._lock:
+            logs = self._index["logs"].setdefault(f"{namespace}/{pod}", {})
+            logs.setdefault("previous" if previous else "current", {})[container] = location
+
+    def add_error(self, what: str, error: Exception):
+        """Record something that could not be captured, e.g. a forbidden kind."""
+        with self._lock:
+            self._index["errors"][what] = str(error)
+
+    def close(self) -> dict:
+        """Finish the snapshot and return its index."""
+        for resource in self._index["resources"].values():
+            resource["objects"].sort(key=lambda entry: (entry[0], entry[1]))
+        self._file.close()
+        with gzip.open(os.path.join(self.path, INDEX_FILE), "wt", encoding="utf-8") as f:
+            json.dump(self._index, f, separators=(",", ":"))
+        return self._index
+
+
+class _Resource:
+    """Index of one captured resource; per-name lookups are built on first use."""
+
+    def __init__(self, entry: dict):
+        self.kind = entry["kind"]
+        self.api_version = entry["api_version"]
+        self.namespaced = entry["namespaced"]
+        self.list_kind = entry["list_kind"]
+        self.objects = entry["objects"]  # [namespace, name, offset, length], sorted
+        self._positions = None
+        self._ranges = None
+
+    def _build(self):
+        positions, ranges = {}, {}
+        for position, (namespace, name, _, _) in enumerate(self.objects):
+            positions[(namespace, name)] = position
+            start, _ = ranges.get(namespace, (position, position))
+            ranges[namespace] = (start, position + 1)
+        self._ranges, self._positions = ranges, positions
+
+    def find(self, namespace: str, name: str) -> Optional[list]:
+        if self._positions is None:
+            self._build()
+        position = self._positions.get((namespace, name))
+        return None if position is None else self.objects[position]
+
+    def span(self, namespace: Optional[str]) -> tuple:
+        """Positions [start, end) of the objects in a namespace, or of all objects."""
+        if namespace is None:
+            return 0, len(self.objects)
+        if self._ranges is None:
+            self._build()
+        return self._ranges.get(namespace, (0, 0))
+
+
+class Snapshot:
+    """A snapshot opened for serving."""
+
+    def __init__(self, path: str):
+        with gzip.open(os.path.join(path, INDEX_FILE), "rt", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format: {index.get('format')!r}")
+        self.path = path
+        self.id = index["id"]
+        self.context = index["context"]
+        self.captured_at = index["captured_at"]
+        self.errors = index["errors"]
+        self._documents = index["documents"]
+        self._resources = {
+            collection: _Resource(entry) for collection, entry in index["resources"].items()
+        }
+        self._logs = index["logs"]
+        self._file = open(os.path.join(path, OBJECTS_FILE), "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def read(self, location) -> bytes:
+        offset, length = location[-2:]
+        return zlib.decompress(self._data[offset : offset + length])
+
+    def document(self, path: str) -> Optional[bytes]:
+        location = self._documents.get(_normalize(path))
+        return None if location is None else self.read(location)
+
+    def resource(self, path: str) -> Optional[_Resource]:
+        return self._resources.get(_normalize(path))
+
+    def log(self, namespace: str, pod: str, container: Optional[str], previous: bool):
+        """Return a container's captured log; None if the pod has none captured."""
+        logs = self._logs.get(f"{namespace}/{pod}", {})
+        if container is None:
+            containers = list(logs.get("current", {}))
+            if len(containers) > 1:
+                raise ValueError(f"a container name must be specified for pod {pod}")
+            if not containers:
+                return None
+            container = containers[0]
+        location = logs.get("previous" if previous else "current", {}).get(container)
+        return None if location is None else self.read(location)
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+
+def _normalize(path: str) -> str:
+    return "/" + path.strip("/")
+
+
+def _split_selector(selector: str) -> list:
+    """Split a selector on the commas that are not inside 'in (...)' sets."""
+    parts, depth, current = [], 0, ""
+    for char in selector:
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        if char == "," and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+    parts.append(current)
+    return [part.strip() for part in parts if part.strip()]
+
+
+_LABEL_REQUIREMENT = re.compile(
+    r"^(?P<not>!)?\s*(?P<key>[^\s!=(),]+)\s*"
+    r"(?:(?P<op>==|=|!=)\s*(?P<value>[^\s,]*)|\s+(?P<set>in|notin)\s*\((?P<values>[^)]*)\))?$"
+)
+
+
+def label_selector_matcher(selector: Optional[str]):
+    """Compile a label selector ('a=b,c!=d,e in (x,y),!f') into a predicate over labels."""
+    tests = []
+    for requirement in _split_selector(selector or ""):
+        match = _LABEL_REQUIREMENT.match(requirement)
+        if not match or (match["not"] and (match["op"] or match["set"])):
+            raise ValueError(f"Invalid label selector: {selector!r}")
+        key, op, value = match["key"], match["op"], match["value"]
+        if match["not"]:
+            tests.append(lambda labels, key=key: key not in labels)
+        elif op in ("=", "=="):
+            tests.append(lambda labels, key=key, value=value: labels.get(key) == value)
+        elif op == "!=":
+            tests.append(lambda labels, key=key, value=value: labels.get(key) != value)
+        elif match["set"]:
+            values = {v.strip() for v in match["values"].split(",") if v.strip()}
+            if match["set"] == "in":
+                tests.append(lambda labels, key=key, values=values: labels.get(key) in values)
+            else:
+                tests.append(lambda labels, key=key, values=values: labels.get(key) not in values)
+        else:
+            tests.append(lambda labels, key=key: key in labels)
+    return lambda labels: all(test(labels or {}) for test in tests)
+
+
+def _field_text(obj: dict, path: str) -> str:
+    value = obj
+    for key in path.split("."):
+        value = value.get(key) if isinstance(value, dict) else None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return "" if value is None else str(value)
+
+
+def field_selector_matcher(selector: Optional[str]):
+    """Compile a field selector ('status.phase=Running,spec.nodeName!=n1') into a predicate."""
+    tests = []
+    for requirement in _split_selector(selector or ""):
+        match = re.match(r"^([^!=]+?)\s*(==|=|!=)\s*(.*)$", requirement)
+        if not match:
+            raise ValueError(f"Invalid field selector: {selector!r}")
+        path, op, value = match.groups()
+        equal = op != "!="
+        tests.append(
+            lambda obj, path=path, value=value, equal=equal: (
+                (_field_text(obj, path) == value) == equal
+            )
+        )
+    return lambda obj: all(test(obj) for test in tests)
+
+
+def _status(code: int, reason: str, message: str) -> bytes:
+    return json.dumps(
+        {
+            "kind": "Status",
+            "apiVersion": "v1",
+            "metadata": {},
+            "status": "Failure",
+            "message": message,
+            "reason": reason,
+            "code": code,
+        }
+    ).encode()
+
+
+class SnapshotRestClient:
+    """Answers an ApiClient's requests from a Snapshot instead of the network.
+
+    Only GETs are served; anything else, and watches (a snapshot never
+    changes), get a MethodNotAllowed status like a read-only API server would.
+    """
+
+    def __init__(self, snapshot: Snapshot):
+        self.snapshot = snapshot
+
+    def close(self):
+        self.snapshot.close()
+
+    def request(
+        self, method, url, headers=None, body=None, post_params=None, _request_timeout=None
+    ) -> "RESTResponse":
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query))
+        try:
+            if method.upper() != "GET" or query.get("watch", "").lower() in ("true", "1"):
+                return self._respond(
+                    405, _status(405, "MethodNotAllowed", "snapshots are read-only and static")
+                )
+            return self._get(parts.path, query, headers or {})
+        except ValueError as e:
+            return self._respond(400, _status(400, "BadRequest", str(e)))
+
+    def _respond(self, status: int, data: bytes, content_type: str = "application/json"):
+        from kubernetes.client.rest import RESTResponse
+
+        resp = urllib3.HTTPResponse(
+            body=io.BytesIO(data),
+            headers={"Content-Type": content_type, "Content-Length": str(len(data))},
+            status=status,
+            preload_content=False,
+        )
+        return RESTResponse(resp)
+
+    def _not_found(self, what: str):
+        return self._respond(404, _status(404, "NotFound", f"{what} not found in snapshot"))
+
+    def _get(self, path: str, query: dict, headers: dict):
+        document = self.snapshot.document(path)
+        if document is not None:
+            return self._respond(200, document)
+
+        segments = [segment for segment in path.split("/") if segment]
+        if segments[:1] == ["api"] and len(segments) >= 2:
+            prefix, rest = segments[:2], segments[2:]
+        elif segments[:1] == ["apis"] and len(segments) >= 3:
+            prefix, rest = segments[:3], segments[3:]
+        else:
+            return self._not_found(path)
+        base = "/" + "/".join(prefix)
+
+        namespace = None
+        if len(rest) >= 3 and rest[0] == "namespaces":
+            namespace, rest = rest[1], rest[2:]
+        resource = self.snapshot.resource(f"{base}/{rest[0]}") if rest else None
+        if resource is None or (namespace is not None and not resource.namespaced):
+            return self._not_found(path)
+
+        if len(rest) == 1:
+            return self._list(resource, namespace, query, headers)
+        name = rest[1]
+        entry = resource.find(namespace or "", name)
+        if entry is None:
+            return self._not_found(f'{resource.kind} "{name}"')
+        if len(rest) == 2:
+            return self._respond(200, self.snapshot.read(entry))
+        if rest[2:] == ["log"] and resource.kind == "Pod":
+            return self._log(namespace, name, query)
+        return self._not_found(path)
+
+    def _list(self, resource: _Resource, namespace, query: dict, headers: dict):
+        match_labels = label_selector_matcher(query.get("labelSelector"))
+        match_fields = field_selector_matcher(query.get("fieldSelector"))
+        filtered = bool(query.get("labelSelector") or query.get("fieldSelector"))
+        partial = _PARTIAL_METADATA in (headers.get("Accept") or "")
+        limit = int(query.get("limit") or 0)
+
+        start, end = resource.span(namespace)
+        token = query.get("continue")
+        if token:
+            # The continue token is the position to resume from.
+            if not token.isdigit() or not start <= int(token) <= end:
+                return self._respond(410, _status(410, "Expired", "invalid continue token"))
+            start = int(token)
+
+        items = []
+        position = start
+        while position < end and not (limit and len(items) >= limit):
+            raw = self.snapshot.read(resource.objects[position])
+            position += 1
+            if filtered or partial:
+                obj = json.loads(raw)
+                if not (match_labels(obj.get("metadata", {}).get("labels")) and match_fields(obj)):
+                    continue
+                if partial:
+                    raw = json.dumps(
+                        {
+                            "kind": "PartialObjectMetadata",
+                            "apiVersion": "meta.k8s.io/v1",
+                            "metadata": obj.get("metadata", {}),
+                        }
+                    ).encode()
+            items.append(raw)
+
+        metadata = {"resourceVersion": self.snapshot.id}
+        if position < end:
+            metadata["continue"] = str(position)
+            if not filtered:
+                metadata["remainingItemCount"] = end - position
+        if partial:
+            kind, api_version = "PartialObjectMetadataList", "meta.k8s.io/v1"
+        else:
+            kind, api_version = resource.list_kind, resource.api_version
+        head = json.dumps({"kind": kind, "apiVersion": api_version, "metadata": metadata})
+        return self._respond(200, head[:-1].encode() + b',"items":[' + b",".join(items) + b"]}")
+
+    def _log(self, namespace: str, pod: str, query: dict):
+        previous = query.get("previous", "").lower() in ("true", "1")
+        text = self.snapshot.log(namespace, pod, query.get("container"), previous)
+        if text is None:
+            return self._not_found(f'log of pod "{pod}"')
+        tail_lines = query.get("tailLines")
+        if tail_lines:
+            lines = text.splitlines(keepends=True)
+            text = b"".join(lines[-int(tail_lines) :]) if int(tail_lines) else b""
+        limit_bytes = query.get("limitBytes")
+        if limit_bytes:
+            text = text[: int(limit_bytes)]
+        return self._respond(200, text, "text/plain")
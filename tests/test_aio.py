@@ -0,0 +1,200 @@
+"""Tests for the asyncio variant of the Kubernetes Read-Only MCP Server."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from kubernetes_readonly_mcp import aio
+
+
+def _fake_pod(name, namespace="default"):
+    """Build a MagicMock shaped like a V1Pod."""
+    pod = MagicMock()
+    pod.metadata.name = name
+    pod.metadata.namespace = namespace
+    pod.metadata.creation_timestamp = datetime(2026, 5, 22)
+    pod.status.phase = "Running"
+    container = MagicMock()
+    container.name = "app"
+    pod.spec.containers = [container]
+    return pod
+
+
+class _LogResponse:
+    """An aiohttp-like streamed log response (read with _preload_content=False)."""
+
+    def __init__(self, text, status=200):
+        self.status = status
+        self.body = text.encode()
+        self.content = self
+        self.closed = False
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self.body), 4):
+            yield self.body[start : start + 4]
+
+    def close(self):
+        self.closed = True
+
+    def release(self):
+        pass
+
+
+def _patch_manager(fake_manager):
+    """Patch the async manager factory to return fake_manager."""
+    return patch("kubernetes_readonly_mcp.aio._get_manager", AsyncMock(return_value=fake_manager))
+
+
+def test_async_manager_shares_one_api_client():
+    """Every typed API and the dynamic client are built on the same ApiClient."""
+    with (
+        patch("kubernetes_readonly_mcp.aio.client") as mock_client,
+        patch("kubernetes_readonly_mcp.aio.config") as mock_config,
+        patch("kubernetes_readonly_mcp.aio.dynamic") as mock_dynamic,
+    ):
+        mock_config.load_kube_config = AsyncMock()
+        mock_dynamic.DynamicClient.return_value = asyncio.sleep(0, result="dyn")
+        manager = asyncio.run(aio.AsyncKubernetesManager.create())
+
+    api_client = mock_client.ApiClient.return_value
+    mock_client.CoreV1Api.assert_called_once_with(api_client)
+    mock_client.AppsV1Api.assert_called_once_with(api_client)
+    mock_dynamic.DynamicClient.assert_called_once_with(api_client)
+    assert manager.get_dynamic_api() == "dyn"
+
+
+def test_async_list_pods_matches_sync_shape():
+    """The async tools return the same native structures as the sync tools."""
+    fake_manager = MagicMock()
+    fake_manager.get_core_api().list_pod_for_all_namespaces = AsyncMock(
+        return_value=MagicMock(items=[_fake_pod("web-1")])
+    )
+
+    with _patch_manager(fake_manager):
+        result = asyncio.run(aio.list_pods())
+
+    assert result[0]["name"] == "web-1"
+    assert result[0]["creation_timestamp"] == "2026-05-22T00:00:00"
+    assert result[0]["containers"] == ["app"]
+
+
+def test_async_get_logs_returns_partial_results_in_order():
+    """Slow pods time out individually; the others still come back in order."""
+
+    async def read_log(name, **kwargs):
+        if name == "slow":
+            await asyncio.sleep(5)
+        return _LogResponse(f"log of {name}")
+
+    fake_manager = MagicMock()
+    core = fake_manager.get_core_api()
+    core.list_namespaced_pod = AsyncMock(
+        return_value=MagicMock(items=[_fake_pod("a"), _fake_pod("slow"), _fake_pod("b")])
+    )
+    core.read_namespaced_pod_log = read_log
+
+    with _patch_manager(fake_manager):
+        result = asyncio.run(
+            aio.get_logs(
+                resource_type="pod",
+                namespace="default",
+                label_selector="app=web",
+                pod_timeout=10,
+                deadline=0.2,
+            )
+        )
+
+    assert [r["pod_name"] for r in result["results"]] == ["a", "slow", "b"]
+    assert result["results"][0]["logs"] == ["log of a"]
+    assert "Timed out" in result["results"][1]["error"]
+    assert result["results"][2]["logs"] == ["log of b"]
+
+
+def test_async_get_pod_logs_streams_up_to_limit_bytes():
+    """The log body is streamed and cut at limit_bytes, like the sync tool."""
+    fake_manager = MagicMock()
+    core = fake_manager.get_core_api()
+    core.read_namespaced_pod = AsyncMock(return_value=_fake_pod("web-1"))
+    resp = _LogResponse("line one\nline two\n")
+    core.read_namespaced_pod_log = AsyncMock(return_value=resp)
+
+    with _patch_manager(fake_manager):
+        result = asyncio.run(aio.get_pod_logs("default", "web-1", limit_bytes=10))
+
+    assert result["logs"] == ["line one", "l"]
+    assert result["truncated"] is True
+    assert result["bytes_read"] == 10
+    assert resp.closed
+    kwargs = core.read_namespaced_pod_log.call_args.kwargs
+    assert kwargs["limit_bytes"] == 11
+    assert kwargs["_preload_content"] is False
+
+
+def test_async_get_logs_caps_total_bytes_across_pods():
+    """Once the response budget is spent, later pods return fewer lines or none."""
+    fake_manager = MagicMock()
+    core = fake_manager.get_core_api()
+    core.list_namespaced_pod = AsyncMock(
+        return_value=MagicMock(items=[_fake_pod("a"), _fake_pod("b"), _fake_pod("c")])
+    )
+    core.read_namespaced_pod_log = AsyncMock(
+        side_effect=lambda **kwargs: _LogResponse("0123456789\n" * 3)
+    )
+
+    with _patch_manager(fake_manager):
+        result = asyncio.run(
+            aio.get_logs(
+                resource_type="pod",
+                namespace="default",
+                label_selector="app=web",
+                max_concurrency=1,
+                max_response_bytes=40,
+            )
+        )
+
+    kept = [len(r["logs"]) for r in result["results"]]
+    assert sum(len(line) + 1 for r in result["results"] for line in r["logs"]) <= 40
+    assert kept[0] == 4  # three lines and the empty one after the last newline
+    assert all(r["truncated"] for r in result["results"][1:])
+    assert result["truncated"] is True
+    assert "40-byte response budget" in result["message"]
+
+
+def _owned_by(obj, kind, name):
+    """Give a MagicMock object one ownerReference."""
+    ref = MagicMock(kind=kind)
+    ref.name = name
+    obj.metadata.owner_references = [ref]
+    return obj
+
+
+def test_async_get_logs_resolves_deployment_pods_by_owner_references():
+    """A matchExpressions-only Deployment gets its own pods, not others sharing labels."""
+    deployment = MagicMock()
+    deployment.spec.selector.match_labels = None
+    deployment.spec.selector.match_expressions = [
+        MagicMock(key="app", operator="In", values=["web"])
+    ]
+    replica_sets = [_owned_by(MagicMock(), "Deployment", "web"), MagicMock()]
+    replica_sets[0].metadata.name = "web-abc"
+    replica_sets[1].metadata.name = "other-xyz"
+    replica_sets[1].metadata.owner_references = None
+    pods = [
+        _owned_by(_fake_pod("web-abc-1"), "ReplicaSet", "web-abc"),
+        _owned_by(_fake_pod("other-xyz-1"), "ReplicaSet", "other-xyz"),
+        _owned_by(_fake_pod("web-abc-2"), "ReplicaSet", "web-abc"),
+    ]
+
+    fake_manager = MagicMock()
+    apps = fake_manager.get_apps_api()
+    apps.read_namespaced_deployment = AsyncMock(return_value=deployment)
+    apps.list_namespaced_replica_set = AsyncMock(return_value=MagicMock(items=replica_sets))
+    core = fake_manager.get_core_api()
+    core.list_namespaced_pod = AsyncMock(return_value=MagicMock(items=pods))
+    core.read_namespaced_pod_log = AsyncMock(return_value=_LogResponse("ok"))
+
+    with _patch_manager(fake_manager):
+        result = asyncio.run(aio.get_logs(resource_type="deployment", name="web"))
+
+    assert [r["pod_name"] for r in result["results"]] == ["web-abc-1", "web-abc-2"]
+    assert "label_selector" not in core.list_namespaced_pod.call_args.kwargs
@@ -0,0 +1,127 @@
+"""Tests for the optional tool metrics."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kubernetes_readonly_mcp import metrics
+from kubernetes_readonly_mcp.server import _fan_out
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _api_client(status=200, body_bytes=100):
+    """An ApiClient stand-in whose rest client returns a response of body_bytes."""
+    api_client = MagicMock()
+    response = MagicMock(status=status)
+    response.response.tell.return_value = body_bytes
+    api_client.rest_client.request.return_value = response
+    return api_client
+
+
+def test_instrumented_is_a_no_op_when_disabled():
+    """With metrics off, tools are registered unwrapped."""
+
+    def tool():
+        return []
+
+    with patch.object(metrics, "ENABLED", False):
+        assert metrics.instrumented(tool) is tool
+
+
+def test_wrap_records_latency_api_requests_bytes_and_response_size():
+    """A wrapped tool call is attributed the API requests made during it."""
+    api_client = metrics.instrument_api_client(_api_client(body_bytes=250))
+
+    @metrics.wrap
+    def list_things():
+        api_client.rest_client.request("GET", "https://k8s/api/v1/pods")
+        api_client.rest_client.request("GET", "https://k8s/api/v1/pods?continue=x")
+        return [{"name": "a"}]
+
+    assert list_things() == [{"name": "a"}]
+    stats = metrics.snapshot()["list_things"]
+    assert stats["calls"] == 1
+    assert stats["api_requests"] == 2
+    assert stats["api_bytes"] == 500
+    assert stats["response_bytes"] == len('[{"name": "a"}]')
+    assert stats["latency_seconds"]["buckets"]["+Inf"] == 1
+
+
+def test_wrap_counts_errors_by_type():
+    """Error results, API error statuses and raised exceptions are counted by type."""
+    api_client = metrics.instrument_api_client(_api_client(status=404))
+
+    @metrics.wrap
+    def get_thing():
+        api_client.rest_client.request("GET", "https://k8s/api/v1/pods/x")
+        return {"error": "not found"}
+
+    @metrics.wrap
+    def broken():
+        raise RuntimeError("boom")
+
+    get_thing()
+    with pytest.raises(RuntimeError):
+        broken()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["get_thing"]["errors"] == {"ApiException:404": 1, "error_result": 1}
+    assert snapshot["broken"]["errors"] == {"RuntimeError": 1}
+
+
+def test_requests_outside_tool_calls_are_not_counted():
+    """Background requests (e.g. watch-cache reflectors) are passed straight through."""
+    api_client = _api_client()
+    original = api_client.rest_client.request
+    metrics.instrument_api_client(api_client)
+
+    api_client.rest_client.request("GET", "https://k8s/api/v1/pods")
+
+    original.assert_called_once()
+    assert metrics.snapshot() == {}
+
+
+def test_fan_out_workers_are_attributed_to_the_calling_tool():
+    """API requests made on _fan_out worker threads count toward the tool."""
+    api_client = metrics.instrument_api_client(_api_client())
+
+    @metrics.wrap
+    def get_many():
+        return _fan_out(
+            lambda item: api_client.rest_client.request("GET", f"https://k8s/{item}").status,
+            ["a", "b", "c"],
+            max_workers=3,
+            deadline=5,
+            on_timeout=lambda item: None,
+        )
+
+    with patch.object(metrics, "ENABLED", True):
+        assert get_many() == [200, 200, 200]
+    assert metrics.snapshot()["get_many"]["api_requests"] == 3
+
+
+def test_render_prometheus_exposes_histogram_and_counters():
+    """The Prometheus text has a histogram per tool and labelled counters."""
+
+    @metrics.wrap
+    def list_pods():
+        return {"error": "boom"}
+
+    list_pods()
+    text = metrics.render_prometheus()
+
+    assert "# TYPE kubernetes_readonly_mcp_tool_duration_seconds histogram" in text
+    assert (
+        'kubernetes_readonly_mcp_tool_duration_seconds_bucket{tool="list_pods",le="+Inf"} 1' in text
+    )
+    assert 'kubernetes_readonly_mcp_tool_duration_seconds_count{tool="list_pods"} 1' in text
+    assert (
+        'kubernetes_readonly_mcp_tool_errors_total{tool="list_pods",type="error_result"} 1' in text
+    )
+    assert 'kubernetes_readonly_mcp_api_requests_total{tool="list_pods"} 0' in text
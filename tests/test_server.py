@@ -1,28 +1,69 @@
 """Tests for the Kubernetes Read-Only MCP Server."""
 
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
-from kubernetes.dynamic.resource import ResourceList
+from kubernetes.dynamic.discovery import LazyDiscoverer
+from kubernetes.dynamic.resource import ResourceInstance, ResourceList
 
 from kubernetes_readonly_mcp.server import (
+    _BATCH_TOOLS,
     KubernetesManager,
+    _apply_budget,
+    _coalesced,
+    _coalesced_calls,
+    _discovery_cache_file,
+    _dumps,
+    _EventFeed,
+    _get_manager,
+    _holding_managers,
+    _log_tails,
+    _LogTail,
+    _manager_users,
+    _MemoizedDiscoverer,
+    _OwnerGraph,
+    _parse_field_path,
+    _project,
+    _Reflector,
+    _ResponseCache,
     _sanitize,
+    _UsageRing,
+    _UsageSampler,
+    batch_read,
+    follow_logs,
+    get_logs,
+    get_owned_resources,
+    get_pod_logs,
     get_resource,
     list_api_resources,
     list_namespaces,
+    list_pods,
     list_resource,
+    summarize_resource,
+    top_nodes,
+    top_pods,
+    watch_events_since,
 )
 
 
 @pytest.fixture
-def mock_k8s_client():
+def mock_k8s_client(tmp_path):
     """Mock the kubernetes client, config, and dynamic modules used by the server."""
     with (
         patch("kubernetes_readonly_mcp.server.client") as mock_client,
         patch("kubernetes_readonly_mcp.server.config"),
         patch("kubernetes_readonly_mcp.server.dynamic") as mock_dynamic,
+        patch("kubernetes_readonly_mcp.server.DISCOVERY_CACHE_DIR", str(tmp_path)),
     ):
         yield mock_client, mock_dynamic
 
@@ -42,6 +83,146 @@ def test_kubernetes_manager_initialization(mock_k8s_client):
     assert manager.get_dynamic_api() is mock_dynamic.DynamicClient.return_value
 
 
+def test_manager_for_named_context_uses_its_own_api_client(mock_k8s_client):
+    """A named context gets a dedicated ApiClient shared by all of its API objects."""
+    mock_client, _ = mock_k8s_client
+    with patch("kubernetes_readonly_mcp.server.config") as mock_config:
+        manager = KubernetesManager("prod")
+
+    mock_config.new_client_from_config.assert_called_once()
+    assert mock_config.new_client_from_config.call_args.kwargs["context"] == "prod"
+    mock_config.load_kube_config.assert_not_called()
+    api_client = mock_config.new_client_from_config.return_value
+    assert manager.api_client is api_client
+    mock_client.CoreV1Api.assert_called_once_with(api_client)
+
+
+def test_manager_tunes_one_shared_connection_pool(mock_k8s_client):
+    """All API objects share one ApiClient whose pool size and keepalive are configured."""
+    mock_client, mock_dynamic = mock_k8s_client
+    configuration = mock_client.Configuration.get_default_copy.return_value
+
+    with patch("kubernetes_readonly_mcp.server.POOL_MAXSIZE", 64):
+        KubernetesManager()
+
+    mock_client.ApiClient.assert_called_once_with(configuration)
+    api_client = mock_client.ApiClient.return_value
+    for api in ("CoreV1Api", "AppsV1Api", "BatchV1Api", "NetworkingV1Api"):
+        getattr(mock_client, api).assert_called_once_with(api_client)
+    assert mock_dynamic.DynamicClient.call_args.args[0] is api_client
+    assert configuration.connection_pool_maxsize == 64
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in configuration.socket_options
+
+
+def test_get_manager_pools_contexts_and_evicts_least_recently_used():
+    """Managers are reused per context; the coldest one is closed past the limit."""
+    created = {}
+
+    def make_manager(context):
+        created[context] = MagicMock(context=context)
+        return created[context]
+
+    with (
+        patch("kubernetes_readonly_mcp.server._managers", OrderedDict()),
+        patch("kubernetes_readonly_mcp.server.KubernetesManager", side_effect=make_manager),
+        patch("kubernetes_readonly_mcp.server.MAX_CONTEXTS", 2),
+    ):
+        assert _get_manager("a") is created["a"]
+        assert _get_manager("b") is created["b"]
+        assert _get_manager("a") is created["a"]  # "b" is now the coldest.
+        _get_manager("c")
+
+        created["b"].close.assert_called_once()
+        created["a"].close.assert_not_called()
+        assert _get_manager("a") is created["a"]
+
+
+def test_get_manager_closes_idle_managers():
+    """A manager unused for longer than the idle timeout is closed on the next call."""
+    with (
+        patch("kubernetes_readonly_mcp.server._managers", OrderedDict()),
+        patch("kubernetes_readonly_mcp.server.KubernetesManager"),
+        patch("kubernetes_readonly_mcp.server.CONTEXT_IDLE_SECONDS", 60),
+        patch("kubernetes_readonly_mcp.server.time.monotonic", side_effect=[0, 100]),
+    ):
+        idle = _get_manager("old")
+        _get_manager("new")
+
+    idle.close.assert_called_once()
+
+
+def test_get_manager_reconnects_if_evicted_while_looking_up():
+    """A context evicted between the lookup and the update is connected again."""
+    created = []
+
+    def make_manager(context):
+        created.append(MagicMock(context=context))
+        return created[-1]
+
+    class RacingPool(OrderedDict):
+        race = True
+
+        def get(self, key, default=None):
+            entry = super().get(key, default)
+            if self.race:
+                # Another context's call evicts this one right after the lookup.
+                self.race = False
+                self.pop(key, None)
+            return entry
+
+    pool = RacingPool()
+    with (
+        patch("kubernetes_readonly_mcp.server._managers", pool),
+        patch("kubernetes_readonly_mcp.server.KubernetesManager", side_effect=make_manager),
+    ):
+        pool.race = False
+        _get_manager("a")
+        pool.race = True
+        manager = _get_manager("a")
+
+        assert manager is created[1]
+        assert pool["a"][0] is manager
+
+
+def test_evicted_manager_is_closed_after_the_calls_using_it():
+    """Eviction does not close a manager under a tool call that is still using it."""
+    created = {}
+
+    def make_manager(context):
+        created[context] = MagicMock(context=context)
+        return created[context]
+
+    @_holding_managers
+    def tool():
+        _get_manager("a")
+        _get_manager("b")  # Evicts "a", which this call still holds.
+        created["a"].close.assert_not_called()
+
+    with (
+        patch("kubernetes_readonly_mcp.server._managers", OrderedDict()),
+        patch("kubernetes_readonly_mcp.server.KubernetesManager", side_effect=make_manager),
+        patch("kubernetes_readonly_mcp.server.MAX_CONTEXTS", 1),
+    ):
+        tool()
+
+    created["a"].close.assert_called_once()
+    created["b"].close.assert_not_called()
+    assert not _manager_users
+
+
+def test_tools_route_context_to_its_manager():
+    """The optional context argument selects the manager the tool talks to."""
+    fake_manager = MagicMock()
+    fake_manager.get_core_api().list_namespace.return_value.items = []
+
+    with patch(
+        "kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager
+    ) as get_manager:
+        list_namespaces(context="staging")
+
+    get_manager.assert_called_once_with("staging")
+
+
 def test_list_namespaces_returns_native_objects():
     """Tools return native Python objects (not JSON strings) for structured output."""
     ns = MagicMock()
@@ -278,3 +459,1439 @@ def test_generic_tools_errors_return_dict():
     with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
         assert list_resource(kind="Bogus") == {"error": "no api"}
         assert get_resource(kind="Bogus", name="x") == {"error": "no api"}
+
+
+def _fake_pod(name, namespace="default", resource_version="1"):
+    """Build a MagicMock shaped like a V1Pod for the typed list tools."""
+    pod = MagicMock()
+    pod.metadata.name = name
+    pod.metadata.namespace = namespace
+    pod.metadata.resource_version = resource_version
+    pod.metadata.creation_timestamp = None
+    pod.spec.containers = []
+    return pod
+
+
+def _raw_pod(name, namespace="default", resource_version="1"):
+    """Build a raw Pod dict as the API server returns it."""
+    return {
+        "metadata": {"name": name, "namespace": namespace, "resourceVersion": resource_version},
+        "spec": {"containers": []},
+        "status": {},
+    }
+
+
+def _raw_response(body):
+    """Wrap a dict like the HTTP response returned with _preload_content=False."""
+    resp = MagicMock()
+    resp.data = json.dumps(body).encode()
+    return resp
+
+
+def test_reflector_lists_once_then_serves_from_memory():
+    """The reflector does one LIST; later reads never call the API again."""
+    list_func = MagicMock()
+    list_func.return_value = _raw_response(
+        {
+            "items": [_raw_pod("a"), _raw_pod("b", namespace="kube-system")],
+            "metadata": {"resourceVersion": "100"},
+        }
+    )
+
+    reflector = _Reflector(list_func)
+    with patch.object(_Reflector, "_start"):
+        assert len(reflector.list()) == 2
+        assert [p["metadata"]["name"] for p in reflector.list("kube-system")] == ["b"]
+
+    list_func.assert_called_once_with(watch=False, _preload_content=False)
+    list_func.return_value.release_conn.assert_called_once()
+
+
+def test_reflector_applies_watch_events_and_tracks_resource_version():
+    """ADDED/MODIFIED/DELETED events update the store and the resourceVersion."""
+    list_func = MagicMock()
+    list_func.return_value = _raw_response(
+        {"items": [_raw_pod("a")], "metadata": {"resourceVersion": "100"}}
+    )
+    reflector = _Reflector(list_func)
+    with patch.object(_Reflector, "_start"):
+        reflector.list()
+
+    events = [
+        {"type": "ADDED", "object": _raw_pod("b", resource_version="101")},
+        {"type": "DELETED", "object": _raw_pod("a", resource_version="102")},
+    ]
+    with patch("kubernetes_readonly_mcp.server.watch.Watch") as mock_watch:
+        mock_watch.return_value.stream.return_value = iter(events)
+        reflector._watch_once()
+
+    _, kwargs = mock_watch.return_value.stream.call_args
+    assert kwargs["resource_version"] == "100"
+    assert [p["metadata"]["name"] for p in reflector.list()] == ["b"]
+    assert reflector._resource_version == "102"
+
+
+def test_list_pods_uses_watch_cache_unless_fresh():
+    """With the watch cache on, list_pods reads the reflector; fresh=True bypasses it."""
+    fake_manager = MagicMock()
+    fake_manager.get_reflector.return_value.list.return_value = [_raw_pod("cached")]
+    fake_manager.get_core_api().list_pod_for_all_namespaces.return_value = _raw_response(
+        {"items": [_raw_pod("live")], "metadata": {}}
+    )
+
+    with (
+        patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager),
+        patch("kubernetes_readonly_mcp.server.WATCH_CACHE_ENABLED", True),
+    ):
+        assert list_pods()[0]["name"] == "cached"
+        assert list_pods(fresh=True)[0]["name"] == "live"
+
+    fake_manager.get_reflector.assert_called_once_with("pods")
+
+
+_RAW_FIXTURES = [
+    (
+        "V1PodList",
+        "_pod_summary",
+        {
+            "metadata": {
+                "name": "web-0",
+                "namespace": "default",
+                "labels": {"app": "web"},
+                "creationTimestamp": "2024-05-01T12:00:00Z",
+            },
+            "spec": {"nodeName": "n1", "containers": [{"name": "app"}, {"name": "sidecar"}]},
+            "status": {"phase": "Running", "podIP": "10.0.0.5"},
+        },
+    ),
+    (
+        "V1DeploymentList",
+        "_deployment_summary",
+        {
+            "metadata": {"name": "web", "namespace": "default"},
+            "spec": {
+                "replicas": 3,
+                "selector": {"matchLabels": {"app": "web"}},
+                "template": {"spec": {"containers": [{"name": "app"}]}},
+            },
+            "status": {"availableReplicas": 2},
+        },
+    ),
+    (
+        "V1ServiceList",
+        "_service_summary",
+        {
+            "metadata": {"name": "web", "namespace": "default"},
+            "spec": {
+                "type": "NodePort",
+                "clusterIP": "10.96.0.10",
+                "externalIPs": ["192.0.2.1"],
+                "selector": {"app": "web"},
+                "ports": [{"name": "http", "port": 80, "targetPort": 8080, "nodePort": 30080}],
+            },
+        },
+    ),
+    (
+        "V1NamespaceList",
+        "_namespace_summary",
+        {"metadata": {"name": "default"}, "status": {"phase": "Active"}},
+    ),
+    (
+        "CoreV1EventList",
+        "_event_summary",
+        {
+            "metadata": {"name": "web-0.17c", "namespace": "default"},
+            "involvedObject": {"kind": "Pod", "name": "web-0", "namespace": "default"},
+            "type": "Warning",
+            "reason": "BackOff",
+            "message": "Back-off restarting failed container",
+            "count": 3,
+            "firstTimestamp": "2024-05-01T12:00:00Z",
+            "lastTimestamp": "2024-05-01T12:05:00Z",
+            "source": {"component": "kubelet", "host": "n1"},
+        },
+    ),
+    (
+        "V1NodeList",
+        "_node_summary",
+        {
+            "metadata": {
+                "name": "n1",
+                "labels": {"node-role.kubernetes.io/control-plane": ""},
+            },
+            "spec": {"taints": [{"key": "k", "effect": "NoSchedule"}]},
+            "status": {
+                "conditions": [{"type": "Ready", "status": "True"}],
+                "addresses": [{"type": "InternalIP", "address": "10.0.0.1"}],
+                "capacity": {"cpu": "4", "memory": "8Gi", "pods": "110"},
+                "allocatable": {"cpu": "3900m", "memory": "7Gi", "pods": "110"},
+                "nodeInfo": {
+                    "kubeletVersion": "v1.30.0",
+                    "osImage": "Linux",
+                    "containerRuntimeVersion": "containerd://1.7",
+                    "architecture": "amd64",
+                    "bootID": "",
+                    "kernelVersion": "",
+                    "kubeProxyVersion": "",
+                    "machineID": "",
+                    "operatingSystem": "linux",
+                    "systemUUID": "",
+                },
+            },
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize("list_type,summary,item", _RAW_FIXTURES)
+def test_raw_summaries_match_model_summaries(list_type, summary, item):
+    """The raw-JSON fast path produces exactly what the model-based summaries do."""
+    from kubernetes import client as real_client
+
+    from kubernetes_readonly_mcp import server
+
+    body = json.dumps({"items": [item], "metadata": {}})
+    model = real_client.ApiClient().deserialize(body, list_type, "application/json").items[0]
+
+    assert getattr(server, summary + "_raw")(item) == getattr(server, summary)(model)
+
+
+def test_list_pods_over_budget_returns_first_page_and_summary():
+    """A list larger than the response budget becomes a first page plus counts."""
+    raw = [_raw_pod(f"p{i}", namespace=f"ns-{i % 2}") for i in range(10)]
+    for i, pod in enumerate(raw):
+        pod["status"]["phase"] = "Running" if i < 7 else "Pending"
+    fake_manager = MagicMock()
+    fake_manager.get_core_api().list_pod_for_all_namespaces.return_value = _raw_response(
+        {"items": raw, "metadata": {}}
+    )
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        full = list_pods(max_response_bytes=0)
+        result = list_pods(max_response_bytes=len(json.dumps(full[:3])) + 10)
+
+    assert isinstance(full, list) and len(full) == 10
+    assert result["truncated"] is True
+    assert [p["name"] for p in result["items"]] == ["p0", "p1", "p2"]
+    assert result["returned_count"] == 3
+    assert result["total_count"] == 10
+    assert result["summary"] == {
+        "by_namespace": {"ns-0": 5, "ns-1": 5},
+        "by_status": {"Running": 7, "Pending": 3},
+    }
+
+
+def test_apply_budget_stops_measuring_at_first_item_over_budget():
+    """Items are measured one at a time and nothing past the budget is serialized."""
+    items = [{"name": f"item-{i}"} for i in range(100)]
+    with patch(
+        "kubernetes_readonly_mcp.server._json_size", side_effect=lambda item: 10
+    ) as json_size:
+        kept, overflow = _apply_budget(items, 50, {"by_name": lambda item: item["name"]})
+
+    assert len(kept) == 4  # 2 + 4 * 11 <= 50 < 2 + 5 * 11
+    assert json_size.call_count == 5
+    assert overflow["total_count"] == 100
+    # High-cardinality groups are capped and the rest folded into "<other>".
+    assert len(overflow["summary"]["by_name"]) == 51
+    assert overflow["summary"]["by_name"]["<other>"] == 50
+
+
+def test_list_resource_pagination_returns_cursor():
+    """limit/continue_token map to the chunked LIST and the next cursor is returned."""
+    item = MagicMock()
+    item.to_dict.return_value = {"kind": "ConfigMap", "metadata": {"name": "c1"}}
+
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_resource.get.return_value.items = [item]
+    fake_resource.get.return_value.metadata = {"continue": "next-page", "remainingItemCount": 41}
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = list_resource(kind="ConfigMap", limit=1, continue_token="this-page")
+
+    _, kwargs = fake_resource.get.call_args
+    assert kwargs["limit"] == 1
+    assert kwargs["_continue"] == "this-page"
+    assert result["items"][0]["metadata"]["name"] == "c1"
+    assert result["continue_token"] == "next-page"
+    assert result["remaining_item_count"] == 41
+
+
+def test_list_pods_pagination_skips_watch_cache():
+    """Paged list_pods calls always go to the API server and return a page dict."""
+    fake_manager = MagicMock()
+    fake_manager.get_core_api().list_namespaced_pod.return_value = _raw_response(
+        {"items": [_raw_pod("a")], "metadata": {"continue": ""}}
+    )
+
+    with (
+        patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager),
+        patch("kubernetes_readonly_mcp.server.WATCH_CACHE_ENABLED", True),
+    ):
+        result = list_pods(namespace="default", limit=500)
+
+    fake_manager.get_reflector.assert_not_called()
+    fake_manager.get_core_api().list_namespaced_pod.assert_called_once_with(
+        namespace="default", watch=False, limit=500, _continue=None, _preload_content=False
+    )
+    assert [p["name"] for p in result["items"]] == ["a"]
+    # An empty continue field means this was the last page.
+    assert result["continue_token"] is None
+
+
+def _log_response(text, chunk_size=None):
+    """Fake a streamed (_preload_content=False) log response."""
+    data = text.encode()
+    chunk_size = chunk_size or len(data) or 1
+    resp = MagicMock()
+    resp.stream.return_value = iter(
+        [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+    )
+    return resp
+
+
+def test_get_logs_fans_out_and_keeps_order_with_partial_results():
+    """Pods are read in parallel; results keep pod order and slow pods time out."""
+    release = threading.Event()
+    pods = [_raw_pod(f"p{i}") for i in range(4)]
+    for pod in pods:
+        pod["spec"]["containers"] = [{"name": "app"}]
+
+    def read_log(name, **kwargs):
+        if name == "p1":
+            release.wait(5)  # Simulate a hung pod.
+        return _log_response(f"log of {name}")
+
+    fake_manager = MagicMock()
+    core = fake_manager.get_core_api()
+    core.list_namespaced_pod.return_value = _raw_response({"items": pods})
+    core.read_namespaced_pod_log.side_effect = read_log
+
+    try:
+        with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+            result = get_logs(
+                resource_type="pod",
+                namespace="default",
+                label_selector="app=web",
+                max_concurrency=2,
+                pod_timeout=3,
+                deadline=0.5,
+            )
+    finally:
+        release.set()
+
+    names = [r["pod_name"] for r in result["results"]]
+    assert names == ["p0", "p1", "p2", "p3"]
+    assert "Timed out" in result["results"][1]["error"]
+    assert result["results"][3]["logs"] == ["log of p3"]
+    # The per-pod timeout is passed through to the API request.
+    assert core.read_namespaced_pod_log.call_args.kwargs["_request_timeout"] == 3
+    assert result["results"][3]["truncated"] is False
+
+
+def test_get_logs_caps_total_bytes_across_pods():
+    """The response budget bounds the log lines of all pods together."""
+    pods = [_raw_pod(f"p{i}") for i in range(4)]
+    for pod in pods:
+        pod["spec"]["containers"] = [{"name": "app"}]
+    text = ("x" * 49 + "\n") * 2
+
+    fake_manager = MagicMock()
+    core = fake_manager.get_core_api()
+    core.list_namespaced_pod.return_value = _raw_response({"items": pods})
+    core.read_namespaced_pod_log.side_effect = lambda **kwargs: _log_response(text)
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        capped = get_logs(
+            resource_type="pod",
+            namespace="default",
+            label_selector="app=web",
+            max_concurrency=1,
+            max_response_bytes=250,
+        )
+        unlimited = get_logs(
+            resource_type="pod",
+            namespace="default",
+            label_selector="app=web",
+            max_response_bytes=0,
+        )
+
+    results = capped["results"]
+    assert [len(r["logs"]) for r in results] == [3, 3, 0, 0]
+    assert [r["truncated"] for r in results] == [False, False, True, True]
+    assert capped["truncated"] is True
+    assert "250-byte response budget" in capped["message"]
+    # Later pods only read what the budget had left.
+    assert core.read_namespaced_pod_log.call_args_list[2].kwargs["limit_bytes"] == 49
+    assert "truncated" not in unlimited
+    assert all(len(r["logs"]) == 3 for r in unlimited["results"])
+
+
+def test_get_logs_pattern_returns_matches_with_context():
+    """With a pattern, only matching lines and their context survive the stream."""
+    pod = _raw_pod("p0")
+    pod["spec"]["containers"] = [{"name": "app"}]
+    text = "\n".join(
+        ["ok 1", "ok 2", "ERROR boom", "at frame", "ok 3", "ok 4", "ok 5", "ERROR again"]
+    )
+
+    fake_manager = MagicMock()
+    core = fake_manager.get_core_api()
+    core.list_namespaced_pod.return_value = _raw_response({"items": [pod]})
+    core.read_namespaced_pod_log.return_value = _log_response(text, chunk_size=5)
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = get_logs(
+            resource_type="pod",
+            namespace="default",
+            label_selector="app=web",
+            pattern="ERROR",
+            context_lines=1,
+        )
+
+    entry = result["results"][0]
+    assert entry["logs"] == ["ok 2", "ERROR boom", "at frame", "--", "ok 5", "ERROR again"]
+    assert entry["matches"] == 2
+    assert entry["bytes_read"] == len(text)
+    assert entry["truncated"] is False
+
+
+def test_get_logs_invalid_pattern_returns_error():
+    """A regex that does not compile is reported before any API call."""
+    fake_manager = MagicMock()
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = get_logs(resource_type="pod", label_selector="app=web", pattern="(")
+
+    assert result["error"].startswith("Invalid pattern")
+    fake_manager.get_core_api().list_pod_for_all_namespaces.assert_not_called()
+
+
+def test_get_pod_logs_stops_reading_at_byte_limit():
+    """The log stream is read only up to limit_bytes and reported as truncated."""
+    fake_manager = MagicMock()
+    core = fake_manager.get_core_api()
+    core.read_namespaced_pod.return_value = _fake_pod("p0")
+    resp = _log_response("line1\nline2\nline3\n", chunk_size=4)
+    core.read_namespaced_pod_log.return_value = resp
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = get_pod_logs(namespace="default", pod_name="p0", limit_bytes=8)
+
+    assert result["logs"] == ["line1", "li"]
+    assert result["truncated"] is True
+    assert result["bytes_read"] == 8
+    kwargs = core.read_namespaced_pod_log.call_args.kwargs
+    # One byte over the budget is requested to detect truncation.
+    assert kwargs["limit_bytes"] == 9
+    assert kwargs["_preload_content"] is False
+    resp.close.assert_called_once()
+    resp.release_conn.assert_called_once()
+
+
+def test_get_pod_logs_limit_is_capped_by_server_maximum():
+    """limit_bytes cannot raise the server-wide maximum; a short log is not truncated."""
+    fake_manager = MagicMock()
+    core = fake_manager.get_core_api()
+    core.read_namespaced_pod.return_value = _fake_pod("p0")
+    core.read_namespaced_pod_log.return_value = _log_response("ok")
+
+    with (
+        patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager),
+        patch("kubernetes_readonly_mcp.server.LOG_MAX_BYTES", 100),
+    ):
+        result = get_pod_logs(namespace="default", pod_name="p0", limit_bytes=10_000)
+
+    assert result["logs"] == ["ok"]
+    assert result["truncated"] is False
+    assert result["bytes_read"] == 2
+    assert core.read_namespaced_pod_log.call_args.kwargs["limit_bytes"] == 101
+
+
+def test_memoized_discoverer_caches_lookups_until_invalidated():
+    """resources.get(api_version, kind) resolves once; invalidation clears the memo."""
+    with (
+        patch.object(LazyDiscoverer, "__init__", return_value=None),
+        patch.object(LazyDiscoverer, "get", return_value="ingress-resource") as base_get,
+        patch.object(LazyDiscoverer, "invalidate_cache"),
+    ):
+        discoverer = _MemoizedDiscoverer(MagicMock(), "/tmp/unused.json")
+        for _ in range(3):
+            assert (
+                discoverer.get(api_version="networking.k8s.io/v1", kind="Ingress")
+                == "ingress-resource"
+            )
+        assert base_get.call_count == 1
+
+        discoverer.invalidate_cache()
+        discoverer.get(api_version="networking.k8s.io/v1", kind="Ingress")
+        assert base_get.call_count == 2
+
+
+def test_discovery_cache_file_keyed_by_version_and_expired_by_ttl(tmp_path):
+    """The cache path changes with the server version and stale files are removed."""
+    api_client = MagicMock()
+    api_client.configuration.host = "https://cluster.example:6443"
+
+    def cache_file(version):
+        with patch("kubernetes_readonly_mcp.server.client") as mock_client:
+            mock_client.VersionApi.return_value.get_code.return_value.git_version = version
+            return _discovery_cache_file(api_client)
+
+    with (
+        patch("kubernetes_readonly_mcp.server.DISCOVERY_CACHE_DIR", str(tmp_path)),
+        patch("kubernetes_readonly_mcp.server.DISCOVERY_CACHE_TTL_SECONDS", 60),
+    ):
+        path = cache_file("v1.31.0")
+        assert path != cache_file("v1.32.0")
+
+        with open(path, "w") as f:
+            f.write("{}")
+        assert os.path.exists(cache_file("v1.31.0"))  # Fresh file is kept.
+
+        os.utime(path, (0, 0))
+        cache_file("v1.31.0")
+        assert not os.path.exists(path)  # Expired file is dropped.
+
+
+def _resource_instance(obj):
+    """Wrap a raw dict the way the dynamic client does."""
+    return ResourceInstance(None, obj)
+
+
+def test_project_keeps_only_requested_paths():
+    """Dotted, indexed, wildcard and JSONPath-style paths project nested fields."""
+    pod = _resource_instance(
+        {
+            "kind": "Pod",
+            "metadata": {
+                "name": "web-1",
+                "labels": {"app.kubernetes.io/name": "web"},
+                "ownerReferences": [{"kind": "ReplicaSet", "name": "web-abc"}],
+            },
+            "spec": {
+                "containers": [
+                    {"name": "app", "image": "nginx:1", "env": [{"name": "A"}]},
+                    {"name": "sidecar", "image": "envoy:1"},
+                ]
+            },
+            "status": {"phase": "Running"},
+        }
+    )
+    paths = [
+        _parse_field_path(p)
+        for p in (
+            "{.metadata.name}",
+            "$.status.phase",
+            "metadata.labels['app.kubernetes.io/name']",
+            "metadata.ownerReferences",
+            "spec.containers[*].image",
+            "spec.containers[*].name",
+            "status.missing",
+        )
+    ]
+
+    assert _project(pod, paths) == {
+        "metadata": {
+            "name": "web-1",
+            "labels": {"app.kubernetes.io/name": "web"},
+            "ownerReferences": [{"kind": "ReplicaSet", "name": "web-abc"}],
+        },
+        "spec": {
+            "containers": [
+                {"image": "nginx:1", "name": "app"},
+                {"image": "envoy:1", "name": "sidecar"},
+            ]
+        },
+        "status": {"phase": "Running"},
+    }
+
+
+def test_project_lines_up_wildcard_and_index_paths_on_one_list():
+    """An indexed path keeps its element's position, so '*' paths are not lost."""
+    pod = _resource_instance(
+        {
+            "kind": "Pod",
+            "spec": {
+                "containers": [
+                    {"name": "app", "image": "nginx:1"},
+                    {"name": "sidecar", "image": "envoy:1"},
+                ]
+            },
+        }
+    )
+    for order in ((0, 1), (1, 0)):
+        texts = ("spec.containers[*].name", "spec.containers[1].image")
+        paths = [_parse_field_path(texts[i]) for i in order]
+
+        assert _project(pod, paths) == {
+            "spec": {"containers": [{"name": "app"}, {"name": "sidecar", "image": "envoy:1"}]}
+        }
+
+    only_index = [_parse_field_path("spec.containers[1].image")]
+    assert _project(pod, only_index) == {"spec": {"containers": [None, {"image": "envoy:1"}]}}
+
+
+def test_list_resource_fields_projection_still_redacts_secrets():
+    """Projection cannot be used to read Secret values past _sanitize."""
+    secret = _resource_instance(
+        {
+            "kind": "Secret",
+            "type": "Opaque",
+            "metadata": {"name": "s"},
+            "data": {"password": "c2VjcmV0"},
+        }
+    )
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_resource.get.return_value.items = [secret]
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = list_resource(kind="Secret", fields=["metadata.name", "data", "type"])
+
+    assert result == [{"metadata": {"name": "s"}, "type": "Opaque"}]
+
+
+def test_get_resource_invalid_field_path_returns_error():
+    """A malformed field path surfaces as an {'error': ...} dict."""
+    fake_manager, _ = _fake_manager_with_dynamic()
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = get_resource(kind="Pod", name="x", fields=["spec.containers[oops"])
+
+    assert "Invalid field path" in result["error"]
+
+
+def test_list_resource_metadata_only_sends_partial_metadata_accept():
+    """metadata_only asks for PartialObjectMetadataList and still sanitizes Secrets."""
+    partial = _resource_instance(
+        {
+            "apiVersion": "meta.k8s.io/v1",
+            "kind": "PartialObjectMetadata",
+            "metadata": {
+                "name": "s",
+                "annotations": {"kubectl.kubernetes.io/last-applied-configuration": "{}"},
+            },
+        }
+    )
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_resource.get.return_value.items = [partial]
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = list_resource(kind="Secret", metadata_only=True)
+
+    accept = fake_resource.get.call_args.kwargs["header_params"]["Accept"]
+    assert "as=PartialObjectMetadataList" in accept
+    assert "kubectl.kubernetes.io/last-applied-configuration" not in (
+        result[0]["metadata"]["annotations"]
+    )
+
+
+def test_list_pods_metadata_only_summarizes_partial_objects():
+    """Typed list tools return a compact metadata summary in metadata_only mode."""
+    partial = _resource_instance(
+        {
+            "kind": "PartialObjectMetadata",
+            "metadata": {
+                "name": "web-1",
+                "namespace": "default",
+                "labels": {"app": "web"},
+                "creationTimestamp": "2026-05-22T00:00:00Z",
+                "ownerReferences": [{"kind": "ReplicaSet", "name": "web-abc", "controller": True}],
+            },
+        }
+    )
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_resource.get.return_value.items = [partial]
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = list_pods(namespace="default", metadata_only=True)
+
+    fake_manager.get_dynamic_api().resources.get.assert_called_once_with(
+        api_version="v1", kind="Pod"
+    )
+    fake_manager.get_core_api().list_namespaced_pod.assert_not_called()
+    assert result == [
+        {
+            "name": "web-1",
+            "namespace": "default",
+            "labels": {"app": "web"},
+            "owner_references": [{"kind": "ReplicaSet", "name": "web-abc", "controller": True}],
+            # Same rendering as the typed tools' datetime.isoformat().
+            "creation_timestamp": "2026-05-22T00:00:00+00:00",
+        }
+    ]
+
+
+def _summary_page(objs, continue_token=""):
+    page = MagicMock()
+    page.items = [_resource_instance(obj) for obj in objs]
+    page.metadata = {"continue": continue_token}
+    return page
+
+
+def _summary_pod(name, phase, node, restarts, waiting=None):
+    statuses = [{"restartCount": r} for r in restarts]
+    if waiting:
+        statuses[0]["state"] = {"waiting": {"reason": waiting}}
+    return {
+        "kind": "Pod",
+        "metadata": {"name": name, "namespace": "default"},
+        "spec": {"nodeName": node},
+        "status": {"phase": phase, "containerStatuses": statuses},
+    }
+
+
+def test_summarize_resource_groups_and_aggregates_across_pages():
+    """summarize_resource follows continue tokens and folds every page into groups."""
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_resource.get.side_effect = [
+        _summary_page(
+            [
+                _summary_pod("a", "Running", "n1", [1, 2]),
+                _summary_pod("b", "Running", "n1", [0]),
+            ],
+            continue_token="page-2",
+        ),
+        _summary_page([_summary_pod("c", "Pending", None, [])]),
+    ]
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = summarize_resource(
+            kind="Pod",
+            group_by=["status.phase", "spec.nodeName"],
+            stats=["status.containerStatuses[*].restartCount"],
+        )
+
+    first, second = fake_resource.get.call_args_list
+    assert first.kwargs["_continue"] is None
+    assert second.kwargs["_continue"] == "page-2"
+    # spec/status paths need the full objects.
+    assert "header_params" not in first.kwargs
+    assert result["scanned"] == 3
+    assert result["matched"] == 3
+    assert result["group_count"] == 2
+    assert result["groups"][0] == {
+        "key": {"status.phase": "Running", "spec.nodeName": "n1"},
+        "count": 2,
+        "stats": {
+            "status.containerStatuses[*].restartCount": {"sum": 3, "min": 0, "max": 3, "avg": 1.5}
+        },
+    }
+    assert result["groups"][1] == {
+        "key": {"status.phase": "Pending", "spec.nodeName": None},
+        "count": 1,
+        "stats": {"status.containerStatuses[*].restartCount": None},
+    }
+
+
+def test_summarize_resource_where_filters_before_grouping():
+    """where clauses match any wildcard value and compare numbers numerically."""
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_resource.get.return_value = _summary_page(
+        [
+            _summary_pod("a", "Running", "n1", [7, 0], waiting="CrashLoopBackOff"),
+            _summary_pod("b", "Running", "n2", [0]),
+            _summary_pod("c", "Running", "n2", [4], waiting="ImagePullBackOff"),
+        ]
+    )
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        crashing = summarize_resource(
+            kind="Pod",
+            group_by=["spec.nodeName"],
+            where=["status.containerStatuses[*].state.waiting.reason==CrashLoopBackOff"],
+        )
+        restarted = summarize_resource(
+            kind="Pod", where=["status.containerStatuses[*].restartCount>=4"]
+        )
+        invalid = summarize_resource(kind="Pod", where=["status.phase>Running"])
+
+    assert crashing["matched"] == 1
+    assert crashing["groups"] == [{"key": {"spec.nodeName": "n1"}, "count": 1}]
+    assert restarted["matched"] == 2
+    assert restarted["groups"] == [{"key": {}, "count": 2}]
+    assert "non-number" in invalid["error"]
+
+
+def test_summarize_resource_metadata_paths_fetch_metadata_only():
+    """Grouping by metadata alone asks for PartialObjectMetadata pages."""
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_resource.get.return_value = _summary_page(
+        [
+            {"kind": "PartialObjectMetadata", "metadata": {"name": "x", "namespace": "a"}},
+            {"kind": "PartialObjectMetadata", "metadata": {"name": "y"}},
+        ]
+    )
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = summarize_resource(kind="ConfigMap", group_by=["metadata.namespace"])
+
+    accept = fake_resource.get.call_args.kwargs["header_params"]["Accept"]
+    assert "as=PartialObjectMetadataList" in accept
+    assert [g["key"]["metadata.namespace"] for g in result["groups"]] == ["a", None]
+
+
+def test_summarize_resource_refuses_secret_values():
+    """Secret data and annotations cannot be grouped, aggregated or filtered on."""
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_resource.get.return_value = _summary_page(
+        [{"kind": "Secret", "metadata": {"name": "s"}, "type": "Opaque"}]
+    )
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        by_data = summarize_resource(kind="Secret", group_by=["data.password"])
+        by_annotation = summarize_resource(kind="Secret", where=["metadata.annotations.owner==me"])
+        by_metadata = summarize_resource(kind="Secret", group_by=["metadata"])
+        where_metadata = summarize_resource(kind="Secret", where=["metadata"])
+        by_wildcard = summarize_resource(kind="Secret", stats=["*.annotations"])
+        by_type = summarize_resource(kind="Secret", group_by=["type"])
+        by_name = summarize_resource(kind="Secret", group_by=["metadata.name"])
+
+    assert "cannot be summarized" in by_data["error"]
+    assert "cannot be summarized" in by_annotation["error"]
+    assert "cannot be summarized" in by_metadata["error"]
+    assert "cannot be summarized" in where_metadata["error"]
+    assert "cannot be summarized" in by_wildcard["error"]
+    assert "error" not in by_name
+    assert fake_resource.get.call_count == 2
+    assert "error" not in by_type
+
+
+def _owned(kind, name, owner_kind, owner_name, namespace="default"):
+    """A raw object with a controller ownerReference."""
+    return {
+        "kind": kind,
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "ownerReferences": [{"kind": owner_kind, "name": owner_name, "controller": True}],
+        },
+        "spec": {"containers": [{"name": "app"}]},
+        "status": {"phase": "Running"},
+    }
+
+
+def test_owner_graph_resolves_and_updates_incrementally():
+    """Deployment -> ReplicaSet -> Pod resolves by ownerReferences and tracks watch events."""
+    graph = _OwnerGraph()
+    graph.replace("ReplicaSet", [_owned("ReplicaSet", "web-abc", "Deployment", "web")])
+    graph.replace(
+        "Pod",
+        [
+            _owned("Pod", "web-abc-1", "ReplicaSet", "web-abc"),
+            _owned("Pod", "web-abc-2", "ReplicaSet", "web-abc"),
+            # Same name, other namespace: a different owner.
+            _owned("Pod", "web-abc-3", "ReplicaSet", "web-abc", namespace="other"),
+        ],
+    )
+
+    def names(recursive=True):
+        return [
+            obj["metadata"]["name"]
+            for _, obj in graph.owned("default", "Deployment", "web", recursive)
+        ]
+
+    assert names() == ["web-abc", "web-abc-1", "web-abc-2"]
+    assert names(recursive=False) == ["web-abc"]
+
+    graph.apply("Pod", "DELETED", _owned("Pod", "web-abc-1", "ReplicaSet", "web-abc"))
+    graph.apply("Pod", "ADDED", _owned("Pod", "web-abc-4", "ReplicaSet", "web-abc"))
+    # An orphaned pod is unlinked from its former owner.
+    orphan = _owned("Pod", "web-abc-2", "ReplicaSet", "web-abc")
+    orphan["metadata"]["ownerReferences"] = []
+    graph.apply("Pod", "MODIFIED", orphan)
+
+    assert names() == ["web-abc", "web-abc-4"]
+
+
+def test_get_logs_resolves_workload_pods_by_owner_references():
+    """A pod sharing the deployment's labels but owned by something else is not read."""
+    fake_manager = MagicMock()
+    fake_manager.get_owner_graph.return_value = None
+    fake_manager.get_apps_api().list_namespaced_replica_set.return_value = _raw_response(
+        {"items": [_owned("ReplicaSet", "web-abc", "Deployment", "web")]}
+    )
+    core = fake_manager.get_core_api()
+    core.list_namespaced_pod.return_value = _raw_response(
+        {
+            "items": [
+                _owned("Pod", "web-abc-1", "ReplicaSet", "web-abc"),
+                _owned("Pod", "canary-1", "ReplicaSet", "canary-xyz"),
+            ]
+        }
+    )
+    core.read_namespaced_pod_log.return_value = _log_response("hello")
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = get_logs(resource_type="deployment", namespace="default", name="web")
+
+    assert [r["pod_name"] for r in result["results"]] == ["web-abc-1"]
+    assert result["results"][0]["logs"] == ["hello"]
+    # No label selector is derived from the deployment.
+    assert "label_selector" not in core.list_namespaced_pod.call_args.kwargs
+
+
+def test_get_owned_resources_uses_live_graph_and_reports_missing_owner():
+    """With the watch cache the graph answers without LISTs; an unknown owner is an error."""
+    graph = _OwnerGraph()
+    graph.replace("Job", [_owned("Job", "backup-1", "CronJob", "backup")])
+    graph.replace("Pod", [_owned("Pod", "backup-1-x", "Job", "backup-1")])
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_manager.get_owner_graph.return_value = graph
+    not_found = Exception("not found")
+    not_found.status = 404
+    fake_resource.get.side_effect = not_found
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        result = get_owned_resources(kind="cronjob", name="backup")
+        missing = get_owned_resources(kind="Deployment", name="nope")
+        unsupported = get_owned_resources(kind="Service", name="web")
+
+    assert [(o["kind"], o["name"]) for o in result["owned"]] == [
+        ("Job", "backup-1"),
+        ("Pod", "backup-1-x"),
+    ]
+    assert result["owned"][1]["status"] == "Running"
+    fake_manager.get_core_api().list_namespaced_pod.assert_not_called()
+    assert missing["error"] == "Deployment nope not found in namespace default"
+    assert unsupported["error"].startswith("Unsupported kind")
+
+
+def test_reflector_feeds_subscribed_owner_graph():
+    """A subscriber gets the synced store right away and then every watch event."""
+    list_func = MagicMock()
+    list_func.return_value = _raw_response(
+        {
+            "items": [_owned("Pod", "web-abc-1", "ReplicaSet", "web-abc")],
+            "metadata": {"resourceVersion": "100"},
+        }
+    )
+    reflector = _Reflector(list_func)
+    with patch.object(_Reflector, "_start"):
+        reflector.list()
+    graph = _OwnerGraph()
+    reflector.subscribe(
+        lambda objects: graph.replace("Pod", objects),
+        lambda event_type, obj: graph.apply("Pod", event_type, obj),
+    )
+
+    reflector._apply(
+        {"type": "ADDED", "object": _owned("Pod", "web-abc-2", "ReplicaSet", "web-abc")}
+    )
+
+    owned = graph.owned("default", "ReplicaSet", "web-abc")
+    assert [obj["metadata"]["name"] for _, obj in owned] == ["web-abc-1", "web-abc-2"]
+
+
+def test_batch_read_runs_concurrently_and_keeps_order():
+    """Calls overlap, results follow request order and errors stay per item."""
+    release = threading.Barrier(2, timeout=5)
+
+    def slow(name, context=None):
+        release.wait()
+        return {"name": name, "context": context}
+
+    def broken():
+        raise RuntimeError("boom")
+
+    tools = {"slow": slow, "broken": broken}
+    with patch.dict(_BATCH_TOOLS, tools):
+        result = batch_read(
+            [
+                {"tool": "slow", "arguments": {"name": "a"}},
+                {"tool": "slow", "arguments": {"name": "b", "context": "staging"}},
+                {"tool": "broken"},
+                {"tool": "nope"},
+                {"tool": "slow", "arguments": {"bad": 1}},
+            ],
+            context="prod",
+        )
+
+    results = result["results"]
+    # Both "slow" calls had to be running at once to pass the barrier.
+    assert results[0] == {"tool": "slow", "result": {"name": "a", "context": "prod"}}
+    assert results[1] == {"tool": "slow", "result": {"name": "b", "context": "staging"}}
+    assert results[2] == {"tool": "broken", "error": "boom"}
+    assert results[3] == {"tool": "nope", "error": "Unknown tool: 'nope'"}
+    assert results[4]["error"].startswith("Invalid arguments:")
+
+
+def test_batch_read_reports_malformed_items_per_item():
+    """Items that are not well-formed calls get an error; the valid ones still run."""
+    with patch.dict(_BATCH_TOOLS, {"echo": lambda value: value}):
+        result = batch_read(
+            [
+                {"tool": "echo", "arguments": "value=1"},
+                {"tool": "echo", "arguments": ["value"]},
+                {"tool": ["echo"]},
+                "echo",
+                {"tool": "echo", "arguments": {"value": 1}},
+            ]
+        )
+
+    results = result["results"]
+    assert results[0]["error"] == "Invalid arguments: expected an object, got str"
+    assert results[1]["error"] == "Invalid arguments: expected an object, got list"
+    assert results[2]["error"].startswith("Unknown tool:")
+    assert results[3] == {"tool": None, "error": "Unknown tool: None"}
+    assert results[4] == {"tool": "echo", "result": 1}
+
+
+def test_batch_read_reports_calls_past_the_deadline():
+    """A call still running at the deadline is an error; the others keep results."""
+    stuck = threading.Event()
+
+    def fast():
+        return "ok"
+
+    def hang():
+        stuck.wait(5)
+
+    try:
+        with patch.dict(_BATCH_TOOLS, {"fast": fast, "hang": hang}):
+            result = batch_read([{"tool": "hang"}, {"tool": "fast"}], deadline=0.2)
+    finally:
+        stuck.set()
+
+    assert result["results"][0]["tool"] == "hang"
+    assert "Timed out" in result["results"][0]["error"]
+    assert result["results"][1] == {"tool": "fast", "result": "ok"}
+
+
+def test_coalesced_calls_share_one_execution():
+    """Identical overlapping calls run once; different arguments run separately."""
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def list_things(namespace=None, limit=None):
+        calls.append((namespace, limit))
+        started.set()
+        release.wait(5)
+        return [namespace, limit]
+
+    tool = _coalesced(list_things)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(tool)
+        assert started.wait(5)
+        followers = [executor.submit(tool, namespace=None), executor.submit(tool, None, None)]
+        other = executor.submit(tool, "kube-system")
+        while len(calls) < 2 or _coalesced_calls["list_things"] < 2:
+            time.sleep(0.01)
+        release.set()
+        results = [f.result(5) for f in [leader, *followers, other]]
+
+    assert set(calls) == {(None, None), ("kube-system", None)}
+    assert results[:3] == [[None, None]] * 3
+    assert results[1] is results[0]
+    assert results[3] == ["kube-system", None]
+    # Once the call has finished the next one runs again.
+    assert tool() == [None, None]
+    assert len(calls) == 3
+
+
+def test_response_cache_serves_hits_and_revalidates_by_resource_version():
+    """Hits cost no request; expired entries are re-read NotOlderThan their version."""
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_manager.response_cache = _ResponseCache(1 << 20)
+    config_map = {
+        "kind": "ConfigMap",
+        "apiVersion": "v1",
+        "metadata": {"name": "app", "resourceVersion": "7", "managedFields": [{"x": 1}]},
+        "data": {"mode": "fast"},
+    }
+    fake_resource.get.side_effect = lambda **kwargs: _raw_response(config_map)
+
+    with (
+        patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager),
+        patch("kubernetes_readonly_mcp.server.RESPONSE_CACHE_ENABLED", True),
+    ):
+        first = get_resource(kind="ConfigMap", name="app", namespace="default")
+        first["data"]["mode"] = "changed by the caller"
+        second = get_resource(kind="ConfigMap", name="app", fields=["data.mode"])
+        hit = get_resource(kind="ConfigMap", name="app", namespace="default")
+        with patch("kubernetes_readonly_mcp.server.time.monotonic", return_value=1e12):
+            revalidated = get_resource(kind="ConfigMap", name="app", namespace="default")
+        fresh = get_resource(kind="ConfigMap", name="app", namespace="default", fresh=True)
+
+    # The second call names no namespace, so it is an entry of its own; the hit
+    # makes no request, the expired entry is re-read from its resourceVersion
+    # and fresh=True reads the latest state.
+    calls = [
+        (c.kwargs["namespace"], c.kwargs["resource_version"])
+        for c in fake_resource.get.call_args_list
+    ]
+    assert calls == [("default", None), (None, None), ("default", "7"), ("default", None)]
+    assert "managedFields" not in first["metadata"]
+    assert second == {"data": {"mode": "fast"}}
+    # Each hit is a copy, untouched by what earlier callers did to theirs.
+    assert hit == revalidated == fresh
+    assert hit["data"] == {"mode": "fast"}
+    stats = fake_manager.response_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["revalidated"] == 1
+
+
+def test_response_cache_evicts_least_recently_used_beyond_byte_cap():
+    """The cache stays under its byte cap by dropping the least recently used entry."""
+    size = len(_dumps({"name": "a", "pad": "x" * 60}))
+    cache = _ResponseCache(max_bytes=3 * size)
+    for name in ("a", "b", "c"):
+        cache.put(name, {"name": name, "pad": "x" * 60}, "1", ttl=60)
+    cache.get("a")
+    cache.put("d", {"name": "d", "pad": "x" * 60}, "1", ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a")[0]["name"] == "a"
+    assert cache.stats()["bytes"] == 3 * size
+    assert cache.stats()["evictions"] == 1
+
+
+def test_response_cache_counts_encoded_bytes():
+    """Non-ASCII values count toward the cap by their UTF-8 size, not characters."""
+    value = {"name": "\u00fc" * 40}
+    cache = _ResponseCache(max_bytes=1 << 20)
+    cache.put("a", value, "1", ttl=60)
+
+    encoded = _dumps(value)
+    encoded = encoded.encode() if isinstance(encoded, str) else encoded
+    assert cache.stats()["bytes"] == len(encoded)
+    assert cache.get("a")[0] == value
+
+
+def _event(name, version, namespace="default", reason="BackOff"):
+    return {
+        "metadata": {"name": name, "namespace": namespace, "resourceVersion": str(version)},
+        "involvedObject": {"kind": "Pod", "name": name.split(".")[0], "namespace": namespace},
+        "type": "Warning",
+        "reason": reason,
+    }
+
+
+def _event_feed(events, resource_version, size=100):
+    list_func = MagicMock()
+    list_func.return_value = _raw_response(
+        {"items": events, "metadata": {"resourceVersion": str(resource_version)}}
+    )
+    reflector = _Reflector(list_func)
+    with patch.object(_Reflector, "_start"):
+        return reflector, _EventFeed(reflector, size=size)
+
+
+def test_event_feed_returns_changes_after_cursor_until_it_expires():
+    """Changes come from the ring buffer; a cursor older than the buffer has expired."""
+    reflector, feed = _event_feed([_event("a.1", 90)], 100, size=3)
+    for version in (101, 102, 103):
+        reflector._apply({"type": "ADDED", "object": _event(f"b.{version}", version)})
+
+    assert feed.cursor() == 103
+    assert [c[0] for c in feed.changes(100)] == [101, 102, 103]
+    assert [c[0] for c in feed.changes(102)] == [103]
+    assert feed.changes(103) == []
+
+    reflector._apply({"type": "MODIFIED", "object": _event("b.101", 104)})
+    # 101 fell out of the buffer: only cursors from 101 on can be answered.
+    assert feed.changes(100) is None
+    assert [c[:2] for c in feed.changes(101)] == [(102, "ADDED"), (103, "ADDED"), (104, "MODIFIED")]
+
+    # A relist leaves a gap of unknown changes, so every older cursor expires.
+    reflector._list_func.return_value = _raw_response(
+        {"items": [], "metadata": {"resourceVersion": "200"}}
+    )
+    reflector._relist()
+    assert feed.changes(104) is None
+    assert feed.changes(200) == []
+
+
+def test_watch_events_since_resets_then_returns_deltas():
+    """No cursor (or an expired one) lists everything; a cursor returns only changes."""
+    reflector, feed = _event_feed([_event("a.1", 90), _event("k.1", 95, "kube-system")], 100)
+    fake_manager = MagicMock()
+    fake_manager.get_event_feed.return_value = feed
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        first = watch_events_since(namespace="default")
+        reflector._apply({"type": "ADDED", "object": _event("b.1", 101)})
+        reflector._apply({"type": "ADDED", "object": _event("k.2", 102, "kube-system")})
+        reflector._apply({"type": "MODIFIED", "object": _event("a.1", 103)})
+        delta = watch_events_since(cursor=first["cursor"], namespace="default")
+        paged = watch_events_since(cursor=first["cursor"], limit=1)
+        caught_up = watch_events_since(cursor=delta["cursor"])
+        expired = watch_events_since(cursor="50", namespace="default")
+        invalid = watch_events_since(cursor="abc")
+
+    assert first["reset"] is True
+    assert first["cursor"] == "100"
+    assert [e["involved_object"]["name"] for e in first["events"]] == ["a"]
+    assert delta["reset"] is False
+    assert [(e["involved_object"]["name"], e["change"]) for e in delta["events"]] == [
+        ("b", "ADDED"),
+        ("a", "MODIFIED"),
+    ]
+    assert delta["cursor"] == "103"
+    assert paged["more"] is True
+    assert paged["cursor"] == "101"
+    assert caught_up["events"] == []
+    assert expired["reset"] is True
+    assert "Invalid cursor" in invalid["error"]
+
+
+def _pod_metrics(name, cpu, memory, timestamp, app="web", namespace="default"):
+    return {
+        "metadata": {"name": name, "namespace": namespace, "labels": {"app": app}},
+        "timestamp": timestamp,
+        "containers": [
+            {"name": "app", "usage": {"cpu": cpu, "memory": memory}},
+            {"name": "sidecar", "usage": {"cpu": "10m", "memory": "1Mi"}},
+        ],
+    }
+
+
+def test_usage_ring_wraps_and_summarizes():
+    """The ring keeps the newest samples, skips repeated scrapes and reports p95."""
+    ring = _UsageRing(size=20)
+    for second in range(30):
+        ring.append(float(second), cpu=second / 1000, memory=1000.0 + 10 * second)
+    assert not ring.append(29.0, cpu=9.0, memory=0.0)
+
+    times, cpu, memory = ring.samples()
+    stats = ring.stats()
+
+    assert times == [float(second) for second in range(10, 30)]
+    assert stats["samples"] == 20
+    assert stats["window_seconds"] == 19.0
+    assert stats["cpu_millicores"] == {"avg": 19.5, "p95": 28.0, "max": 29.0}
+    assert stats["memory_bytes"]["max"] == 1290.0
+    assert stats["memory_growth_bytes_per_second"] == 10.0
+
+
+def test_top_pods_ranks_from_sampler_history():
+    """With the sampler on, top_pods ranks by history without a new scrape."""
+    scrapes = [
+        [
+            _pod_metrics("web-1", "100m", "100Mi", "2024-05-01T12:00:00Z"),
+            _pod_metrics("web-2", "300m", "50Mi", "2024-05-01T12:00:00Z"),
+            _pod_metrics("db-1", "900m", "1Gi", "2024-05-01T12:00:00Z", app="db"),
+        ],
+        [
+            _pod_metrics("web-1", "120m", "160Mi", "2024-05-01T12:00:15Z"),
+            _pod_metrics("web-2", "250m", "51Mi", "2024-05-01T12:00:15Z"),
+            _pod_metrics("db-1", "800m", "1Gi", "2024-05-01T12:00:15Z", app="db"),
+        ],
+    ]
+    scrape = MagicMock(side_effect=[(pods, []) for pods in scrapes])
+    sampler = _UsageSampler(scrape, interval=15, size=10)
+    fake_manager = MagicMock()
+    fake_manager.get_usage_sampler.return_value = sampler
+
+    with (
+        patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager),
+        patch.object(_UsageSampler, "_run"),
+    ):
+        sampler.latest()
+        sampler._sample()
+        by_cpu = top_pods(label_selector="app=web")
+        by_growth = top_pods(sort_by="memory_growth", limit=1)
+
+    assert scrape.call_count == 2
+    assert by_cpu["source"] == "sampler"
+    assert by_cpu["total_count"] == 2
+    assert [(p["name"], p["cpu_millicores"]) for p in by_cpu["pods"]] == [
+        ("web-2", 260.0),
+        ("web-1", 130.0),
+    ]
+    assert by_cpu["pods"][1]["containers"][0] == {
+        "name": "app",
+        "cpu_millicores": 120.0,
+        "memory_bytes": 160 * 2**20,
+    }
+    assert by_cpu["pods"][1]["history"]["cpu_millicores"]["max"] == 130.0
+    assert [p["name"] for p in by_growth["pods"]] == ["web-1"]
+    assert by_growth["pods"][0]["history"]["memory_growth_bytes_per_second"] == 4 * 2**20
+
+
+def test_top_tools_scrape_metrics_api_without_sampler():
+    """Without the sampler each call lists metrics.k8s.io; nodes get % of allocatable."""
+    fake_manager, fake_resource = _fake_manager_with_dynamic()
+    fake_manager.get_usage_sampler.return_value = None
+    fake_resource.get.side_effect = lambda **kwargs: _raw_response(
+        {
+            "items": [
+                {
+                    "metadata": {"name": "n1"},
+                    "timestamp": "2024-05-01T12:00:00Z",
+                    "usage": {"cpu": "1500m", "memory": "2Gi"},
+                },
+                {
+                    "metadata": {"name": "n2"},
+                    "timestamp": "2024-05-01T12:00:00Z",
+                    "usage": {"cpu": "250000000n", "memory": "6Gi"},
+                },
+            ]
+        }
+    )
+    fake_manager.get_core_api().list_node.return_value = _raw_response(
+        {
+            "items": [
+                {
+                    "metadata": {"name": "n1"},
+                    "status": {"allocatable": {"cpu": "2", "memory": "8Gi"}},
+                },
+                {
+                    "metadata": {"name": "n2"},
+                    "status": {"allocatable": {"cpu": "4", "memory": "8Gi"}},
+                },
+            ]
+        }
+    )
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        nodes = top_nodes(sort_by="memory")
+        needs_history = top_nodes(sort_by="cpu_p95")
+
+    assert nodes["source"] == "metrics.k8s.io"
+    assert [(n["name"], n["memory_percent"], n["cpu_percent"]) for n in nodes["nodes"]] == [
+        ("n2", 75.0, 6.2),
+        ("n1", 25.0, 75.0),
+    ]
+    assert "history" not in nodes["nodes"][0]
+    assert "USAGE_SAMPLER" in needs_history["error"]
+
+
+class _FollowStream:
+    """A follow=True log response: yields its chunks, then blocks until closed."""
+
+    def __init__(self, *chunks):
+        self.chunks = chunks
+        self.closed = threading.Event()
+
+    def stream(self, amt):
+        yield from self.chunks
+        self.closed.wait(5)
+
+    def close(self):
+        self.closed.set()
+
+    def release_conn(self):
+        pass
+
+
+def _wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_log_tail_keeps_newest_lines_within_byte_cap():
+    """Lines are appended as they stream in; the oldest go once the cap is passed."""
+    fake_manager = MagicMock()
+    read_log = fake_manager.get_core_api().read_namespaced_pod_log
+    read_log.return_value = _FollowStream(b"one\ntwo\nthr", b"ee\nfour\n")
+
+    tail = _LogTail(fake_manager, "default", "web-1", "app", ["app"], "Running", 14, 100)
+    try:
+        _wait_for(lambda: tail.describe()["ready"])
+        assert tail.describe()["buffered_lines"] == 2
+        assert tail.describe()["buffered_bytes"] == 11
+        assert tail.lines(2) == [b"three\n", b"four\n"]
+        # Lines were dropped, so neither more lines nor the whole log can be served.
+        assert tail.lines(3) is None
+        assert tail.lines() is None
+    finally:
+        tail.stop()
+
+    assert read_log.call_args.kwargs["follow"] is True
+    assert read_log.call_args.kwargs["tail_lines"] == 100
+
+
+def test_log_tail_is_not_served_while_its_backlog_arrives():
+    """A partly received initial read is not mistaken for the whole log."""
+    fake_manager = MagicMock()
+    stream = _FollowStream(b"one\ntwo\n")
+    fake_manager.get_core_api().read_namespaced_pod_log.return_value = stream
+
+    with patch("kubernetes_readonly_mcp.server._FOLLOW_SETTLE_SECONDS", 60):
+        tail = _LogTail(fake_manager, "default", "web-1", "app", ["app"], "Running", 1000, 100)
+        try:
+            _wait_for(lambda: tail.describe()["buffered_lines"] == 2)
+            assert tail.lines() is None
+            assert tail.lines(1) is None
+            assert tail.describe()["ready"] is False
+        finally:
+            tail.stop()
+
+    # A full initial read needs no settling.
+    stream = _FollowStream(b"one\ntwo\n")
+    fake_manager.get_core_api().read_namespaced_pod_log.return_value = stream
+    with patch("kubernetes_readonly_mcp.server._FOLLOW_SETTLE_SECONDS", 60):
+        tail = _LogTail(fake_manager, "default", "web-1", "app", ["app"], "Running", 1000, 2)
+        try:
+            _wait_for(lambda: tail.lines(1) is not None)
+            assert tail.lines(1) == [b"two\n"]
+        finally:
+            tail.stop()
+
+
+def test_followed_logs_are_served_from_the_buffer():
+    """After follow_logs, get_pod_logs and get_logs make no log requests."""
+    fake_manager = MagicMock()
+    core = fake_manager.get_core_api()
+    pod = _raw_pod("web-1")
+    pod["spec"]["containers"] = [{"name": "app"}]
+    pod["status"]["phase"] = "Running"
+    core.read_namespaced_pod.side_effect = lambda **kwargs: _raw_response(pod)
+    core.read_namespaced_pod_log.return_value = _FollowStream(b"a\nERROR b\nc\n")
+
+    with patch("kubernetes_readonly_mcp.server._get_manager", return_value=fake_manager):
+        try:
+            followed = follow_logs(namespace="default", pod_name="web-1")
+            _wait_for(lambda: _log_tails[(None, "default", "web-1", "app")].lines() is not None)
+            logs = get_pod_logs(namespace="default", pod_name="web-1", tail_lines=2)
+            grep = get_logs(resource_type="pod", name="web-1", namespace="default", pattern="ERR")
+            stopped = follow_logs(namespace="default", pod_name="web-1", stop=True)
+        finally:
+            for tail in _log_tails.values():
+                tail.stop()
+            _log_tails.clear()
+
+    assert followed["following"][0]["container"] == "app"
+    assert logs["followed"] is True
+    assert logs["logs"] == ["ERROR b", "c", ""]
+    assert logs["status"] == "Running"
+    assert grep["results"][0]["logs"] == ["ERROR b"]
+    assert grep["results"][0]["matches"] == 1
+    assert core.read_namespaced_pod_log.call_count == 1
+    assert stopped["following"] == []
+
+
+# Time budget for a fresh interpreter to import the server and answer tools/list.
+# Locally this takes ~1.2s, nearly all of it fastmcp; the budget leaves headroom
+# for slow CI machines but catches an eager import of a heavy dependency.
+COLD_START_BUDGET_SECONDS = float(os.environ.get("COLD_START_BUDGET_SECONDS", "3"))
+
+_COLD_START_SCRIPT = """
+import asyncio, json, sys, time
+start = time.perf_counter()
+from kubernetes_readonly_mcp.server import mcp
+tools = asyncio.run(mcp.list_tools())
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "tools": len(tools),
+    "kubernetes": sorted(m for m in sys.modules if m.split(".")[0] == "kubernetes"),
+}))
+"""
+
+
+def test_cold_start_lists_tools_without_loading_kubernetes():
+    """tools/list is answered within budget, before the kubernetes package is imported."""
+    out = subprocess.run(
+        [sys.executable, "-c", _COLD_START_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    result = json.loads(out.stdout.splitlines()[-1])
+
+    assert result["tools"] > 0
+    assert result["kubernetes"] == []
+    assert result["seconds"] < COLD_START_BUDGET_SECONDS
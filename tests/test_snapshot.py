@@ -0,0 +1,201 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from kubernetes_readonly_mcp import server
+from kubernetes_readonly_mcp.snapshot import (
+    Snapshot,
+    SnapshotRestClient,
+    SnapshotWriter,
+    label_selector_matcher,
+)
+
+_DISCOVERY = {
+    "/version": {"major": "1", "minor": "30", "gitVersion": "v1.30.0"},
+    "/api": {"kind": "APIVersions", "versions": ["v1"]},
+    "/apis": {"kind": "APIGroupList", "apiVersion": "v1", "groups": []},
+    "/api/v1": {
+        "kind": "APIResourceList",
+        "groupVersion": "v1",
+        "resources": [
+            {"name": "pods", "namespaced": True, "kind": "Pod", "verbs": ["get", "list"]},
+            {"name": "pods/log", "namespaced": True, "kind": "Pod", "verbs": ["get"]},
+            {"name": "secrets", "namespaced": True, "kind": "Secret", "verbs": ["get", "list"]},
+            {"name": "namespaces", "namespaced": False, "kind": "Namespace", "verbs": ["list"]},
+        ],
+    },
+}
+
+
+def _pod(name, namespace="default", app="web"):
+    return {
+        "kind": "Pod",
+        "apiVersion": "v1",
+        "metadata": {"name": name, "namespace": namespace, "labels": {"app": app}},
+        "spec": {"nodeName": "node-1", "containers": [{"name": "app"}]},
+        "status": {
+            "phase": "Running",
+            "podIP": "10.0.0.1",
+            "containerStatuses": [
+                {
+                    "name": "app",
+                    "image": "web:1",
+                    "imageID": "sha256:1",
+                    "ready": True,
+                    "restartCount": 1,
+                    "state": {"running": {}},
+                },
+            ],
+        },
+    }
+
+
+def _write_snapshot(path, pods):
+    writer = SnapshotWriter(str(path), context="prod")
+    for document_path, body in _DISCOVERY.items():
+        writer.add_document(document_path, json.dumps(body).encode())
+    objects = writer.add_resource("/api/v1/pods", "Pod", "v1", True, "PodList")
+    for pod in pods:
+        writer.add_object(objects, pod)
+        writer.add_log(pod["metadata"]["namespace"], pod["metadata"]["name"], "app", b"a\nb\nc\n")
+        writer.add_log(pod["metadata"]["namespace"], pod["metadata"]["name"], "app", b"old\n", True)
+    secrets = writer.add_resource("/api/v1/secrets", "Secret", "v1", True, "SecretList")
+    writer.add_object(
+        secrets,
+        {
+            "kind": "Secret",
+            "apiVersion": "v1",
+            "metadata": {"name": "creds", "namespace": "default"},
+            "type": "Opaque",
+            "data": {"password": "c2VjcmV0"},
+        },
+    )
+    namespaces = writer.add_resource("/api/v1/namespaces", "Namespace", "v1", False, "List")
+    for name in ("default", "kube-system"):
+        writer.add_object(
+            namespaces, {"kind": "Namespace", "apiVersion": "v1", "metadata": {"name": name}}
+        )
+    writer.close()
+    return str(path)
+
+
+@pytest.fixture
+def serve_snapshot(tmp_path):
+    """Point the server at a snapshot directory, with a fresh manager pool."""
+
+    def serve(path):
+        return patch.object(server, "SNAPSHOT_DIR", path)
+
+    with (
+        patch.dict(server._managers, clear=True),
+        patch.object(server, "DISCOVERY_CACHE_DIR", str(tmp_path / "cache")),
+    ):
+        yield serve
+        for manager, _ in list(server._managers.values()):
+            manager.close()
+
+
+def test_tools_answer_from_snapshot(tmp_path, serve_snapshot):
+    """Typed, dynamic and log tools are all served from the snapshot files."""
+    path = _write_snapshot(
+        tmp_path / "snap", [_pod("web-1"), _pod("web-2"), _pod("db-1", app="db")]
+    )
+
+    with serve_snapshot(path):
+        pods = server.list_pods(namespace="default")
+        pod = server.get_resource(kind="Pod", name="web-2", namespace="default")
+        missing = server.get_resource(kind="Pod", name="nope", namespace="default")
+        logs = server.get_pod_logs(namespace="default", pod_name="web-1", tail_lines=2)
+        previous = server.get_pod_logs(namespace="default", pod_name="web-1", previous=True)
+        selected = server.list_resource(kind="Pod", label_selector="app in (db)")
+        page = server.list_resource(kind="Pod", limit=2)
+        contexts = server.list_contexts()
+
+    assert [p["name"] for p in pods] == ["db-1", "web-1", "web-2"]
+    assert pod["metadata"]["name"] == "web-2"
+    assert "not found in snapshot" in missing["error"]
+    assert logs["logs"] == ["b", "c", ""]
+    assert previous["logs"] == ["old", ""]
+    assert [p["metadata"]["name"] for p in selected] == ["db-1"]
+    assert len(page["items"]) == 2
+    assert page["continue_token"] == "2"
+    assert page["remaining_item_count"] == 1
+    assert contexts[0]["name"] == "prod"
+    assert contexts[0]["snapshot"] == path
+
+
+def test_snapshot_rejects_other_contexts(tmp_path, serve_snapshot):
+    """A snapshot holds one cluster; asking for another context is an error."""
+    path = _write_snapshot(tmp_path / "snap", [_pod("web-1")])
+
+    with serve_snapshot(path):
+        result = server.list_pods(context="staging")
+
+    assert "captured from context 'prod'" in result["error"]
+
+
+def test_capture_round_trips_and_sanitizes(tmp_path, serve_snapshot):
+    """capture_snapshot copies every listable kind and log, minus Secret values."""
+    source = _write_snapshot(tmp_path / "source", [_pod("web-1"), _pod("web-2")])
+    with serve_snapshot(source):
+        before = server.list_pods()
+        summary = server.capture_snapshot(str(tmp_path / "copy"), log_tail_lines=10)
+
+    server._managers.pop(None)[0].close()
+    with serve_snapshot(str(tmp_path / "copy")):
+        after = server.list_pods()
+        logs = server.get_pod_logs(namespace="default", pod_name="web-2", container="app")
+        kinds = server.list_api_resources()
+
+    assert summary["kinds"] == 3
+    assert summary["objects"] == 5
+    # Current and previous log of each pod's one container.
+    assert summary["logs"] == 4
+    assert summary["errors"] == {}
+    assert after == before
+    assert logs["logs"] == ["a", "b", "c", ""]
+    assert {k["kind"] for k in kinds} == {"Pod", "Secret", "Namespace"}
+    # Secret values are stripped before they are written.
+    copied = Snapshot(str(tmp_path / "copy"))
+    secret = copied.read(copied.resource("/api/v1/secrets").find("default", "creds"))
+    copied.close()
+    assert json.loads(secret)["type"] == "Opaque"
+    assert "data" not in json.loads(secret)
+
+
+def test_rest_client_lists_partial_metadata_and_refuses_writes(tmp_path):
+    """PartialObjectMetadata requests get metadata only; non-GETs and watches get 405."""
+    snap = Snapshot(_write_snapshot(tmp_path / "snap", [_pod("web-1")]))
+    rest = SnapshotRestClient(snap)
+    accept = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+
+    listed = rest.request("GET", "https://x/api/v1/pods", headers={"Accept": accept})
+    deleted = rest.request("DELETE", "https://x/api/v1/namespaces/default/pods/web-1")
+    watched = rest.request("GET", "https://x/api/v1/pods?watch=true")
+    body = json.loads(listed.response.data)
+    snap.close()
+
+    assert body["kind"] == "PartialObjectMetadataList"
+    assert body["items"] == [
+        {
+            "kind": "PartialObjectMetadata",
+            "apiVersion": "meta.k8s.io/v1",
+            "metadata": _pod("web-1")["metadata"],
+        }
+    ]
+    assert deleted.status == 405
+    assert watched.status == 405
+
+
+def test_label_selector_matcher():
+    """Equality, set-based and existence requirements, as the API server evaluates them."""
+    labels = {"app": "web", "tier": "frontend"}
+
+    assert label_selector_matcher("app=web,tier!=backend")(labels)
+    assert label_selector_matcher("app in (web, api),tier")(labels)
+    assert not label_selector_matcher("app notin (web)")(labels)
+    assert not label_selector_matcher("!tier")(labels)
+    assert label_selector_matcher("")(labels)
+    with pytest.raises(ValueError):
+        label_selector_matcher("!app=web")